@@ -2,17 +2,28 @@
 Dependențe comune pentru API
 """
 
-from typing import Generator
+from typing import AsyncGenerator, Generator
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.database import SessionLocal
+from app.database import SessionLocal, AsyncSessionLocal
 
 
 def get_db() -> Generator[Session, None, None]:
     """
     Dependency pentru obținerea sesiunii de bază de date.
+    Pentru rutele sync (`def`), care rulează în threadpool.
     """
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency pentru obținerea sesiunii async (asyncpg).
+    Pentru rutele `async def`, care rulează direct în event loop.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
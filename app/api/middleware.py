@@ -0,0 +1,150 @@
+"""
+Middleware pentru instrumentarea cererilor API
+"""
+
+import json
+import logging
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+from app.database.instrumentation import QueryStats, current_query_stats, MAX_LOGGED_STATEMENT
+from app.metrics import metrics
+
+logger = logging.getLogger("app.db")
+
+request_duration_seconds = metrics.histogram(
+    "http_request_duration_seconds",
+    "Durata cererilor HTTP, per rută",
+    ["method", "route"]
+)
+requests_total = metrics.counter(
+    "http_requests_total",
+    "Cereri HTTP, per rută și status",
+    ["method", "route", "status"]
+)
+request_db_queries = metrics.histogram(
+    "http_request_db_queries",
+    "Statement-uri SQL per cerere",
+    ["route"],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100)
+)
+request_db_seconds = metrics.histogram(
+    "http_request_db_seconds",
+    "Timpul petrecut în baza de date per cerere",
+    ["route"]
+)
+
+
+def route_label(scope: Scope) -> str:
+    """
+    Șablonul rutei (ex: /api/v1/indicators/{indicator_code}), nu calea
+    concretă, ca numărul de serii să rămână mic.
+    """
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    Durata și numărul cererilor HTTP per rută, pentru /metrics. Durata
+    include și trimiterea corpului răspunsului (ex: exporturi streaming).
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = route_label(scope)
+            request_duration_seconds.observe(time.perf_counter() - started, scope["method"], route)
+            requests_total.inc(scope["method"], route, str(status_code))
+
+
+class QueryStatsMiddleware:
+    """
+    Colectează statisticile SQL ale fiecărei cereri HTTP (prin listener-ii
+    din app/database/instrumentation.py) și le expune:
+
+    - în headerele răspunsului: `X-DB-Query-Count`, `X-DB-Time-Ms`,
+      `X-DB-Slowest-Ms` (valorile de la momentul trimiterii headerelor);
+    - într-o linie de log JSON la finalul cererii, cu totalurile complete
+      (inclusiv query-urile rulate în timpul unui răspuns streaming);
+    - ca avertisment N+1 când aceeași formă de statement se repetă de mai
+      mult de `n_plus_one_threshold` ori.
+
+    Middleware ASGI pur (nu BaseHTTPMiddleware), ca să nu bufferizeze
+    răspunsurile streaming.
+    """
+
+    def __init__(self, app: ASGIApp, n_plus_one_threshold: int = settings.n_plus_one_threshold):
+        self.app = app
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats(label=f"{scope['method']} {scope['path']}")
+        token = current_query_stats.set(stats)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_headers(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers["X-DB-Query-Count"] = str(stats.count)
+                headers["X-DB-Time-Ms"] = f"{stats.total_seconds * 1000:.2f}"
+                headers["X-DB-Slowest-Ms"] = f"{stats.slowest_seconds * 1000:.2f}"
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            current_query_stats.reset(token)
+            route = route_label(scope)
+            request_db_queries.observe(stats.count, route)
+            request_db_seconds.observe(stats.total_seconds, route)
+            self._log(scope, stats, status_code, time.perf_counter() - started)
+
+    def _log(self, scope: Scope, stats: QueryStats, status_code: int, seconds: float):
+        repeated = stats.repeated(self.n_plus_one_threshold)
+        record = {
+            "event": "request_db_stats",
+            "method": scope["method"],
+            "path": scope["path"],
+            "status": status_code,
+            "duration_ms": round(seconds * 1000, 2),
+            "query_count": stats.count,
+            "db_time_ms": round(stats.total_seconds * 1000, 2),
+            "slowest_ms": round(stats.slowest_seconds * 1000, 2),
+            "slowest_statement": (stats.slowest_statement or "")[:MAX_LOGGED_STATEMENT] or None
+        }
+        if repeated:
+            record["n_plus_one"] = [
+                {"statement": r["statement"][:MAX_LOGGED_STATEMENT], "count": r["count"]}
+                for r in repeated
+            ]
+            logger.warning(json.dumps(record, ensure_ascii=False))
+        else:
+            logger.info(json.dumps(record, ensure_ascii=False))
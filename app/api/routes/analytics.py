@@ -0,0 +1,177 @@
+"""
+Endpoint-uri pentru analize statistice
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import Literal, Optional
+from pydantic import BaseModel, Field
+
+from app.api.dependencies import get_db
+from app.config import settings
+from app.models.indicator import AggregationLevel
+from app.services.analytics import AnalyticsService
+from app.services.forecasting import ForecastingService, FORECAST_METHODS
+
+router = APIRouter(prefix="/analytics", tags=["analytics"])
+
+
+# Schemas Pydantic
+class CorrelationMatrixResponse(BaseModel):
+    method: str
+    indicators: list[str]
+    missing_indicators: list[str] = []
+    years: list[int]
+    matrix: list[list[Optional[float]]]
+    p_values: list[list[Optional[float]]]
+    n_observations: list[list[int]]
+
+
+class SeriesStatistics(BaseModel):
+    indicator_code: str
+    county_code: Optional[str] = None
+    aggregation_level: str
+    count: int
+    mean: float
+    median: float
+    std: float
+    min: float
+    max: float
+    range: float
+    cv: float
+
+
+class ForecastSeries(BaseModel):
+    county_code: Optional[str] = None
+    aggregation_level: str
+    method: str
+    confidence_level: float
+    n_observations: Optional[int] = None
+    last_observed_year: Optional[int] = None
+    aic: Optional[float] = None
+    years: list[int]
+    values: list[float]
+    lower_bound: list[Optional[float]]
+    upper_bound: list[Optional[float]]
+
+
+class ForecastResponse(BaseModel):
+    indicator: str
+    name: str
+    unit: str
+    series: list[ForecastSeries]
+
+
+class ForecastRunRequest(BaseModel):
+    indicator_codes: Optional[list[str]] = None  # None = toți indicatorii
+    methods: list[Literal["linear", "ets", "arima"]] = list(FORECAST_METHODS)
+    horizon: int = Field(default=settings.forecast_horizon, ge=1, le=20)
+    confidence: float = Field(default=settings.forecast_confidence, gt=0, lt=1)
+
+
+class ForecastRunResponse(BaseModel):
+    series: int
+    forecasts: int
+    failed: int
+    methods: list[str]
+    horizon: int
+    duration_seconds: float
+
+
+# Endpoints
+# Rutele rămân sync (`def`): calculele pandas/numpy/statsmodels sunt
+# CPU-bound și ar bloca event loop-ul; FastAPI le rulează în threadpool.
+@router.get("/correlation-matrix", response_model=CorrelationMatrixResponse)
+def get_correlation_matrix(
+    indicator_codes: str,  # comma-separated
+    start_year: int = Query(default=2010, ge=2000, le=2030),
+    end_year: int = Query(default=2024, ge=2000, le=2030),
+    aggregation_level: AggregationLevel = AggregationLevel.REGION,
+    county_code: Optional[str] = None,
+    method: Literal["pearson", "spearman"] = "pearson",
+    db: Session = Depends(get_db)
+):
+    """
+    Matricea de corelație între mai mulți indicatori, cu p-valori și
+    numărul de ani comuni pentru fiecare pereche.
+    """
+    codes = [c.strip() for c in indicator_codes.split(",") if c.strip()]
+
+    result = AnalyticsService(db).correlation_matrix(
+        codes,
+        start_year=start_year,
+        end_year=end_year,
+        aggregation_level=aggregation_level,
+        county_code=county_code,
+        method=method
+    )
+
+    if "error" in result:
+        raise HTTPException(status_code=404, detail=result["error"])
+
+    return result
+
+
+@router.get("/statistics", response_model=list[SeriesStatistics])
+def get_batch_statistics(
+    start_year: int = Query(default=2010, ge=2000, le=2030),
+    end_year: int = Query(default=2024, ge=2000, le=2030),
+    indicator_codes: Optional[str] = None,  # comma-separated
+    db: Session = Depends(get_db)
+):
+    """
+    Statistici descriptive pentru fiecare indicator × județ × nivel de
+    agregare, într-un singur răspuns.
+    """
+    return AnalyticsService(db).batch_statistics(
+        start_year=start_year,
+        end_year=end_year,
+        indicator_codes=indicator_codes.split(",") if indicator_codes else None
+    )
+
+
+@router.get("/forecasts/{indicator_code}", response_model=ForecastResponse)
+def get_forecasts(
+    indicator_code: str,
+    aggregation_level: AggregationLevel = AggregationLevel.REGION,
+    county_code: Optional[str] = None,
+    method: Optional[Literal["linear", "ets", "arima"]] = None,
+    db: Session = Depends(get_db)
+):
+    """
+    Prognozele salvate pentru un indicator, cu intervalele de predicție,
+    câte o serie per județ și metodă.
+    """
+    result = ForecastingService(db).get_forecasts(
+        indicator_code,
+        aggregation_level=aggregation_level,
+        county_code=county_code,
+        method=method
+    )
+
+    if "error" in result:
+        raise HTTPException(status_code=404, detail=result["error"])
+
+    return result
+
+
+@router.post("/forecasts/run", response_model=ForecastRunResponse)
+def run_forecasts(
+    request: ForecastRunRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Reajustează prognozele pentru toate seriile anuale (sau doar pentru
+    indicatorii dați) și înlocuiește valorile salvate.
+    """
+    result = ForecastingService(db).run(
+        indicator_codes=request.indicator_codes,
+        methods=tuple(request.methods),
+        horizon=request.horizon,
+        confidence=request.confidence
+    )
+
+    if "error" in result:
+        raise HTTPException(status_code=500, detail=result["error"])
+
+    return result
@@ -3,19 +3,19 @@ Endpoint-uri pentru indicatori statistici
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import and_, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
 
-from app.api.dependencies import get_db
-from app.models.indicator import (
-    IndicatorDefinition,
-    IndicatorValue,
-    IndicatorCategory,
-    AggregationLevel
-)
+from app.api.dependencies import get_async_db
+from app.models.indicator import IndicatorCategory, IndicatorDefinition, AggregationLevel
+from app.models.reporting import indicator_data_view, county_comparison_view
+from app.services.cache import cached
+from app.services.indicator_registry import indicator_registry
+from app.services.kpi import KPIService
 
 router = APIRouter(prefix="/indicators", tags=["indicators"])
 
@@ -63,26 +63,88 @@ class ComparisonResponse(BaseModel):
     comparisons: dict[str, float]  # {"Timiș": 100, "Arad": 80, ...}
 
 
+class IndicatorQueryRequest(BaseModel):
+    indicator_codes: list[str] = Field(min_length=1, max_length=50)
+    county_codes: Optional[list[str]] = None  # None = toate județele
+    aggregation_levels: list[AggregationLevel] = Field(default=[AggregationLevel.REGION], min_length=1)
+    start_year: int = Field(default=2010, ge=2000, le=2030)
+    end_year: int = Field(default=2024, ge=2000, le=2030)
+    # Capetele intervalului pentru valorile trimestriale (ex: 2019 T3 - 2024 T2)
+    start_quarter: int = Field(default=1, ge=1, le=4)
+    end_quarter: int = Field(default=4, ge=1, le=4)
+    # None = anuale și trimestriale, False = doar anuale, True = doar trimestriale
+    quarterly: Optional[bool] = None
+
+
+class IndicatorInfo(BaseModel):
+    name: str
+    unit: str
+
+
+class IndicatorQueryColumns(BaseModel):
+    indicator_code: list[str]
+    county_code: list[Optional[str]]
+    aggregation_level: list[str]
+    year: list[int]
+    quarter: list[Optional[int]]
+    value: list[float]
+    is_provisional: list[int]
+
+
+class IndicatorQueryResponse(BaseModel):
+    indicators: dict[str, IndicatorInfo]
+    missing_indicators: list[str] = []
+    row_count: int
+    columns: IndicatorQueryColumns
+
+
+# Ordinea coloanelor din IndicatorQueryColumns (și din SELECT)
+QUERY_COLUMNS = list(IndicatorQueryColumns.model_fields)
+
+
+def timeseries_content(indicator: IndicatorDefinition, rows) -> dict:
+    """
+    Corpul TimeSeriesResponse construit direct din rândurile view-ului.
+
+    Rândurile au deja tipurile din response_model, deci nu mai trec prin
+    modelele Pydantic (validare la construire + revalidare + serializare);
+    la serii lungi, validarea domina timpul răspunsului.
+    """
+    return {
+        "indicator_code": indicator.code,
+        "indicator_name": indicator.name,
+        "unit": indicator.unit.value,
+        "data": [
+            {
+                "year": r.year,
+                "quarter": r.quarter,
+                "value": r.value,
+                "county_code": r.county_code,
+                "aggregation_level": r.aggregation_level,
+                "is_provisional": bool(r.is_provisional)
+            }
+            for r in rows
+        ]
+    }
+
+
 # Endpoints
+# Rutele sunt `async def` pe sesiunea asyncpg: registrul de indicatori e în
+# memorie, iar query-urile sunt simple căutări pe view-urile materializate.
+# Înainte de citirea registrului se așteaptă `ensure_loaded_async()`, ca
+# reîncărcarea la expirarea TTL-ului să nu blocheze event loop-ul.
 @router.get("/", response_model=list[IndicatorResponse])
-def list_indicators(
-    category: Optional[IndicatorCategory] = None,
-    db: Session = Depends(get_db)
-):
+async def list_indicators(category: Optional[IndicatorCategory] = None):
     """
     Listează toți indicatorii disponibili.
     Opțional, filtrare pe categorie.
     """
-    query = db.query(IndicatorDefinition)
-
-    if category:
-        query = query.filter(IndicatorDefinition.category == category)
-
-    return query.all()
+    await indicator_registry.ensure_loaded_async()
+    return indicator_registry.all(category)
 
 
 @router.get("/categories")
-def list_categories():
+async def list_categories():
     """
     Listează categoriile de indicatori disponibile.
     """
@@ -92,14 +154,75 @@ def list_categories():
     ]
 
 
+@router.post("/query", response_model=IndicatorQueryResponse)
+async def query_indicators(
+    request: IndicatorQueryRequest,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Mai mulți indicatori × județe × niveluri de agregare într-o singură
+    cerere și un singur query pe `mv_indicator_data`.
+
+    Răspunsul e columnar: `columns` conține câte un vector per coloană, toți
+    de lungime `row_count` (rândul i = elementul i din fiecare vector),
+    ordonați după indicator, nivel, județ, an și trimestru. Codurile
+    necunoscute sunt raportate în `missing_indicators`.
+    """
+    await indicator_registry.ensure_loaded_async()
+    indicators = indicator_registry.get_many(request.indicator_codes)
+    missing = [code for code in request.indicator_codes if code not in indicators]
+
+    data = indicator_data_view.c
+    rows = []
+    if indicators:
+        query = select(*(data[name] for name in QUERY_COLUMNS)).where(
+            data.indicator_code.in_(list(indicators)),
+            data.aggregation_level.in_([level.value for level in request.aggregation_levels]),
+            data.year >= request.start_year,
+            data.year <= request.end_year
+        )
+
+        if request.county_codes:
+            query = query.where(data.county_code.in_(request.county_codes))
+
+        if request.quarterly is False:
+            query = query.where(data.quarter.is_(None))
+        else:
+            in_range = and_(
+                tuple_(data.year, data.quarter) >= tuple_(request.start_year, request.start_quarter),
+                tuple_(data.year, data.quarter) <= tuple_(request.end_year, request.end_quarter)
+            )
+            if request.quarterly:
+                query = query.where(in_range)
+            else:
+                query = query.where(or_(data.quarter.is_(None), in_range))
+
+        rows = (await db.execute(query.order_by(
+            data.indicator_code, data.aggregation_level, data.county_code, data.year, data.quarter
+        ))).all()
+
+    # Transpunerea rânduri -> coloane; ca la /timeseries, rândurile din view
+    # au deja tipurile răspunsului și nu mai trec prin modele Pydantic
+    columns = list(zip(*rows)) or [()] * len(QUERY_COLUMNS)
+
+    return ORJSONResponse({
+        "indicators": {
+            code: {"name": indicator.name, "unit": indicator.unit.value}
+            for code, indicator in indicators.items()
+        },
+        "missing_indicators": missing,
+        "row_count": len(rows),
+        "columns": dict(zip(QUERY_COLUMNS, columns))
+    })
+
+
 @router.get("/{indicator_code}", response_model=IndicatorResponse)
-def get_indicator(indicator_code: str, db: Session = Depends(get_db)):
+async def get_indicator(indicator_code: str):
     """
     Detalii despre un indicator specific.
     """
-    indicator = db.query(IndicatorDefinition).filter(
-        IndicatorDefinition.code == indicator_code
-    ).first()
+    await indicator_registry.ensure_loaded_async()
+    indicator = indicator_registry.get(indicator_code)
 
     if not indicator:
         raise HTTPException(status_code=404, detail="Indicator not found")
@@ -108,77 +231,76 @@ def get_indicator(indicator_code: str, db: Session = Depends(get_db)):
 
 
 @router.get("/{indicator_code}/timeseries", response_model=TimeSeriesResponse)
-def get_indicator_timeseries(
+async def get_indicator_timeseries(
     indicator_code: str,
     county_code: Optional[str] = None,
     aggregation_level: AggregationLevel = AggregationLevel.REGION,
     start_year: int = Query(default=2010, ge=2000, le=2030),
     end_year: int = Query(default=2024, ge=2000, le=2030),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Serie temporală pentru un indicator.
+
+    Definiția vine din registrul in-process; valorile și codurile județelor
+    sunt citite din `mv_indicator_data`, fără join-uri la momentul cererii.
     """
-    indicator = db.query(IndicatorDefinition).filter(
-        IndicatorDefinition.code == indicator_code
-    ).first()
+    await indicator_registry.ensure_loaded_async()
+    indicator = indicator_registry.get(indicator_code)
 
     if not indicator:
         raise HTTPException(status_code=404, detail="Indicator not found")
 
-    query = db.query(IndicatorValue).filter(
-        IndicatorValue.indicator_id == indicator.id,
-        IndicatorValue.year >= start_year,
-        IndicatorValue.year <= end_year,
-        IndicatorValue.aggregation_level == aggregation_level
+    data = indicator_data_view.c
+    query = select(
+        data.year,
+        data.quarter,
+        data.value,
+        data.aggregation_level,
+        data.is_provisional,
+        data.county_code
+    ).where(
+        data.indicator_code == indicator.code,
+        data.aggregation_level == aggregation_level.value,
+        data.year >= start_year,
+        data.year <= end_year
     )
 
     if county_code:
-        query = query.join(IndicatorValue.county).filter_by(code=county_code)
+        query = query.where(data.county_code == county_code)
 
-    values = query.order_by(IndicatorValue.year).all()
+    rows = (await db.execute(query.order_by(data.year, data.quarter))).all()
 
-    return TimeSeriesResponse(
-        indicator_code=indicator.code,
-        indicator_name=indicator.name,
-        unit=indicator.unit.value,
-        data=[
-            IndicatorValueResponse(
-                year=v.year,
-                quarter=v.quarter,
-                value=v.value,
-                county_code=v.county.code if v.county else None,
-                aggregation_level=v.aggregation_level.value,
-                is_provisional=bool(v.is_provisional)
-            )
-            for v in values
-        ]
-    )
+    # response_model rămâne pentru documentația OpenAPI; un Response returnat
+    # direct nu mai e validat și serializat încă o dată de FastAPI
+    return ORJSONResponse(timeseries_content(indicator, rows))
 
 
 @router.get("/{indicator_code}/compare", response_model=ComparisonResponse)
-def compare_indicator_by_county(
+@cached("indicators.compare", ttl=3600)
+async def compare_indicator_by_county(
     indicator_code: str,
     year: int = Query(default=2023, ge=2000, le=2030),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Comparație a unui indicator între județe pentru un an dat.
     """
-    indicator = db.query(IndicatorDefinition).filter(
-        IndicatorDefinition.code == indicator_code
-    ).first()
+    await indicator_registry.ensure_loaded_async()
+    indicator = indicator_registry.get(indicator_code)
 
     if not indicator:
         raise HTTPException(status_code=404, detail="Indicator not found")
 
-    values = db.query(IndicatorValue).filter(
-        IndicatorValue.indicator_id == indicator.id,
-        IndicatorValue.year == year,
-        IndicatorValue.aggregation_level == AggregationLevel.COUNTY
-    ).all()
+    comparison = county_comparison_view.c
+    values = (await db.execute(
+        select(comparison.county_name, comparison.value).where(
+            comparison.indicator_code == indicator.code,
+            comparison.year == year
+        )
+    )).all()
 
-    comparisons = {v.county.name: v.value for v in values if v.county}
+    comparisons = {v.county_name: v.value for v in values}
 
     return ComparisonResponse(
         indicator_code=indicator.code,
@@ -189,9 +311,10 @@ def compare_indicator_by_county(
 
 
 @router.get("/kpi/summary")
-def get_kpi_summary(
+@cached("indicators.kpi_summary", ttl=3600)
+async def get_kpi_summary(
     year: int = Query(default=2023, ge=2000, le=2030),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Sumar KPI-uri principale pentru dashboard.
@@ -204,23 +327,17 @@ def get_kpi_summary(
         "TOTAL_COMPANIES"
     ]
 
-    kpis = {}
-    for code in kpi_codes:
-        indicator = db.query(IndicatorDefinition).filter(
-            IndicatorDefinition.code == code
-        ).first()
-
-        if indicator:
-            value = db.query(IndicatorValue).filter(
-                IndicatorValue.indicator_id == indicator.id,
-                IndicatorValue.year == year,
-                IndicatorValue.aggregation_level == AggregationLevel.REGION
-            ).first()
-
-            kpis[code] = {
-                "name": indicator.name,
-                "value": value.value if value else None,
-                "unit": indicator.unit.value
-            }
+    await indicator_registry.ensure_loaded_async()
+
+    # KPIService folosește API-ul sync; run_sync îl rulează pe conexiunea
+    # async, fără thread suplimentar (serviciul face doar I/O)
+    kpis = await db.run_sync(lambda session: KPIService(session).get_kpis(kpi_codes, year))
 
-    return kpis
+    return {
+        code: {
+            "name": kpi["name"],
+            "value": kpi["value"],
+            "unit": kpi["unit"]
+        }
+        for code, kpi in kpis.items()
+    }
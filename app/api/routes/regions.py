@@ -3,11 +3,13 @@ Endpoint-uri pentru regiuni și județe
 """
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
 from typing import Optional
 from pydantic import BaseModel
 
-from app.api.dependencies import get_db
+from app.api.dependencies import get_async_db
 from app.models.region import Region, County
 
 router = APIRouter(prefix="/regions", tags=["regions"])
@@ -57,20 +59,21 @@ class CountyDetailResponse(CountyResponse):
 
 
 # Endpoints
+# Sesiunea async nu permite lazy load: relațiile folosite în răspuns sunt
+# încărcate explicit (selectinload/joinedload).
 @router.get("/", response_model=list[RegionResponse])
-def list_regions(db: Session = Depends(get_db)):
+async def list_regions(db: AsyncSession = Depends(get_async_db)):
     """
     Listează toate regiunile disponibile.
     """
-    return db.query(Region).all()
+    result = await db.execute(select(Region).options(selectinload(Region.counties)))
+    return result.scalars().all()
 
 
-@router.get("/{region_code}", response_model=RegionResponse)
-def get_region(region_code: str, db: Session = Depends(get_db)):
-    """
-    Detalii despre o regiune specifică.
-    """
-    region = db.query(Region).filter(Region.code == region_code).first()
+async def _get_region(db: AsyncSession, region_code: str) -> Region:
+    region = (await db.execute(
+        select(Region).options(selectinload(Region.counties)).where(Region.code == region_code)
+    )).scalars().first()
 
     if not region:
         raise HTTPException(status_code=404, detail="Region not found")
@@ -78,28 +81,42 @@ def get_region(region_code: str, db: Session = Depends(get_db)):
     return region
 
 
+@router.get("/{region_code}", response_model=RegionResponse)
+async def get_region(region_code: str, db: AsyncSession = Depends(get_async_db)):
+    """
+    Detalii despre o regiune specifică.
+    """
+    return await _get_region(db, region_code)
+
+
 @router.get("/{region_code}/counties", response_model=list[CountyResponse])
-def list_counties_by_region(region_code: str, db: Session = Depends(get_db)):
+async def list_counties_by_region(region_code: str, db: AsyncSession = Depends(get_async_db)):
     """
     Listează județele dintr-o regiune.
     """
-    region = db.query(Region).filter(Region.code == region_code).first()
+    region = await _get_region(db, region_code)
+    return region.counties
 
-    if not region:
-        raise HTTPException(status_code=404, detail="Region not found")
 
-    return region.counties
+async def _get_county(db: AsyncSession, county_code: str, with_region: bool = False) -> County:
+    query = select(County).where(County.code == county_code)
+    if with_region:
+        query = query.options(joinedload(County.region))
+
+    county = (await db.execute(query)).scalars().first()
+
+    if not county:
+        raise HTTPException(status_code=404, detail="County not found")
+
+    return county
 
 
 @router.get("/counties/{county_code}", response_model=CountyDetailResponse)
-def get_county(county_code: str, db: Session = Depends(get_db)):
+async def get_county(county_code: str, db: AsyncSession = Depends(get_async_db)):
     """
     Detalii despre un județ specific.
     """
-    county = db.query(County).filter(County.code == county_code).first()
-
-    if not county:
-        raise HTTPException(status_code=404, detail="County not found")
+    county = await _get_county(db, county_code, with_region=True)
 
     return CountyDetailResponse(
         id=county.id,
@@ -116,15 +133,12 @@ def get_county(county_code: str, db: Session = Depends(get_db)):
 
 
 @router.get("/counties/{county_code}/map-data")
-def get_county_map_data(county_code: str, db: Session = Depends(get_db)):
+async def get_county_map_data(county_code: str, db: AsyncSession = Depends(get_async_db)):
     """
     Date pentru afișare pe hartă pentru un județ.
     Include coordonate și indicatori principali.
     """
-    county = db.query(County).filter(County.code == county_code).first()
-
-    if not county:
-        raise HTTPException(status_code=404, detail="County not found")
+    county = await _get_county(db, county_code)
 
     return {
         "code": county.code,
@@ -142,14 +156,13 @@ def get_county_map_data(county_code: str, db: Session = Depends(get_db)):
 
 
 @router.get("/map/all")
-def get_all_counties_map_data(db: Session = Depends(get_db)):
+async def get_all_counties_map_data(db: AsyncSession = Depends(get_async_db)):
     """
     Date pentru hartă pentru toate județele din Regiunea Vest.
     """
-    region = db.query(Region).filter(Region.code == "RO42").first()
-
-    if not region:
-        return []
+    counties = (await db.execute(
+        select(County).join(County.region).where(Region.code == "RO42")
+    )).scalars().all()
 
     return [
         {
@@ -161,5 +174,5 @@ def get_all_counties_map_data(db: Session = Depends(get_db)):
             },
             "is_automotive_hub": county.is_automotive_hub
         }
-        for county in region.counties
+        for county in counties
     ]
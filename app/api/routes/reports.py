@@ -3,16 +3,31 @@ Endpoint-uri pentru generare rapoarte
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import StreamingResponse
+from fastapi.responses import FileResponse, StreamingResponse
+from starlette.background import BackgroundTask
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import Literal, Optional
 from pydantic import BaseModel
 from datetime import datetime
-import io
-
-from app.api.dependencies import get_db
-from app.models.indicator import IndicatorDefinition, IndicatorValue, AggregationLevel
-from app.models.region import Region, County
+import os
+import uuid
+
+from app.api.dependencies import get_db, get_async_db
+from app.config import settings
+from app.models.indicator import AggregationLevel
+from app.services.cache import cached
+from app.services.indicator_registry import indicator_registry
+from app.services.export import (
+    COLUMNAR_COLUMNS,
+    stream_export_rows,
+    iter_csv,
+    iter_arrow_stream,
+    write_xlsx,
+    write_parquet
+)
+from app.services.kpi import KPIService, DEFAULT_KPI_CODES
+from app.services.report_jobs import report_queue
 
 router = APIRouter(prefix="/reports", tags=["reports"])
 
@@ -24,6 +39,7 @@ class ReportRequest(BaseModel):
     county_codes: Optional[list[str]] = None
     indicator_codes: Optional[list[str]] = None
     include_charts: bool = True
+    format: Literal["pdf", "xlsx"] = "pdf"
 
 
 class ReportMetadata(BaseModel):
@@ -34,9 +50,27 @@ class ReportMetadata(BaseModel):
     format: str
 
 
+class ReportStatus(BaseModel):
+    report_id: str
+    status: str
+    progress: int
+    download_url: Optional[str] = None
+    error: Optional[str] = None
+
+
+def _report_status(job) -> ReportStatus:
+    return ReportStatus(
+        report_id=str(job.report_id),
+        status=job.status,
+        progress=job.progress or 0,
+        download_url=f"{settings.api_prefix}/reports/download/{job.report_id}",
+        error=job.error_message
+    )
+
+
 # Endpoints
 @router.get("/templates")
-def list_report_templates():
+async def list_report_templates():
     """
     Listează șabloanele de rapoarte disponibile.
     """
@@ -69,106 +103,114 @@ def list_report_templates():
     ]
 
 
+# Exporturile rămân sync: citesc prin cursoare server-side psycopg2 și scriu
+# fișiere, deci rulează în threadpool, nu în event loop
 @router.get("/export/excel")
 def export_to_excel(
     year: int = Query(default=2023, ge=2000, le=2030),
     indicator_codes: Optional[str] = None,  # comma-separated
-    db: Session = Depends(get_db)
+    sheet_per_indicator: bool = False
 ):
     """
     Exportă datele în format Excel.
+    Rândurile sunt scrise direct dintr-un cursor server-side într-un
+    workbook xlsx în mod constant_memory, salvat într-un fișier temporar
+    care este trimis și apoi șters.
     """
-    import pandas as pd
-    from io import BytesIO
-
     # Parse indicator codes
     codes = indicator_codes.split(",") if indicator_codes else None
 
-    # Query data
-    query = db.query(
-        IndicatorDefinition.code,
-        IndicatorDefinition.name,
-        IndicatorValue.year,
-        IndicatorValue.value,
-        County.name.label("county_name")
-    ).join(
-        IndicatorValue, IndicatorDefinition.id == IndicatorValue.indicator_id
-    ).outerjoin(
-        County, IndicatorValue.county_id == County.id
-    ).filter(
-        IndicatorValue.year == year
-    )
+    rows = stream_export_rows(start_year=year, end_year=year, indicator_codes=codes)
+    path = write_xlsx(rows, sheet_per_indicator=sheet_per_indicator)
 
-    if codes:
-        query = query.filter(IndicatorDefinition.code.in_(codes))
-
-    results = query.all()
-
-    # Create DataFrame
-    df = pd.DataFrame(results, columns=["Cod", "Indicator", "An", "Valoare", "Județ"])
-
-    # Write to Excel
-    output = BytesIO()
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        df.to_excel(writer, sheet_name='Date', index=False)
-
-    output.seek(0)
-
-    return StreamingResponse(
-        output,
+    return FileResponse(
+        path,
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={
-            "Content-Disposition": f"attachment; filename=automotive_vest_{year}.xlsx"
-        }
+        filename=f"automotive_vest_{year}.xlsx",
+        background=BackgroundTask(os.remove, path)
     )
 
 
 @router.get("/export/csv")
 def export_to_csv(
     year: int = Query(default=2023, ge=2000, le=2030),
-    indicator_code: Optional[str] = None,
-    db: Session = Depends(get_db)
+    indicator_code: Optional[str] = None
 ):
     """
     Exportă datele în format CSV.
+    Rândurile sunt citite printr-un cursor server-side și trimise pe
+    măsură ce sunt scrise, deci memoria folosită nu crește cu exportul.
     """
-    import csv
-    from io import StringIO
-
-    query = db.query(
-        IndicatorDefinition.code,
-        IndicatorDefinition.name,
-        IndicatorValue.year,
-        IndicatorValue.value,
-        County.name.label("county_name")
-    ).join(
-        IndicatorValue, IndicatorDefinition.id == IndicatorValue.indicator_id
-    ).outerjoin(
-        County, IndicatorValue.county_id == County.id
-    ).filter(
-        IndicatorValue.year == year
+    rows = stream_export_rows(
+        start_year=year,
+        end_year=year,
+        indicator_codes=[indicator_code] if indicator_code else None
     )
 
-    if indicator_code:
-        query = query.filter(IndicatorDefinition.code == indicator_code)
+    return StreamingResponse(
+        iter_csv(rows),
+        media_type="text/csv",
+        headers={
+            "Content-Disposition": f"attachment; filename=automotive_vest_{year}.csv"
+        }
+    )
 
-    results = query.all()
 
-    # Create CSV
-    output = StringIO()
-    writer = csv.writer(output)
-    writer.writerow(["Cod", "Indicator", "An", "Valoare", "Județ"])
+@router.get("/export/parquet")
+def export_to_parquet(
+    start_year: int = Query(default=2010, ge=2000, le=2030),
+    end_year: int = Query(default=2024, ge=2000, le=2030),
+    indicator_codes: Optional[str] = None,  # comma-separated
+    aggregation_level: Optional[AggregationLevel] = None,
+    county_code: Optional[str] = None
+):
+    """
+    Exportă datele în format Parquet (coloane tipizate, text dictionary-encoded).
+    """
+    rows = stream_export_rows(
+        start_year=start_year,
+        end_year=end_year,
+        indicator_codes=indicator_codes.split(",") if indicator_codes else None,
+        aggregation_level=aggregation_level,
+        county_code=county_code,
+        columns=COLUMNAR_COLUMNS
+    )
+    path = write_parquet(rows)
 
-    for row in results:
-        writer.writerow(row)
+    return FileResponse(
+        path,
+        media_type="application/vnd.apache.parquet",
+        filename=f"automotive_vest_{start_year}_{end_year}.parquet",
+        background=BackgroundTask(os.remove, path)
+    )
 
-    output.seek(0)
+
+@router.get("/export/arrow")
+def export_to_arrow(
+    start_year: int = Query(default=2010, ge=2000, le=2030),
+    end_year: int = Query(default=2024, ge=2000, le=2030),
+    indicator_codes: Optional[str] = None,  # comma-separated
+    aggregation_level: Optional[AggregationLevel] = None,
+    county_code: Optional[str] = None
+):
+    """
+    Exportă datele în format Arrow IPC stream, batch cu batch.
+    Se citește cu `pyarrow.ipc.open_stream(...).read_pandas()`.
+    """
+    rows = stream_export_rows(
+        start_year=start_year,
+        end_year=end_year,
+        indicator_codes=indicator_codes.split(",") if indicator_codes else None,
+        aggregation_level=aggregation_level,
+        county_code=county_code,
+        columns=COLUMNAR_COLUMNS
+    )
 
     return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
+        iter_arrow_stream(rows),
+        media_type="application/vnd.apache.arrow.stream",
         headers={
-            "Content-Disposition": f"attachment; filename=automotive_vest_{year}.csv"
+            "Content-Disposition": f"attachment; filename=automotive_vest_{start_year}_{end_year}.arrows"
         }
     )
 
@@ -177,43 +219,82 @@ def export_to_csv(
 def generate_report(request: ReportRequest, db: Session = Depends(get_db)):
     """
     Generează un raport personalizat.
-    Returnează metadata raportului și URL pentru descărcare.
+    Raportul este pus în coada de generare; se returnează imediat metadata,
+    starea jobului și URL-ul pentru descărcare. O cerere identică cu una
+    recentă reutilizează raportul existent.
     """
-    import uuid
-
-    report_id = str(uuid.uuid4())
-
-    # În implementarea completă, aici s-ar genera efectiv raportul
-    # și s-ar salva pentru descărcare ulterioară
+    job = report_queue.submit(
+        db,
+        report_type="custom",
+        title=request.title,
+        fmt=request.format,
+        parameters=request.model_dump(exclude={"title", "format"})
+    )
+    status = _report_status(job)
 
     return {
-        "report_id": report_id,
-        "status": "generated",
-        "download_url": f"/api/v1/reports/download/{report_id}",
+        "report_id": status.report_id,
+        "status": status.status,
+        "progress": status.progress,
+        "download_url": status.download_url,
         "metadata": ReportMetadata(
-            id=report_id,
-            title=request.title,
-            generated_at=datetime.now(),
+            id=status.report_id,
+            title=job.title,
+            generated_at=job.generated_at,
             year=request.year,
-            format="pdf"
+            format=job.format
         )
     }
 
 
+@router.get("/status/{report_id}", response_model=ReportStatus)
+async def get_report_status(report_id: uuid.UUID, db: AsyncSession = Depends(get_async_db)):
+    """
+    Starea și progresul unui job de generare raport.
+    """
+    job = await db.run_sync(report_queue.get, report_id)
+
+    if not job:
+        raise HTTPException(status_code=404, detail="Report not found")
+
+    return _report_status(job)
+
+
+@router.get("/download/{report_id}")
+async def download_report(report_id: uuid.UUID, db: AsyncSession = Depends(get_async_db)):
+    """
+    Descarcă un raport generat.
+    Returnează 409 dacă raportul este încă în lucru sau a eșuat.
+    """
+    job = await db.run_sync(report_queue.get, report_id)
+
+    if not job:
+        raise HTTPException(status_code=404, detail="Report not found")
+
+    if job.status != "completed":
+        raise HTTPException(status_code=409, detail=f"Report is {job.status}")
+
+    if not job.file_path or not os.path.exists(job.file_path):
+        raise HTTPException(status_code=410, detail="Report file no longer available")
+
+    media_types = {
+        "pdf": "application/pdf",
+        "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    }
+
+    return FileResponse(
+        job.file_path,
+        media_type=media_types.get(job.format, "application/octet-stream"),
+        filename=f"raport_{report_id}.{job.format}"
+    )
+
+
 @router.get("/summary/{year}")
-def get_annual_summary(year: int, db: Session = Depends(get_db)):
+@cached("reports.summary", ttl=3600)
+async def get_annual_summary(year: int, db: AsyncSession = Depends(get_async_db)):
     """
     Sumar anual pentru afișare rapidă în dashboard.
     """
-    # Query pentru indicatorii principali
-    summary_indicators = [
-        "TOTAL_COMPANIES",
-        "TOTAL_EMPLOYEES",
-        "TOTAL_TURNOVER",
-        "TOTAL_EXPORTS",
-        "PRODUCTIVITY"
-    ]
-
     summary = {
         "year": year,
         "region": "Regiunea Vest",
@@ -221,34 +302,17 @@ def get_annual_summary(year: int, db: Session = Depends(get_db)):
         "generated_at": datetime.now().isoformat()
     }
 
-    for code in summary_indicators:
-        indicator = db.query(IndicatorDefinition).filter(
-            IndicatorDefinition.code == code
-        ).first()
-
-        if indicator:
-            value = db.query(IndicatorValue).filter(
-                IndicatorValue.indicator_id == indicator.id,
-                IndicatorValue.year == year,
-                IndicatorValue.aggregation_level == AggregationLevel.REGION
-            ).first()
-
-            # Get previous year for comparison
-            prev_value = db.query(IndicatorValue).filter(
-                IndicatorValue.indicator_id == indicator.id,
-                IndicatorValue.year == year - 1,
-                IndicatorValue.aggregation_level == AggregationLevel.REGION
-            ).first()
-
-            change_pct = None
-            if value and prev_value and prev_value.value != 0:
-                change_pct = ((value.value - prev_value.value) / prev_value.value) * 100
-
-            summary["indicators"][code] = {
-                "name": indicator.name,
-                "value": value.value if value else None,
-                "unit": indicator.unit.value,
-                "change_pct": round(change_pct, 2) if change_pct else None
-            }
+    # Reîncărcarea registrului (la expirarea TTL-ului) rulează într-un
+    # thread; în run_sync ar bloca event loop-ul
+    await indicator_registry.ensure_loaded_async()
+    kpis = await db.run_sync(lambda session: KPIService(session).get_kpis(DEFAULT_KPI_CODES, year))
+
+    for code, kpi in kpis.items():
+        summary["indicators"][code] = {
+            "name": kpi["name"],
+            "value": kpi["value"],
+            "unit": kpi["unit"],
+            "change_pct": kpi["change_pct"]
+        }
 
     return summary
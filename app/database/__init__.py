@@ -1,3 +1,9 @@
-from app.database.connection import Base, engine, SessionLocal, get_db, init_db
+from app.database.connection import (
+    Base, engine, SessionLocal, get_db, init_db, check_schema_revision,
+    async_engine, AsyncSessionLocal, get_async_db
+)
 
-__all__ = ["Base", "engine", "SessionLocal", "get_db", "init_db"]
+__all__ = [
+    "Base", "engine", "SessionLocal", "get_db", "init_db", "check_schema_revision",
+    "async_engine", "AsyncSessionLocal", "get_async_db"
+]
@@ -2,17 +2,28 @@
 Conexiune la baza de date PostgreSQL
 """
 
-from sqlalchemy import create_engine
+import os
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from app.config import settings
+from app.database.instrumentation import (
+    instrument_engine, pool_metrics, TimedQueuePool, TimedAsyncAdaptedQueuePool
+)
+from app.metrics import metrics
 
-# Engine SQLAlchemy
+# Engine SQLAlchemy (psycopg2): servicii, importuri, exporturi și rutele
+# CPU-bound, care rulează oricum în threadpool
 engine = create_engine(
     settings.database_url,
-    echo=settings.debug,
+    echo=settings.db_echo,
+    poolclass=TimedQueuePool,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow
 )
 
 # Session factory
@@ -22,6 +33,34 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+# Engine async (asyncpg) pentru rutele I/O-bound: o cerere care așteaptă
+# baza de date nu mai ocupă un thread din threadpool
+async_engine = create_async_engine(
+    settings.async_database_url or make_url(settings.database_url).set(drivername="postgresql+asyncpg"),
+    echo=settings.db_echo,
+    poolclass=TimedAsyncAdaptedQueuePool,
+    pool_pre_ping=True,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow
+)
+
+# Session factory async; expire_on_commit=False ca obiectele să rămână
+# lizibile după commit fără un refresh implicit (lazy load-ul nu e permis)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+# Număr și durată query-uri per cerere (vezi app/api/middleware.py)
+if settings.db_instrumentation:
+    instrument_engine(engine)
+    instrument_engine(async_engine.sync_engine)
+
+# Starea pool-urilor, citită la fiecare scrape /metrics
+metrics.add_collector(lambda: pool_metrics({"sync": engine.pool, "async": async_engine.pool}))
+
 # Base class pentru modele
 Base = declarative_base()
 
@@ -38,8 +77,60 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    """
+    Dependency pentru obținerea unei sesiuni async (asyncpg).
+    Folosit în rutele `async def` cu Depends().
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# Configurația Alembic; schema se modifică doar prin migrări
+ALEMBIC_INI = os.path.join(os.path.dirname(__file__), "migrations", "alembic.ini")
+
+
+def schema_head() -> str:
+    """
+    Revizia Alembic pe care o așteaptă codul: head-ul din migrations/versions,
+    citit din scripturile de migrare (nu trebuie actualizat manual).
+    """
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+
+    return ScriptDirectory.from_config(Config(ALEMBIC_INI)).get_current_head()
+
+
 def init_db():
     """
-    Inițializare bază de date - creare tabele.
+    Aplică migrările Alembic până la ultima revizie (scripturi, dezvoltare).
+    Un singur proces o face per deploy; API-ul doar verifică revizia.
     """
-    Base.metadata.create_all(bind=engine)
+    from alembic import command
+    from alembic.config import Config
+
+    config = Config(ALEMBIC_INI)
+    config.attributes["configure_logger"] = False
+    command.upgrade(config, "head")
+
+
+def check_schema_revision():
+    """
+    Verifică la pornirea API-ului că schema este la revizia așteptată de cod.
+    Un singur SELECT pe alembic_version, fără reflecție și fără create_all.
+
+    Raises:
+        RuntimeError: schema lipsește sau e la altă revizie
+    """
+    try:
+        with engine.connect() as connection:
+            revision = connection.execute(text("SELECT version_num FROM alembic_version")).scalar()
+    except ProgrammingError:
+        revision = None
+
+    expected = schema_head()
+    if revision != expected:
+        raise RuntimeError(
+            f"Database schema revision is {revision!r}, expected {expected!r}. "
+            f"Run: alembic -c app/database/migrations/alembic.ini upgrade head"
+        )
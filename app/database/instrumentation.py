@@ -0,0 +1,176 @@
+"""
+Instrumentarea query-urilor SQL (număr, durată, tipare N+1) per cerere
+"""
+
+import json
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.config import settings
+from app.metrics import metrics, MetricFamily
+
+
+# Placeholder-ele psycopg2 (%(name)s) și asyncpg ($1) devin "?", iar
+# listele IN expandate devin "(?)", ca aceeași formă să aibă o singură cheie
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|\$\d+")
+_PLACEHOLDER_LIST = re.compile(r"\(\?(?:\s*,\s*\?)*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+# Lungimea maximă a unui statement inclus în loguri
+MAX_LOGGED_STATEMENT = 500
+
+
+def statement_shape(statement: str) -> str:
+    """Forma normalizată a unui statement, fără valorile parametrilor."""
+    shape = _PLACEHOLDER.sub("?", statement)
+    shape = _PLACEHOLDER_LIST.sub("(?)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+class QueryStats:
+    """
+    Statisticile SQL ale unei cereri: număr de statement-uri, timpul total
+    în baza de date, cel mai lent statement și frecvența fiecărei forme.
+
+    Poate fi actualizat din mai multe thread-uri (ex: rute sync sau
+    `asyncio.to_thread` din aceeași cerere), deci scrierile sunt sub lock.
+    """
+
+    def __init__(self, label: Optional[str] = None):
+        self.label = label  # ex: "GET /api/v1/regions/"
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total_seconds = 0.0
+        self.slowest_seconds = 0.0
+        self.slowest_statement: Optional[str] = None
+        self.shapes: Counter = Counter()
+
+    def record(self, statement: str, seconds: float):
+        shape = statement_shape(statement)
+        with self._lock:
+            self.count += 1
+            self.total_seconds += seconds
+            self.shapes[shape] += 1
+            if seconds >= self.slowest_seconds:
+                self.slowest_seconds = seconds
+                self.slowest_statement = shape
+
+    def repeated(self, threshold: int) -> list[dict]:
+        """Formele executate de mai mult de `threshold` ori (suspect N+1)."""
+        with self._lock:
+            return [
+                {"statement": shape, "count": count}
+                for shape, count in self.shapes.most_common()
+                if count > threshold
+            ]
+
+
+# Statisticile cererii curente; None în afara unei cereri (ex: joburi)
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("current_query_stats", default=None)
+
+logger = logging.getLogger("app.db")
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # Pe contextul de execuție: dacă statement-ul eșuează, marcajul dispare
+    # odată cu contextul
+    if context is not None:
+        context._query_started_at = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started_at = getattr(context, "_query_started_at", None)
+    if started_at is None:
+        return
+    seconds = time.perf_counter() - started_at
+
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.record(statement, seconds)
+
+    if seconds * 1000 >= settings.slow_query_ms:
+        logger.warning(json.dumps({
+            "event": "slow_query",
+            "duration_ms": round(seconds * 1000, 2),
+            "request": stats.label if stats is not None else None,
+            "statement": statement_shape(statement)[:MAX_LOGGED_STATEMENT],
+            "executemany": executemany
+        }, ensure_ascii=False))
+
+
+def instrument_engine(engine: Engine):
+    """
+    Atașează listener-ii de cursor unui engine. Pentru un AsyncEngine se
+    transmite `async_engine.sync_engine`.
+    """
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+# ==================== POOL ====================
+
+pool_wait_seconds = metrics.histogram(
+    "db_pool_wait_seconds",
+    "Timpul de așteptare pentru o conexiune din pool",
+    ["engine"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+)
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool care măsoară cât așteaptă fiecare checkout."""
+    metrics_label = "sync"
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            pool_wait_seconds.observe(time.perf_counter() - started, self.metrics_label)
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """Varianta pentru AsyncEngine (asyncpg)."""
+    metrics_label = "async"
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            pool_wait_seconds.observe(time.perf_counter() - started, self.metrics_label)
+
+
+def pool_metrics(pools: dict) -> list[MetricFamily]:
+    """
+    Starea curentă a pool-urilor ({eticheta: pool}): dimensiune,
+    conexiuni împrumutate, libere și overflow.
+    """
+    size = MetricFamily("db_pool_size", "gauge", "Dimensiunea configurată a pool-ului")
+    checked_out = MetricFamily("db_pool_checked_out", "gauge", "Conexiuni împrumutate din pool")
+    checked_in = MetricFamily("db_pool_checked_in", "gauge", "Conexiuni libere în pool")
+    overflow = MetricFamily("db_pool_overflow", "gauge", "Conexiuni peste pool_size (negativ: locuri încă nedeschise)")
+    max_overflow = MetricFamily("db_pool_max_overflow", "gauge", "Overflow maxim configurat")
+
+    for label, pool in pools.items():
+        if not isinstance(pool, QueuePool):
+            continue
+        labels = {"engine": label}
+        size.add(labels, pool.size())
+        checked_out.add(labels, pool.checkedout())
+        checked_in.add(labels, pool.checkedin())
+        overflow.add(labels, pool.overflow())
+        max_overflow.add(labels, pool._max_overflow)
+
+    return [size, checked_out, checked_in, overflow, max_overflow]
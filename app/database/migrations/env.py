@@ -0,0 +1,68 @@
+"""
+Mediul Alembic: migrările rulează pe DATABASE_URL din app.config, iar
+autogenerate compară schema cu modelele din app.models.
+"""
+
+from logging.config import fileConfig
+
+from sqlalchemy import create_engine, pool
+from alembic import context
+
+from app.config import settings
+from app.database import Base
+import app.models  # noqa: F401 - înregistrează modelele în Base.metadata
+
+config = context.config
+
+# Apelat și din init_db(): nu dezactiva loggerii deja configurați ai aplicației
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = Base.metadata
+
+
+def include_object(obj, name, type_, reflected, compare_to):
+    """
+    Partițiile indicator_values sunt tabele obișnuite pentru reflecție, dar
+    nu au model propriu; fără filtrul acesta autogenerate le-ar șterge.
+    """
+    if type_ == "table" and reflected and compare_to is None and name.startswith("indicator_values_p"):
+        return False
+    return True
+
+
+def run_migrations_offline() -> None:
+    """Generează SQL-ul migrărilor (alembic upgrade head --sql), fără conexiune."""
+    context.configure(
+        url=settings.database_url,
+        target_metadata=target_metadata,
+        include_object=include_object,
+        compare_type=True,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """Rulează migrările pe baza de date, într-o singură tranzacție."""
+    connectable = create_engine(settings.database_url, poolclass=pool.NullPool)
+
+    with connectable.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+            compare_type=True
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,62 @@
+"""report_logs devine coada de joburi pentru generarea rapoartelor
+
+- report_id e obligatoriu și unic (identifică jobul în /reports/status);
+- coloane noi: format, params_hash (deduplicare), completed_at, progress,
+  error_message; starea implicită devine `queued`;
+- rapoartele vechi (`generated`) sunt marcate `completed`.
+
+Revision ID: 0002_report_jobs
+Revises: 0001_baseline
+Create Date: 2026-10-17 10:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002_report_jobs"
+down_revision: Union[str, None] = "0001_baseline"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        UPDATE report_logs SET report_id = uuid_generate_v4() WHERE report_id IS NULL;
+
+        ALTER TABLE report_logs
+            ALTER COLUMN report_id SET NOT NULL,
+            ADD CONSTRAINT report_logs_report_id_key UNIQUE (report_id),
+            ADD COLUMN format VARCHAR(10) NOT NULL DEFAULT 'pdf',
+            ADD COLUMN params_hash VARCHAR(64),
+            ADD COLUMN completed_at TIMESTAMP,
+            ADD COLUMN progress SMALLINT DEFAULT 0,
+            ADD COLUMN error_message TEXT,
+            ALTER COLUMN status SET DEFAULT 'queued';
+
+        UPDATE report_logs
+        SET status = 'completed', progress = 100, completed_at = generated_at
+        WHERE status = 'generated';
+
+        CREATE INDEX idx_reports_params ON report_logs(params_hash, status);
+    """)
+
+
+def downgrade() -> None:
+    op.execute("""
+        DROP INDEX IF EXISTS idx_reports_params;
+
+        UPDATE report_logs SET status = 'generated' WHERE status = 'completed';
+
+        ALTER TABLE report_logs
+            ALTER COLUMN status SET DEFAULT 'generated',
+            DROP COLUMN error_message,
+            DROP COLUMN progress,
+            DROP COLUMN completed_at,
+            DROP COLUMN params_hash,
+            DROP COLUMN format,
+            DROP CONSTRAINT report_logs_report_id_key,
+            ALTER COLUMN report_id DROP NOT NULL;
+    """)
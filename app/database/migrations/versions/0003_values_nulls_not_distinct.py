@@ -0,0 +1,52 @@
+"""uq_indicator_value devine UNIQUE NULLS NOT DISTINCT (PostgreSQL 15+)
+
+county_id/quarter sunt NULL pentru datele regionale/anuale; ca aceste
+rânduri să fie ținte valide pentru ON CONFLICT la upsert, NULL-urile
+trebuie să fie egale în constrângere.
+
+Eventualele duplicate existente (aceeași cheie, cu NULL) sunt șterse
+înainte, păstrând ultimul rând scris (id-ul cel mai mare), la fel ca
+upsert-ul pentru cheile repetate într-un lot.
+
+Revision ID: 0003_values_nulls_not_distinct
+Revises: 0002_report_jobs
+Create Date: 2026-10-17 10:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003_values_nulls_not_distinct"
+down_revision: Union[str, None] = "0002_report_jobs"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        DELETE FROM indicator_values older
+        USING indicator_values newer
+        WHERE older.id < newer.id
+          AND older.indicator_id = newer.indicator_id
+          AND older.county_id IS NOT DISTINCT FROM newer.county_id
+          AND older.year = newer.year
+          AND older.quarter IS NOT DISTINCT FROM newer.quarter
+          AND older.aggregation_level = newer.aggregation_level;
+
+        ALTER TABLE indicator_values
+            DROP CONSTRAINT uq_indicator_value,
+            ADD CONSTRAINT uq_indicator_value UNIQUE NULLS NOT DISTINCT
+                (indicator_id, county_id, year, quarter, aggregation_level);
+    """)
+
+
+def downgrade() -> None:
+    op.execute("""
+        ALTER TABLE indicator_values
+            DROP CONSTRAINT uq_indicator_value,
+            ADD CONSTRAINT uq_indicator_value UNIQUE
+                (indicator_id, county_id, year, quarter, aggregation_level);
+    """)
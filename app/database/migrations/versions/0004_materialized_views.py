@@ -0,0 +1,163 @@
+"""View-urile de raportare devin materializate
+
+v_indicator_data, v_kpi_summary și v_county_comparison sunt înlocuite de
+mv_indicator_data, mv_kpi_summary și mv_county_comparison, fiecare cu un
+index unic (REFRESH MATERIALIZED VIEW CONCURRENTLY după fiecare import,
+vezi app/services/reporting_views.py). Coloanele enum sunt expuse ca text,
+iar media din mv_county_comparison e calculată pe (indicator, an, trimestru).
+
+Revision ID: 0004_materialized_views
+Revises: 0003_values_nulls_not_distinct
+Create Date: 2026-10-17 10:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004_materialized_views"
+down_revision: Union[str, None] = "0003_values_nulls_not_distinct"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+DROP_VIEWS_SQL = """
+DROP MATERIALIZED VIEW IF EXISTS mv_county_comparison;
+DROP MATERIALIZED VIEW IF EXISTS mv_kpi_summary;
+DROP MATERIALIZED VIEW IF EXISTS mv_indicator_data;
+"""
+
+# Definițiile din database_schema.sql
+CREATE_VIEWS_SQL = """
+CREATE MATERIALIZED VIEW mv_indicator_data AS
+SELECT
+    iv.id,
+    iv.indicator_id,
+    id.code AS indicator_code,
+    id.name AS indicator_name,
+    id.category::text AS category,
+    id.unit::text AS unit,
+    iv.county_id,
+    c.name AS county_name,
+    c.code AS county_code,
+    r.name AS region_name,
+    iv.year,
+    iv.quarter,
+    iv.aggregation_level::text AS aggregation_level,
+    iv.value,
+    iv.is_provisional,
+    iv.is_estimated
+FROM indicator_values iv
+JOIN indicator_definitions id ON iv.indicator_id = id.id
+LEFT JOIN counties c ON iv.county_id = c.id
+LEFT JOIN regions r ON c.region_id = r.id;
+
+CREATE UNIQUE INDEX idx_mv_indicator_data_id ON mv_indicator_data(id);
+CREATE INDEX idx_mv_indicator_data_code ON mv_indicator_data(indicator_code, aggregation_level, year);
+CREATE INDEX idx_mv_indicator_data_county ON mv_indicator_data(county_code, indicator_code, year);
+
+CREATE MATERIALIZED VIEW mv_kpi_summary AS
+SELECT
+    iv.year,
+    MAX(CASE WHEN id.code = 'TOTAL_COMPANIES' THEN iv.value END) AS total_companies,
+    MAX(CASE WHEN id.code = 'TOTAL_EMPLOYEES' THEN iv.value END) AS total_employees,
+    MAX(CASE WHEN id.code = 'TOTAL_TURNOVER' THEN iv.value END) AS total_turnover,
+    MAX(CASE WHEN id.code = 'TOTAL_EXPORTS' THEN iv.value END) AS total_exports,
+    MAX(CASE WHEN id.code = 'PRODUCTIVITY' THEN iv.value END) AS productivity
+FROM indicator_values iv
+JOIN indicator_definitions id ON iv.indicator_id = id.id
+WHERE iv.aggregation_level = 'regiune'
+GROUP BY iv.year;
+
+CREATE UNIQUE INDEX idx_mv_kpi_summary_year ON mv_kpi_summary(year);
+
+CREATE MATERIALIZED VIEW mv_county_comparison AS
+SELECT
+    iv.id AS value_id,
+    c.name AS county_name,
+    c.code AS county_code,
+    id.code AS indicator_code,
+    id.name AS indicator_name,
+    iv.year,
+    iv.quarter,
+    iv.value,
+    iv.value / NULLIF(AVG(iv.value) OVER (PARTITION BY iv.indicator_id, iv.year, iv.quarter), 0) * 100 AS vs_average_pct
+FROM indicator_values iv
+JOIN indicator_definitions id ON iv.indicator_id = id.id
+JOIN counties c ON iv.county_id = c.id
+WHERE iv.aggregation_level = 'judet';
+
+CREATE UNIQUE INDEX idx_mv_county_comparison_id ON mv_county_comparison(value_id);
+CREATE INDEX idx_mv_county_comparison_lookup ON mv_county_comparison(indicator_code, year);
+"""
+
+# View-urile simple din 0001_baseline
+LEGACY_VIEWS_SQL = """
+-- View pentru date complete indicator
+CREATE OR REPLACE VIEW v_indicator_data AS
+SELECT
+    iv.id,
+    id.code AS indicator_code,
+    id.name AS indicator_name,
+    id.category,
+    id.unit,
+    c.name AS county_name,
+    c.code AS county_code,
+    r.name AS region_name,
+    iv.year,
+    iv.quarter,
+    iv.aggregation_level,
+    iv.value,
+    iv.is_provisional,
+    iv.is_estimated
+FROM indicator_values iv
+JOIN indicator_definitions id ON iv.indicator_id = id.id
+LEFT JOIN counties c ON iv.county_id = c.id
+LEFT JOIN regions r ON c.region_id = r.id;
+
+-- View pentru sumar KPI pe an
+CREATE OR REPLACE VIEW v_kpi_summary AS
+SELECT
+    iv.year,
+    MAX(CASE WHEN id.code = 'TOTAL_COMPANIES' THEN iv.value END) AS total_companies,
+    MAX(CASE WHEN id.code = 'TOTAL_EMPLOYEES' THEN iv.value END) AS total_employees,
+    MAX(CASE WHEN id.code = 'TOTAL_TURNOVER' THEN iv.value END) AS total_turnover,
+    MAX(CASE WHEN id.code = 'TOTAL_EXPORTS' THEN iv.value END) AS total_exports,
+    MAX(CASE WHEN id.code = 'PRODUCTIVITY' THEN iv.value END) AS productivity
+FROM indicator_values iv
+JOIN indicator_definitions id ON iv.indicator_id = id.id
+WHERE iv.aggregation_level = 'regiune'
+GROUP BY iv.year
+ORDER BY iv.year;
+
+-- View pentru comparație județe
+CREATE OR REPLACE VIEW v_county_comparison AS
+SELECT
+    c.name AS county_name,
+    c.code AS county_code,
+    id.code AS indicator_code,
+    id.name AS indicator_name,
+    iv.year,
+    iv.value,
+    iv.value / NULLIF(AVG(iv.value) OVER (PARTITION BY iv.indicator_id, iv.year), 0) * 100 AS vs_average_pct
+FROM indicator_values iv
+JOIN indicator_definitions id ON iv.indicator_id = id.id
+JOIN counties c ON iv.county_id = c.id
+WHERE iv.aggregation_level = 'judet';
+"""
+
+
+def upgrade() -> None:
+    op.execute("""
+        DROP VIEW IF EXISTS v_county_comparison;
+        DROP VIEW IF EXISTS v_kpi_summary;
+        DROP VIEW IF EXISTS v_indicator_data;
+    """)
+    op.execute(CREATE_VIEWS_SQL)
+
+
+def downgrade() -> None:
+    op.execute(DROP_VIEWS_SQL)
+    op.execute(LEGACY_VIEWS_SQL)
@@ -0,0 +1,48 @@
+"""Tabelul forecasts (prognoze cu intervale de predicție)
+
+Revision ID: 0005_forecasts
+Revises: 0004_materialized_views
+Create Date: 2026-10-17 10:25:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005_forecasts"
+down_revision: Union[str, None] = "0004_materialized_views"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE TABLE forecasts (
+            id SERIAL PRIMARY KEY,
+            indicator_id INTEGER NOT NULL REFERENCES indicator_definitions(id) ON DELETE CASCADE,
+            county_id INTEGER REFERENCES counties(id) ON DELETE CASCADE,
+            aggregation_level VARCHAR(20) NOT NULL,
+            method VARCHAR(20) NOT NULL,
+            year SMALLINT NOT NULL,
+            value DOUBLE PRECISION NOT NULL,
+            lower_bound DOUBLE PRECISION,
+            upper_bound DOUBLE PRECISION,
+            confidence_level DOUBLE PRECISION NOT NULL DEFAULT 0.95,
+            n_observations INTEGER,
+            last_observed_year SMALLINT,
+            aic DOUBLE PRECISION,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+            CONSTRAINT uq_forecast UNIQUE NULLS NOT DISTINCT (indicator_id, county_id, aggregation_level, method, year)
+        );
+
+        CREATE INDEX idx_forecasts_series ON forecasts(indicator_id, aggregation_level, county_id);
+
+        COMMENT ON TABLE forecasts IS 'Prognoze ale indicatorilor cu intervale de predicție';
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS forecasts")
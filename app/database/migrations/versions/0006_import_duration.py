@@ -0,0 +1,25 @@
+"""import_logs.duration_seconds (durata importurilor, expusă în /metrics)
+
+Revision ID: 0006_import_duration
+Revises: 0005_forecasts
+Create Date: 2026-10-17 10:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006_import_duration"
+down_revision: Union[str, None] = "0005_forecasts"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE import_logs ADD COLUMN duration_seconds DOUBLE PRECISION")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE import_logs DROP COLUMN duration_seconds")
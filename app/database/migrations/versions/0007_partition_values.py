@@ -0,0 +1,226 @@
+"""indicator_values partiționat HASH (indicator_id), cu un singur index acoperitor
+
+- 8 partiții HASH pe indicator_id: fiecare citire (un indicator, o serie)
+  și fiecare import (un indicator, toți anii) atinge o singură partiție;
+- un singur index acoperitor, pe forma citirilor calde
+  (indicator_id, aggregation_level, county_id, year, quarter)
+  INCLUDE (value, is_provisional), care este și ținta ON CONFLICT a
+  upsert-ului (unicitatea nu depinde de ordinea coloanelor);
+- idx_values_indicator/_county/_year/_aggregation/_lookup dispar: toate
+  erau prefixe sau subseturi ale cheii de mai sus și costau la fiecare import;
+- cheia primară devine (id, indicator_id), fiindcă pe un tabel partiționat
+  trebuie să conțină cheia de partiționare; id rămâne unic (aceeași secvență).
+
+Vederile materializate depind de tabel, deci sunt recreate. Migrarea
+blochează scrierile pe durata copierii. După migrare:
+VACUUM ANALYZE indicator_values; (harta de vizibilitate permite index-only
+scan pe indexul acoperitor)
+
+Revision ID: 0007_partition_values
+Revises: 0006_import_duration
+Create Date: 2026-10-17 10:35:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0007_partition_values"
+down_revision: Union[str, None] = "0006_import_duration"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+DROP_VIEWS_SQL = """
+DROP MATERIALIZED VIEW IF EXISTS mv_county_comparison;
+DROP MATERIALIZED VIEW IF EXISTS mv_kpi_summary;
+DROP MATERIALIZED VIEW IF EXISTS mv_indicator_data;
+"""
+
+# Definițiile din database_schema.sql
+CREATE_VIEWS_SQL = """
+CREATE MATERIALIZED VIEW mv_indicator_data AS
+SELECT
+    iv.id,
+    iv.indicator_id,
+    id.code AS indicator_code,
+    id.name AS indicator_name,
+    id.category::text AS category,
+    id.unit::text AS unit,
+    iv.county_id,
+    c.name AS county_name,
+    c.code AS county_code,
+    r.name AS region_name,
+    iv.year,
+    iv.quarter,
+    iv.aggregation_level::text AS aggregation_level,
+    iv.value,
+    iv.is_provisional,
+    iv.is_estimated
+FROM indicator_values iv
+JOIN indicator_definitions id ON iv.indicator_id = id.id
+LEFT JOIN counties c ON iv.county_id = c.id
+LEFT JOIN regions r ON c.region_id = r.id;
+
+CREATE UNIQUE INDEX idx_mv_indicator_data_id ON mv_indicator_data(id);
+CREATE INDEX idx_mv_indicator_data_code ON mv_indicator_data(indicator_code, aggregation_level, year);
+CREATE INDEX idx_mv_indicator_data_county ON mv_indicator_data(county_code, indicator_code, year);
+
+CREATE MATERIALIZED VIEW mv_kpi_summary AS
+SELECT
+    iv.year,
+    MAX(CASE WHEN id.code = 'TOTAL_COMPANIES' THEN iv.value END) AS total_companies,
+    MAX(CASE WHEN id.code = 'TOTAL_EMPLOYEES' THEN iv.value END) AS total_employees,
+    MAX(CASE WHEN id.code = 'TOTAL_TURNOVER' THEN iv.value END) AS total_turnover,
+    MAX(CASE WHEN id.code = 'TOTAL_EXPORTS' THEN iv.value END) AS total_exports,
+    MAX(CASE WHEN id.code = 'PRODUCTIVITY' THEN iv.value END) AS productivity
+FROM indicator_values iv
+JOIN indicator_definitions id ON iv.indicator_id = id.id
+WHERE iv.aggregation_level = 'regiune'
+GROUP BY iv.year;
+
+CREATE UNIQUE INDEX idx_mv_kpi_summary_year ON mv_kpi_summary(year);
+
+CREATE MATERIALIZED VIEW mv_county_comparison AS
+SELECT
+    iv.id AS value_id,
+    c.name AS county_name,
+    c.code AS county_code,
+    id.code AS indicator_code,
+    id.name AS indicator_name,
+    iv.year,
+    iv.quarter,
+    iv.value,
+    iv.value / NULLIF(AVG(iv.value) OVER (PARTITION BY iv.indicator_id, iv.year, iv.quarter), 0) * 100 AS vs_average_pct
+FROM indicator_values iv
+JOIN indicator_definitions id ON iv.indicator_id = id.id
+JOIN counties c ON iv.county_id = c.id
+WHERE iv.aggregation_level = 'judet';
+
+CREATE UNIQUE INDEX idx_mv_county_comparison_id ON mv_county_comparison(value_id);
+CREATE INDEX idx_mv_county_comparison_lookup ON mv_county_comparison(indicator_code, year);
+"""
+
+PARTITION_SQL = """
+ALTER TABLE indicator_values RENAME TO indicator_values_old;
+ALTER TABLE indicator_values_old RENAME CONSTRAINT indicator_values_pkey TO indicator_values_old_pkey;
+ALTER TABLE indicator_values_old RENAME CONSTRAINT uq_indicator_value TO uq_indicator_value_old;
+
+-- Secvența id trece la noul tabel (altfel ar fi ștearsă odată cu cel vechi)
+ALTER TABLE indicator_values_old ALTER COLUMN id DROP DEFAULT;
+ALTER SEQUENCE indicator_values_id_seq OWNED BY NONE;
+
+CREATE TABLE indicator_values (
+    id INTEGER NOT NULL DEFAULT nextval('indicator_values_id_seq'),
+    indicator_id INTEGER NOT NULL REFERENCES indicator_definitions(id) ON DELETE CASCADE,
+    county_id INTEGER REFERENCES counties(id) ON DELETE SET NULL,
+    year SMALLINT NOT NULL,
+    quarter SMALLINT,
+    aggregation_level aggregation_level NOT NULL DEFAULT 'regiune',
+    value DECIMAL(20,4) NOT NULL,
+    is_provisional SMALLINT DEFAULT 0,
+    is_estimated SMALLINT DEFAULT 0,
+    notes TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP,
+
+    CONSTRAINT indicator_values_pkey PRIMARY KEY (id, indicator_id)
+) PARTITION BY HASH (indicator_id);
+
+ALTER SEQUENCE indicator_values_id_seq OWNED BY indicator_values.id;
+
+CREATE TABLE indicator_values_p0 PARTITION OF indicator_values FOR VALUES WITH (MODULUS 8, REMAINDER 0);
+CREATE TABLE indicator_values_p1 PARTITION OF indicator_values FOR VALUES WITH (MODULUS 8, REMAINDER 1);
+CREATE TABLE indicator_values_p2 PARTITION OF indicator_values FOR VALUES WITH (MODULUS 8, REMAINDER 2);
+CREATE TABLE indicator_values_p3 PARTITION OF indicator_values FOR VALUES WITH (MODULUS 8, REMAINDER 3);
+CREATE TABLE indicator_values_p4 PARTITION OF indicator_values FOR VALUES WITH (MODULUS 8, REMAINDER 4);
+CREATE TABLE indicator_values_p5 PARTITION OF indicator_values FOR VALUES WITH (MODULUS 8, REMAINDER 5);
+CREATE TABLE indicator_values_p6 PARTITION OF indicator_values FOR VALUES WITH (MODULUS 8, REMAINDER 6);
+CREATE TABLE indicator_values_p7 PARTITION OF indicator_values FOR VALUES WITH (MODULUS 8, REMAINDER 7);
+
+-- Indexul creat după copiere e construit o singură dată, nu rând cu rând
+INSERT INTO indicator_values (
+    id, indicator_id, county_id, year, quarter, aggregation_level,
+    value, is_provisional, is_estimated, notes, created_at, updated_at
+)
+SELECT
+    id, indicator_id, county_id, year, quarter, aggregation_level,
+    value, is_provisional, is_estimated, notes, created_at, updated_at
+FROM indicator_values_old;
+
+CREATE UNIQUE INDEX uq_indicator_value ON indicator_values
+    (indicator_id, aggregation_level, county_id, year, quarter)
+    INCLUDE (value, is_provisional)
+    NULLS NOT DISTINCT;
+
+COMMENT ON TABLE indicator_values IS 'Valori ale indicatorilor pe dimensiuni temporale și geografice';
+
+CREATE TRIGGER trg_values_timestamp
+    BEFORE UPDATE ON indicator_values
+    FOR EACH ROW EXECUTE FUNCTION update_timestamp();
+"""
+
+LEGACY_SQL = """
+ALTER TABLE indicator_values RENAME TO indicator_values_partitioned;
+ALTER TABLE indicator_values_partitioned RENAME CONSTRAINT indicator_values_pkey TO indicator_values_partitioned_pkey;
+ALTER INDEX uq_indicator_value RENAME TO uq_indicator_value_partitioned;
+
+ALTER TABLE indicator_values_partitioned ALTER COLUMN id DROP DEFAULT;
+ALTER SEQUENCE indicator_values_id_seq OWNED BY NONE;
+
+CREATE TABLE indicator_values (
+    id INTEGER NOT NULL DEFAULT nextval('indicator_values_id_seq') PRIMARY KEY,
+    indicator_id INTEGER NOT NULL REFERENCES indicator_definitions(id) ON DELETE CASCADE,
+    county_id INTEGER REFERENCES counties(id) ON DELETE SET NULL,
+    year SMALLINT NOT NULL,
+    quarter SMALLINT,
+    aggregation_level aggregation_level NOT NULL DEFAULT 'regiune',
+    value DECIMAL(20,4) NOT NULL,
+    is_provisional SMALLINT DEFAULT 0,
+    is_estimated SMALLINT DEFAULT 0,
+    notes TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP,
+
+    CONSTRAINT uq_indicator_value UNIQUE NULLS NOT DISTINCT (indicator_id, county_id, year, quarter, aggregation_level)
+);
+
+ALTER SEQUENCE indicator_values_id_seq OWNED BY indicator_values.id;
+
+INSERT INTO indicator_values (
+    id, indicator_id, county_id, year, quarter, aggregation_level,
+    value, is_provisional, is_estimated, notes, created_at, updated_at
+)
+SELECT
+    id, indicator_id, county_id, year, quarter, aggregation_level,
+    value, is_provisional, is_estimated, notes, created_at, updated_at
+FROM indicator_values_partitioned;
+
+CREATE INDEX idx_values_indicator ON indicator_values(indicator_id);
+CREATE INDEX idx_values_county ON indicator_values(county_id);
+CREATE INDEX idx_values_year ON indicator_values(year);
+CREATE INDEX idx_values_aggregation ON indicator_values(aggregation_level);
+CREATE INDEX idx_values_lookup ON indicator_values(indicator_id, year, aggregation_level);
+
+COMMENT ON TABLE indicator_values IS 'Valori ale indicatorilor pe dimensiuni temporale și geografice';
+
+CREATE TRIGGER trg_values_timestamp
+    BEFORE UPDATE ON indicator_values
+    FOR EACH ROW EXECUTE FUNCTION update_timestamp();
+"""
+
+
+def upgrade() -> None:
+    op.execute(PARTITION_SQL)
+    op.execute(DROP_VIEWS_SQL)
+    op.execute("DROP TABLE indicator_values_old")
+    op.execute(CREATE_VIEWS_SQL)
+
+
+def downgrade() -> None:
+    op.execute(LEGACY_SQL)
+    op.execute(DROP_VIEWS_SQL)
+    op.execute("DROP TABLE indicator_values_partitioned")
+    op.execute(CREATE_VIEWS_SQL)
@@ -0,0 +1,52 @@
+"""Tabelul companies (declarat doar în modele, absent din database_schema.sql)
+
+Până acum era creat de `create_all` la pornirea API-ului, deci poate exista
+deja; în acest caz revizia doar îl preia.
+
+Revision ID: 0008_companies
+Revises: 0007_partition_values
+Create Date: 2026-10-17 10:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0008_companies"
+down_revision: Union[str, None] = "0007_partition_values"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # În modul offline (--sql) nu există conexiune de inspectat
+    if not context.is_offline_mode() and sa.inspect(op.get_bind()).has_table("companies"):
+        return
+
+    op.create_table(
+        "companies",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("company_id", sa.String(length=50), nullable=False),
+        sa.Column("county_id", sa.Integer(), nullable=False),
+        sa.Column("sector_id", sa.Integer(), nullable=False),
+        sa.Column("size_class", sa.String(length=20), nullable=True),
+        sa.Column("employees_count", sa.Integer(), nullable=True),
+        sa.Column("turnover", sa.Float(), nullable=True),
+        sa.Column("year_data", sa.Integer(), nullable=True),
+        sa.Column("is_foreign_owned", sa.Boolean(), nullable=True),
+        sa.Column("is_exporter", sa.Boolean(), nullable=True),
+        sa.Column("has_rd_activity", sa.Boolean(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["county_id"], ["counties.id"]),
+        sa.ForeignKeyConstraint(["sector_id"], ["company_sectors.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("company_id")
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("companies")
@@ -3,13 +3,41 @@ FastAPI Application Entry Point
 Automotive Vest Analytics API
 """
 
+import asyncio
+import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from contextlib import asynccontextmanager
 
 from app.config import settings
-from app.database import init_db
-from app.api.routes import indicators_router, regions_router, reports_router
+from app.database import check_schema_revision, async_engine
+from app.api.middleware import MetricsMiddleware, QueryStatsMiddleware
+from app.metrics import metrics, CONTENT_TYPE as METRICS_CONTENT_TYPE
+from app.services.cache import response_cache
+from app.services.data_import import import_log_metrics
+from app.services.indicator_registry import indicator_registry
+from app.services.report_jobs import report_queue
+from app.api.routes import indicators_router, regions_router, reports_router, analytics_router
+
+# Logurile aplicației (app.*) pe stdout, lângă cele uvicorn: linii text
+# (timp, nivel, logger), al căror mesaj e un obiect JSON pentru app.db
+_app_handler = logging.StreamHandler()
+_app_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s"))
+logging.getLogger("app").addHandler(_app_handler)
+logging.getLogger("app").setLevel(settings.log_level)
+
+# Jurnalul importurilor (import_logs) e expus doar de API, nu și de scripturi
+metrics.add_collector(import_log_metrics)
+
+
+async def purge_cache_periodically():
+    """
+    Șterge periodic intrările expirate din cache (LRU și data_cache).
+    """
+    while True:
+        await asyncio.sleep(settings.cache_purge_interval)
+        await asyncio.to_thread(response_cache.purge_expired)
 
 
 @asynccontextmanager
@@ -20,10 +48,17 @@ async def lifespan(app: FastAPI):
     """
     # Startup
     print(f"Starting {settings.app_name} v{settings.app_version}")
-    init_db()
+    # Schema e aplicată de `alembic upgrade head` la deploy, nu de fiecare worker
+    if settings.db_schema_check:
+        check_schema_revision()
+    indicator_registry.load()
+    purge_task = asyncio.create_task(purge_cache_periodically())
     yield
     # Shutdown
     print("Shutting down...")
+    purge_task.cancel()
+    report_queue.shutdown()
+    await async_engine.dispose()
 
 
 # Create FastAPI application
@@ -46,6 +81,8 @@ app = FastAPI(
     - Date regionale ADR Vest
     """,
     lifespan=lifespan,
+    # orjson serializează de câteva ori mai repede decât json din stdlib
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc"
 )
@@ -57,12 +94,22 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Headerele de instrumentare sunt citibile și din browser
+    expose_headers=["X-DB-Query-Count", "X-DB-Time-Ms", "X-DB-Slowest-Ms"],
 )
 
+# Număr de query-uri, timp DB și detectare N+1 per cerere
+if settings.db_instrumentation:
+    app.add_middleware(QueryStatsMiddleware)
+
+# Latență și număr de cereri per rută, expuse în /metrics
+app.add_middleware(MetricsMiddleware)
+
 # Include routers
 app.include_router(indicators_router, prefix=settings.api_prefix)
 app.include_router(regions_router, prefix=settings.api_prefix)
 app.include_router(reports_router, prefix=settings.api_prefix)
+app.include_router(analytics_router, prefix=settings.api_prefix)
 
 
 @app.get("/")
@@ -90,6 +137,23 @@ def health_check():
     }
 
 
+@app.get("/metrics", include_in_schema=False)
+def prometheus_metrics():
+    """
+    Metrici Prometheus: latența pe rute, query-uri per cerere, starea
+    pool-urilor de conexiuni, cache-ul și duratele importurilor.
+    """
+    return Response(content=metrics.render(), media_type=METRICS_CONTENT_TYPE)
+
+
+@app.get(f"{settings.api_prefix}/cache/stats")
+def cache_stats():
+    """
+    Contoare hit/miss pentru cache-ul de răspunsuri.
+    """
+    return response_cache.stats()
+
+
 @app.get(f"{settings.api_prefix}/info")
 def api_info():
     """
@@ -0,0 +1,181 @@
+"""
+Metrici în format Prometheus (text exposition 0.0.4)
+
+Metricile sunt per proces: cu mai mulți workeri uvicorn, fiecare expune
+propriile valori, iar agregarea se face în Prometheus.
+"""
+
+import threading
+from typing import Callable, Iterable
+
+
+# Bucket-uri implicite pentru durate (secunde)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Starlette adaugă "; charset=utf-8" pentru tipurile text/*
+CONTENT_TYPE = "text/plain; version=0.0.4"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class MetricFamily:
+    """
+    O metrică cu toate seriile ei, gata de randat. Folosit de colectori
+    pentru valorile citite la momentul scrape-ului (ex: gauge-uri).
+    """
+
+    def __init__(self, name: str, metric_type: str, documentation: str):
+        self.name = name
+        self.type = metric_type
+        self.documentation = documentation
+        self.samples: list[tuple[str, dict, float]] = []
+
+    def add(self, labels: dict, value: float, suffix: str = "") -> "MetricFamily":
+        self.samples.append((self.name + suffix, labels, value))
+        return self
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type}"
+        ]
+        for name, labels, value in self.samples:
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines)
+
+
+class Counter:
+    """Contor monoton, pe etichete."""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, *labelvalues, amount: float = 1.0):
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0.0) + amount
+
+    def collect(self) -> MetricFamily:
+        family = MetricFamily(self.name, "counter", self.documentation)
+        with self._lock:
+            for labelvalues, value in self._values.items():
+                family.add(dict(zip(self.labelnames, labelvalues)), value)
+        return family
+
+
+class Histogram:
+    """Histogramă cumulativă pe bucket-uri, pe etichete."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        self._lock = threading.Lock()
+        # etichete -> (numărători per bucket, suma, numărul de observații)
+        self._values: dict[tuple, list] = {}
+
+    def observe(self, value: float, *labelvalues):
+        with self._lock:
+            entry = self._values.get(labelvalues)
+            if entry is None:
+                entry = self._values[labelvalues] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    entry[0][i] += 1
+                    break
+            entry[1] += value
+            entry[2] += 1
+
+    def collect(self) -> MetricFamily:
+        family = MetricFamily(self.name, "histogram", self.documentation)
+        with self._lock:
+            for labelvalues, (counts, total, count) in self._values.items():
+                labels = dict(zip(self.labelnames, labelvalues))
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets, counts):
+                    cumulative += bucket_count
+                    family.add({**labels, "le": _format_value(float(bound))}, cumulative, "_bucket")
+                family.add(labels, total, "_sum")
+                family.add(labels, count, "_count")
+        return family
+
+
+class MetricsRegistry:
+    """
+    Registrul metricilor procesului: contoare și histograme actualizate
+    pe parcurs, plus colectori apelați la fiecare scrape pentru valorile
+    citite la cerere (starea pool-ului, cache-ul, jurnalul importurilor).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: list = []
+        self._collectors: list[Callable[[], list[MetricFamily]]] = []
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        metric = Counter(name, documentation, labelnames)
+        with self._lock:
+            self._metrics.append(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        metric = Histogram(name, documentation, labelnames, buckets)
+        with self._lock:
+            self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], list[MetricFamily]]):
+        """Înregistrează o funcție care întoarce metrici la fiecare scrape."""
+        with self._lock:
+            self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Toate metricile, în formatul text Prometheus."""
+        with self._lock:
+            metrics = list(self._metrics)
+            collectors = list(self._collectors)
+
+        families = [metric.collect() for metric in metrics]
+        for collector in collectors:
+            try:
+                families.extend(collector())
+            except Exception as e:
+                print(f"Error collecting metrics: {e}")
+
+        return "\n".join(f.render() for f in families if f.samples) + "\n"
+
+
+# Instanța partajată la nivel de proces
+metrics = MetricsRegistry()
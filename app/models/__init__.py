@@ -1,6 +1,10 @@
 from app.models.region import Region, County
 from app.models.indicator import IndicatorDefinition, IndicatorValue
 from app.models.company import Company, CompanySector
+from app.models.cache import DataCache
+from app.models.report import ReportLog
+from app.models.import_log import ImportLog
+from app.models.forecast import Forecast
 
 __all__ = [
     "Region",
@@ -8,5 +12,9 @@ __all__ = [
     "IndicatorDefinition",
     "IndicatorValue",
     "Company",
-    "CompanySector"
+    "CompanySector",
+    "DataCache",
+    "ReportLog",
+    "ImportLog",
+    "Forecast"
 ]
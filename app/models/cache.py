@@ -0,0 +1,31 @@
+"""
+Model pentru cache-ul de date procesate
+"""
+
+from sqlalchemy import Column, Integer, String, DateTime, Index, CheckConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class DataCache(Base):
+    """
+    Intrare în cache-ul partajat (tabelul `data_cache`).
+    Folosit ca nivel doi de ResponseCache, comun tuturor replicilor API.
+    """
+    __tablename__ = "data_cache"
+    __table_args__ = (
+        CheckConstraint("expires_at > created_at", name="chk_expiry"),
+        Index("idx_cache_key", "cache_key"),
+        Index("idx_cache_expiry", "expires_at"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    cache_key = Column(String(200), nullable=False, unique=True)
+    cache_data = Column(JSONB, nullable=False)
+
+    created_at = Column(DateTime, server_default=func.now())
+    expires_at = Column(DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<DataCache(cache_key='{self.cache_key}', expires_at={self.expires_at})>"
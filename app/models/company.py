@@ -2,7 +2,10 @@
 Modele pentru companii și sectoare
 """
 
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, Text, DateTime, Boolean
+from sqlalchemy import (
+    Column, Integer, SmallInteger, String, Float, Numeric, ForeignKey, Text, DateTime, Boolean,
+    Index, UniqueConstraint
+)
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -13,8 +16,12 @@ class CompanySector(Base):
     Subsector din industria automotive
     """
     __tablename__ = "company_sectors"
+    __table_args__ = (
+        Index("idx_sectors_caen", "caen_code"),
+        Index("idx_sectors_subsector", "subsector"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
 
     # Identificare CAEN
     caen_code = Column(String(10), nullable=False, unique=True)
@@ -27,6 +34,8 @@ class CompanySector(Base):
     # Descriere
     description = Column(Text, nullable=True)
 
+    created_at = Column(DateTime, server_default=func.now())
+
     # Relații
     companies = relationship("Company", back_populates="sector")
 
@@ -41,7 +50,7 @@ class Company(Base):
     """
     __tablename__ = "companies"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
 
     # Identificare (anonimizată pentru date publice)
     company_id = Column(String(50), nullable=False, unique=True)  # ID intern, nu CUI
@@ -83,20 +92,25 @@ class AggregatedCompanyData(Base):
     Pentru a evita stocarea datelor individuale sensibile
     """
     __tablename__ = "aggregated_company_data"
+    __table_args__ = (
+        UniqueConstraint("county_id", "sector_id", "year", name="uq_aggregated_data"),
+        Index("idx_agg_county_year", "county_id", "year"),
+        Index("idx_agg_sector", "sector_id"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
 
     # Dimensiuni
-    county_id = Column(Integer, ForeignKey("counties.id"), nullable=False)
-    sector_id = Column(Integer, ForeignKey("company_sectors.id"), nullable=True)
-    year = Column(Integer, nullable=False, index=True)
+    county_id = Column(Integer, ForeignKey("counties.id", ondelete="CASCADE"), nullable=False)
+    sector_id = Column(Integer, ForeignKey("company_sectors.id", ondelete="SET NULL"), nullable=True)
+    year = Column(SmallInteger, nullable=False)
 
     # Metrici agregate
     total_companies = Column(Integer, nullable=True)
     total_employees = Column(Integer, nullable=True)
-    total_turnover = Column(Float, nullable=True)
-    average_employees = Column(Float, nullable=True)
-    average_turnover = Column(Float, nullable=True)
+    total_turnover = Column(Numeric(18, 2, asdecimal=False), nullable=True)  # în EUR
+    average_employees = Column(Numeric(10, 2, asdecimal=False), nullable=True)
+    average_turnover = Column(Numeric(18, 2, asdecimal=False), nullable=True)
 
     # Distribuție pe dimensiune
     micro_companies = Column(Integer, nullable=True)  # <10 angajați
@@ -105,8 +119,8 @@ class AggregatedCompanyData(Base):
     large_companies = Column(Integer, nullable=True)  # 250+
 
     # Indicatori derivați
-    hhi_index = Column(Float, nullable=True)  # Indice Herfindahl-Hirschman
-    concentration_ratio_top5 = Column(Float, nullable=True)  # CR5
+    hhi_index = Column(Numeric(10, 4, asdecimal=False), nullable=True)  # Indice Herfindahl-Hirschman
+    concentration_ratio_top5 = Column(Numeric(5, 2, asdecimal=False), nullable=True)  # CR5
 
     # Timestamps
     created_at = Column(DateTime, server_default=func.now())
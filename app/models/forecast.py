@@ -0,0 +1,50 @@
+"""
+Model pentru prognozele indicatorilor
+"""
+
+from sqlalchemy import Column, Integer, SmallInteger, String, Float, ForeignKey, DateTime, Index, UniqueConstraint
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class Forecast(Base):
+    """
+    Valoarea prognozată a unui indicator pentru un an viitor, cu intervalul
+    de predicție (tabelul `forecasts`). Un rând per serie × metodă × an.
+    """
+    __tablename__ = "forecasts"
+    __table_args__ = (
+        UniqueConstraint(
+            "indicator_id", "county_id", "aggregation_level", "method", "year",
+            name="uq_forecast",
+            postgresql_nulls_not_distinct=True
+        ),
+        Index("idx_forecasts_series", "indicator_id", "aggregation_level", "county_id"),
+    )
+
+    id = Column(Integer, primary_key=True)
+
+    # Seria prognozată
+    indicator_id = Column(Integer, ForeignKey("indicator_definitions.id", ondelete="CASCADE"), nullable=False)
+    county_id = Column(Integer, ForeignKey("counties.id", ondelete="CASCADE"), nullable=True)  # Null pentru nivel regional/național
+    aggregation_level = Column(String(20), nullable=False)  # "judet", "regiune", "tara", "ue"
+
+    # Metoda: "linear", "ets", "arima"
+    method = Column(String(20), nullable=False)
+
+    # Prognoza
+    year = Column(SmallInteger, nullable=False)
+    value = Column(Float, nullable=False)
+    lower_bound = Column(Float, nullable=True)
+    upper_bound = Column(Float, nullable=True)
+    confidence_level = Column(Float, nullable=False, default=0.95)
+
+    # Calitatea ajustării
+    n_observations = Column(Integer, nullable=True)  # Ani istorici folosiți
+    last_observed_year = Column(SmallInteger, nullable=True)
+    aic = Column(Float, nullable=True)
+
+    created_at = Column(DateTime, server_default=func.now())
+
+    def __repr__(self):
+        return f"<Forecast(indicator={self.indicator_id}, method='{self.method}', year={self.year})>"
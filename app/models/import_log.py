@@ -0,0 +1,38 @@
+"""
+Model pentru jurnalul importurilor de date
+"""
+
+from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Index
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class ImportLog(Base):
+    """
+    Rezultatul unui import (tabelul `import_logs`).
+    """
+    __tablename__ = "import_logs"
+    __table_args__ = (
+        Index("idx_imports_source", "source"),
+        Index("idx_imports_date", "import_date"),
+    )
+
+    id = Column(Integer, primary_key=True)
+
+    source = Column(String(50), nullable=False)  # "INS", "Eurostat", "CSV"
+    source_identifier = Column(String(100), nullable=True)  # cod matrice/dataset
+    import_date = Column(DateTime, server_default=func.now())
+
+    records_imported = Column(Integer, nullable=True)
+    records_updated = Column(Integer, nullable=True)
+    records_failed = Column(Integer, nullable=True)
+    duration_seconds = Column(Float, nullable=True)  # durata totală a importului
+
+    status = Column(String(20), default="completed")
+    error_message = Column(Text, nullable=True)
+    # `metadata` este rezervat în clasele declarative SQLAlchemy
+    extra = Column("metadata", JSONB, nullable=True)
+
+    def __repr__(self):
+        return f"<ImportLog(source='{self.source}', imported={self.records_imported})>"
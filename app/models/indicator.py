@@ -2,13 +2,17 @@
 Modele pentru indicatori statistici
 """
 
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, Enum, Text, DateTime
+from sqlalchemy import Column, Integer, SmallInteger, String, Numeric, ForeignKey, Enum, Text, DateTime, Index, DDL, event
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
 import enum
 
 
+# Numărul de partiții HASH (indicator_id) ale indicator_values
+INDICATOR_VALUE_PARTITIONS = 8
+
+
 class IndicatorCategory(enum.Enum):
     """Categorii de indicatori"""
     ECONOMIC_STRUCTURE = "structura_economica"
@@ -38,13 +42,25 @@ class AggregationLevel(enum.Enum):
     EU = "ue"
 
 
+def _enum_values(enum_class) -> list[str]:
+    """
+    Tipurile ENUM din PostgreSQL conțin valorile ('judet'), nu numele
+    membrilor ('COUNTY'), pe care SQLAlchemy le-ar folosi implicit.
+    """
+    return [member.value for member in enum_class]
+
+
 class IndicatorDefinition(Base):
     """
     Definiția unui indicator statistic
     """
     __tablename__ = "indicator_definitions"
+    __table_args__ = (
+        Index("idx_indicators_code", "code"),
+        Index("idx_indicators_category", "category"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
 
     # Identificare
     code = Column(String(50), nullable=False, unique=True)  # ex: "IND_001"
@@ -56,21 +72,21 @@ class IndicatorDefinition(Base):
     methodology = Column(Text, nullable=True)  # Metodologie de calcul
 
     # Clasificare
-    category = Column(Enum(IndicatorCategory), nullable=False)
-    unit = Column(Enum(IndicatorUnit), nullable=False)
+    category = Column(Enum(IndicatorCategory, name="indicator_category", values_callable=_enum_values), nullable=False)
+    unit = Column(Enum(IndicatorUnit, name="indicator_unit", values_callable=_enum_values), nullable=False)
 
     # Sursă
     data_source = Column(String(100), nullable=True)  # ex: "INS", "Eurostat"
     source_code = Column(String(100), nullable=True)  # Cod indicator la sursă
 
     # Metadate
-    is_calculated = Column(Integer, default=0)  # 1 dacă e calculat din alți indicatori
+    is_calculated = Column(SmallInteger, default=0)  # 1 dacă e calculat din alți indicatori
     formula = Column(Text, nullable=True)  # Formula de calcul (dacă e cazul)
     update_frequency = Column(String(50), nullable=True)  # ex: "anual", "trimestrial"
 
     # Praguri pentru alerte
-    warning_threshold_low = Column(Float, nullable=True)
-    warning_threshold_high = Column(Float, nullable=True)
+    warning_threshold_low = Column(Numeric(15, 4, asdecimal=False), nullable=True)
+    warning_threshold_high = Column(Numeric(15, 4, asdecimal=False), nullable=True)
 
     # Timestamps
     created_at = Column(DateTime, server_default=func.now())
@@ -88,26 +104,45 @@ class IndicatorValue(Base):
     Valoare a unui indicator pentru un an și locație specifică
     """
     __tablename__ = "indicator_values"
-
-    id = Column(Integer, primary_key=True, index=True)
+    __table_args__ = (
+        # Singurul index: pe forma citirilor calde, acoperitor și țintă pentru
+        # INSERT ... ON CONFLICT. NULLS NOT DISTINCT: valorile regionale/anuale
+        # (county_id / quarter NULL) sunt unice
+        Index(
+            "uq_indicator_value",
+            "indicator_id", "aggregation_level", "county_id", "year", "quarter",
+            unique=True,
+            postgresql_include=["value", "is_provisional"],
+            postgresql_nulls_not_distinct=True
+        ),
+        {"postgresql_partition_by": "HASH (indicator_id)"},
+    )
+
+    # Cheia primară include cheia de partiționare (cerință PostgreSQL)
+    id = Column(Integer, primary_key=True, autoincrement=True)
 
     # Foreign keys
-    indicator_id = Column(Integer, ForeignKey("indicator_definitions.id"), nullable=False)
-    county_id = Column(Integer, ForeignKey("counties.id"), nullable=True)  # Null pentru nivel regional/național
+    indicator_id = Column(Integer, ForeignKey("indicator_definitions.id", ondelete="CASCADE"), primary_key=True)
+    county_id = Column(Integer, ForeignKey("counties.id", ondelete="SET NULL"), nullable=True)  # Null pentru nivel regional/național
 
     # Dimensiuni temporale
-    year = Column(Integer, nullable=False, index=True)
-    quarter = Column(Integer, nullable=True)  # 1-4, null pentru date anuale
+    year = Column(SmallInteger, nullable=False)
+    quarter = Column(SmallInteger, nullable=True)  # 1-4, null pentru date anuale
 
     # Nivel de agregare
-    aggregation_level = Column(Enum(AggregationLevel), nullable=False, default=AggregationLevel.COUNTY)
+    aggregation_level = Column(
+        Enum(AggregationLevel, name="aggregation_level", values_callable=_enum_values),
+        nullable=False,
+        default=AggregationLevel.COUNTY
+    )
 
     # Valoarea propriu-zisă
-    value = Column(Float, nullable=False)
+    # DECIMAL(20,4) în baza de date, float în Python
+    value = Column(Numeric(20, 4, asdecimal=False), nullable=False)
 
     # Metadate despre valoare
-    is_provisional = Column(Integer, default=0)  # Date provizorii
-    is_estimated = Column(Integer, default=0)  # Date estimate/interpolate
+    is_provisional = Column(SmallInteger, default=0)  # Date provizorii
+    is_estimated = Column(SmallInteger, default=0)  # Date estimate/interpolate
     notes = Column(Text, nullable=True)
 
     # Timestamps
@@ -120,3 +155,15 @@ class IndicatorValue(Base):
 
     def __repr__(self):
         return f"<IndicatorValue(indicator_id={self.indicator_id}, year={self.year}, value={self.value})>"
+
+
+# Partițiile HASH, create odată cu tabelul (create_all pe o bază nouă)
+for remainder in range(INDICATOR_VALUE_PARTITIONS):
+    event.listen(
+        IndicatorValue.__table__,
+        "after_create",
+        DDL(
+            f"CREATE TABLE IF NOT EXISTS indicator_values_p{remainder} PARTITION OF indicator_values "
+            f"FOR VALUES WITH (MODULUS {INDICATOR_VALUE_PARTITIONS}, REMAINDER {remainder})"
+        ).execute_if(dialect="postgresql")
+    )
@@ -2,8 +2,9 @@
 Modele pentru regiuni și județe
 """
 
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, Numeric, ForeignKey, Boolean, DateTime, Index
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 from app.database import Base
 
 
@@ -13,13 +14,17 @@ class Region(Base):
     """
     __tablename__ = "regions"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String(100), nullable=False, unique=True)
     code = Column(String(10), nullable=False, unique=True)  # ex: "RO42" pentru Vest
 
     # Coordonate pentru centrul regiunii (pentru hărți)
-    latitude = Column(Float, nullable=True)
-    longitude = Column(Float, nullable=True)
+    latitude = Column(Numeric(9, 6, asdecimal=False), nullable=True)
+    longitude = Column(Numeric(9, 6, asdecimal=False), nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, onupdate=func.now())
 
     # Relații
     counties = relationship("County", back_populates="region")
@@ -33,25 +38,33 @@ class County(Base):
     Județ din cadrul unei regiuni
     """
     __tablename__ = "counties"
+    __table_args__ = (
+        Index("idx_counties_region", "region_id"),
+        Index("idx_counties_code", "code"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String(100), nullable=False)
     code = Column(String(10), nullable=False, unique=True)  # ex: "TM", "AR"
 
     # Foreign key către regiune
-    region_id = Column(Integer, ForeignKey("regions.id"), nullable=False)
+    region_id = Column(Integer, ForeignKey("regions.id", ondelete="CASCADE"), nullable=False)
 
     # Coordonate pentru centrul județului
-    latitude = Column(Float, nullable=True)
-    longitude = Column(Float, nullable=True)
+    latitude = Column(Numeric(9, 6, asdecimal=False), nullable=True)
+    longitude = Column(Numeric(9, 6, asdecimal=False), nullable=True)
 
     # Populație și suprafață (date de bază)
     population = Column(Integer, nullable=True)
-    area_km2 = Column(Float, nullable=True)
+    area_km2 = Column(Numeric(10, 2, asdecimal=False), nullable=True)
 
     # Flag pentru județe cu activitate automotive semnificativă
     is_automotive_hub = Column(Boolean, default=False)
 
+    # Timestamps
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, onupdate=func.now())
+
     # Relații
     region = relationship("Region", back_populates="counties")
     indicator_values = relationship("IndicatorValue", back_populates="county")
@@ -0,0 +1,47 @@
+"""
+Model pentru jurnalul rapoartelor generate
+"""
+
+import uuid
+from sqlalchemy import Column, Integer, String, Text, DateTime, SmallInteger, Index, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class ReportLog(Base):
+    """
+    Job de generare raport (tabelul `report_logs`).
+    Starea evoluează: queued -> running -> completed / failed.
+    """
+    __tablename__ = "report_logs"
+    __table_args__ = (
+        Index("idx_reports_type", "report_type"),
+        Index("idx_reports_date", "generated_at"),
+        Index("idx_reports_params", "params_hash", "status"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    report_id = Column(
+        UUID(as_uuid=True), nullable=False, unique=True,
+        default=uuid.uuid4, server_default=text("uuid_generate_v4()")
+    )
+
+    # Parametri
+    report_type = Column(String(50), nullable=False)  # ex: "custom"
+    title = Column(String(200), nullable=True)
+    format = Column(String(10), nullable=False, default="pdf")  # "pdf", "xlsx"
+    parameters = Column(JSONB, nullable=True)
+    params_hash = Column(String(64), nullable=True)  # pentru deduplicare
+
+    # Stare
+    status = Column(String(20), default="queued")
+    progress = Column(SmallInteger, default=0)  # 0-100
+    error_message = Column(Text, nullable=True)
+    file_path = Column(String(500), nullable=True)
+
+    generated_at = Column(DateTime, server_default=func.now())
+    completed_at = Column(DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<ReportLog(report_id='{self.report_id}', status='{self.status}')>"
@@ -0,0 +1,64 @@
+"""
+Materialized views pentru raportare (definite în database_schema.sql)
+"""
+
+from sqlalchemy import Column, Integer, SmallInteger, String, Float, MetaData, Table
+
+# MetaData separat: view-urile nu trebuie create de `Base.metadata.create_all`
+reporting_metadata = MetaData()
+
+
+# Un rând per valoare, cu definiția și locația denormalizate
+indicator_data_view = Table(
+    "mv_indicator_data", reporting_metadata,
+    Column("id", Integer, primary_key=True),
+    Column("indicator_id", Integer),
+    Column("indicator_code", String(50)),
+    Column("indicator_name", String(200)),
+    Column("category", String(50)),
+    Column("unit", String(50)),
+    Column("county_id", Integer),
+    Column("county_name", String(100)),
+    Column("county_code", String(10)),
+    Column("region_name", String(100)),
+    Column("year", Integer),
+    Column("quarter", Integer),
+    Column("aggregation_level", String(20)),
+    Column("value", Float),
+    Column("is_provisional", SmallInteger),
+    Column("is_estimated", SmallInteger)
+)
+
+# Un rând per an cu KPI-urile regionale principale pe coloane
+kpi_summary_view = Table(
+    "mv_kpi_summary", reporting_metadata,
+    Column("year", Integer, primary_key=True),
+    Column("total_companies", Float),
+    Column("total_employees", Float),
+    Column("total_turnover", Float),
+    Column("total_exports", Float),
+    Column("productivity", Float)
+)
+
+# Valorile la nivel de județ, raportate la media județelor din aceeași perioadă
+county_comparison_view = Table(
+    "mv_county_comparison", reporting_metadata,
+    Column("value_id", Integer, primary_key=True),
+    Column("county_name", String(100)),
+    Column("county_code", String(10)),
+    Column("indicator_code", String(50)),
+    Column("indicator_name", String(200)),
+    Column("year", Integer),
+    Column("quarter", Integer),
+    Column("value", Float),
+    Column("vs_average_pct", Float)
+)
+
+# Coloana din mv_kpi_summary pentru fiecare cod de indicator
+KPI_SUMMARY_COLUMNS = {
+    "TOTAL_COMPANIES": "total_companies",
+    "TOTAL_EMPLOYEES": "total_employees",
+    "TOTAL_TURNOVER": "total_turnover",
+    "TOTAL_EXPORTS": "total_exports",
+    "PRODUCTIVITY": "productivity"
+}
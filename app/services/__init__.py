@@ -1,8 +1,44 @@
 """
 Business Logic Services
+
+Exporturile sunt rezolvate la primul acces (PEP 562): `import app.services.cache`
+nu mai încarcă și stiva de analiză (pandas, numpy, scipy) sau de import.
 """
 
-from app.services.analytics import AnalyticsService
-from app.services.data_import import DataImportService
+import importlib
+
+# Numele exportate -> modulul care le definește
+_EXPORTS = {
+    "AnalyticsService": "app.services.analytics",
+    "DataImportService": "app.services.data_import",
+    "KPIService": "app.services.kpi",
+    "IndicatorRegistry": "app.services.indicator_registry",
+    "indicator_registry": "app.services.indicator_registry",
+    "ResponseCache": "app.services.cache",
+    "response_cache": "app.services.cache",
+    "cached": "app.services.cache",
+    "ReportJobQueue": "app.services.report_jobs",
+    "report_queue": "app.services.report_jobs",
+    "CountyTable": "app.services.normalize",
+    "county_table": "app.services.normalize",
+    "normalize_values": "app.services.normalize",
+    "melt_year_columns": "app.services.normalize",
+    "refresh_reporting_views": "app.services.reporting_views",
+    "ForecastingService": "app.services.forecasting",
+    "FORECAST_METHODS": "app.services.forecasting"
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = ["AnalyticsService", "DataImportService"]
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,14 +2,19 @@
 Serviciu pentru calcule și analize statistice
 """
 
-import pandas as pd
-import numpy as np
-from scipy import stats
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+from sqlalchemy import Float, func
 from sqlalchemy.orm import Session
 
-from app.models.indicator import IndicatorDefinition, IndicatorValue, AggregationLevel
-from app.models.region import County
+from app.models.indicator import AggregationLevel
+from app.models.reporting import indicator_data_view, county_comparison_view
+from app.services.cache import cached
+from app.services.indicator_registry import indicator_registry
+
+# numpy, pandas și scipy se importă în metodele care le folosesc: modulul
+# e încărcat la pornirea fiecărui worker, iar stiva numerică doar la nevoie
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class AnalyticsService:
@@ -96,6 +101,7 @@ class AnalyticsService:
             return 0.0
         return (pow(end_value / start_value, 1 / years) - 1) * 100
 
+    @cached("analytics.timeseries_stats", ttl=3600)
     def get_timeseries_stats(
         self,
         indicator_code: str,
@@ -106,21 +112,22 @@ class AnalyticsService:
         """
         Calculează statistici descriptive pentru o serie temporală.
         """
-        indicator = self.db.query(IndicatorDefinition).filter(
-            IndicatorDefinition.code == indicator_code
-        ).first()
+        import numpy as np
+
+        indicator = indicator_registry.get(indicator_code)
 
         if not indicator:
             return {}
 
-        query = self.db.query(IndicatorValue.value).filter(
-            IndicatorValue.indicator_id == indicator.id,
-            IndicatorValue.year >= start_year,
-            IndicatorValue.year <= end_year
+        data = indicator_data_view.c
+        query = self.db.query(data.value).filter(
+            data.indicator_code == indicator.code,
+            data.year >= start_year,
+            data.year <= end_year
         )
 
         if county_code:
-            query = query.join(County).filter(County.code == county_code)
+            query = query.filter(data.county_code == county_code)
 
         values = [v[0] for v in query.all()]
 
@@ -128,18 +135,85 @@ class AnalyticsService:
             return {}
 
         arr = np.array(values)
+        mean, std = float(arr.mean()), float(arr.std())
+        low, high = float(arr.min()), float(arr.max())
 
         return {
             "count": len(values),
-            "mean": float(np.mean(arr)),
+            "mean": mean,
             "median": float(np.median(arr)),
-            "std": float(np.std(arr)),
-            "min": float(np.min(arr)),
-            "max": float(np.max(arr)),
-            "range": float(np.max(arr) - np.min(arr)),
-            "cv": float(np.std(arr) / np.mean(arr) * 100) if np.mean(arr) != 0 else 0
+            "std": std,
+            "min": low,
+            "max": high,
+            "range": high - low,
+            "cv": std / mean * 100 if mean != 0 else 0
         }
 
+    @cached("analytics.batch_statistics", ttl=86400)
+    def batch_statistics(
+        self,
+        start_year: int = 2010,
+        end_year: int = 2024,
+        indicator_codes: Optional[list[str]] = None
+    ) -> list[dict]:
+        """
+        Statistici descriptive pentru toate combinațiile indicator × județ ×
+        nivel de agregare, calculate într-un singur query grupat
+        (percentile_cont pentru mediană, stddev_pop pentru abaterea standard).
+        Doar valorile anuale: cele trimestriale nu sunt comparabile cu ele
+        și ar amesteca perioade diferite în aceeași serie.
+
+        Rezultatul rămâne în cache până la următorul import, care golește
+        cache-ul de răspunsuri.
+        """
+        data = indicator_data_view.c
+        mean = func.avg(data.value, type_=Float)
+        std = func.stddev_pop(data.value, type_=Float)
+
+        query = self.db.query(
+            data.indicator_code,
+            data.county_code,
+            data.aggregation_level,
+            func.count(data.value).label("count"),
+            mean.label("mean"),
+            func.percentile_cont(0.5).within_group(data.value).label("median"),
+            std.label("std"),
+            func.min(data.value).label("min"),
+            func.max(data.value).label("max")
+        ).filter(
+            data.year >= start_year,
+            data.year <= end_year,
+            data.quarter.is_(None),
+            data.value.isnot(None)
+        )
+
+        if indicator_codes:
+            query = query.filter(data.indicator_code.in_(indicator_codes))
+
+        rows = query.group_by(
+            data.indicator_code, data.county_code, data.aggregation_level
+        ).order_by(
+            data.indicator_code, data.aggregation_level, data.county_code
+        ).all()
+
+        return [
+            {
+                "indicator_code": r.indicator_code,
+                "county_code": r.county_code,
+                "aggregation_level": r.aggregation_level,
+                "count": r.count,
+                "mean": r.mean,
+                "median": r.median,
+                "std": r.std,
+                "min": r.min,
+                "max": r.max,
+                "range": r.max - r.min,
+                "cv": r.std / r.mean * 100 if r.mean else 0
+            }
+            for r in rows
+        ]
+
+    @cached("analytics.correlation", ttl=3600)
     def calculate_correlation(
         self,
         indicator_code_1: str,
@@ -150,33 +224,33 @@ class AnalyticsService:
         """
         Calculează corelația între doi indicatori.
         """
-        ind1 = self.db.query(IndicatorDefinition).filter(
-            IndicatorDefinition.code == indicator_code_1
-        ).first()
-        ind2 = self.db.query(IndicatorDefinition).filter(
-            IndicatorDefinition.code == indicator_code_2
-        ).first()
+        import numpy as np
+        from scipy import stats
+
+        ind1 = indicator_registry.get(indicator_code_1)
+        ind2 = indicator_registry.get(indicator_code_2)
 
         if not ind1 or not ind2:
             return {"error": "Indicator not found"}
 
         # Get values for both indicators
+        data = indicator_data_view.c
         values1 = self.db.query(
-            IndicatorValue.year, IndicatorValue.value
+            data.year, data.value
         ).filter(
-            IndicatorValue.indicator_id == ind1.id,
-            IndicatorValue.year >= start_year,
-            IndicatorValue.year <= end_year,
-            IndicatorValue.aggregation_level == AggregationLevel.REGION
+            data.indicator_code == ind1.code,
+            data.year >= start_year,
+            data.year <= end_year,
+            data.aggregation_level == AggregationLevel.REGION.value
         ).all()
 
         values2 = self.db.query(
-            IndicatorValue.year, IndicatorValue.value
+            data.year, data.value
         ).filter(
-            IndicatorValue.indicator_id == ind2.id,
-            IndicatorValue.year >= start_year,
-            IndicatorValue.year <= end_year,
-            IndicatorValue.aggregation_level == AggregationLevel.REGION
+            data.indicator_code == ind2.code,
+            data.year >= start_year,
+            data.year <= end_year,
+            data.aggregation_level == AggregationLevel.REGION.value
         ).all()
 
         # Align by year
@@ -202,6 +276,92 @@ class AnalyticsService:
             "interpretation": self._interpret_correlation(correlation)
         }
 
+    @cached("analytics.correlation_matrix", ttl=3600)
+    def correlation_matrix(
+        self,
+        indicator_codes: list[str],
+        start_year: int = 2010,
+        end_year: int = 2024,
+        aggregation_level: AggregationLevel = AggregationLevel.REGION,
+        county_code: Optional[str] = None,
+        method: str = "pearson"
+    ) -> dict:
+        """
+        Matricea de corelație (Pearson sau Spearman) între mai mulți indicatori.
+
+        Toate seriile sunt citite într-un singur query și pivotate într-o
+        matrice an × indicator. Se folosesc doar valorile anuale: cele
+        trimestriale ar fi mediate împreună cu valoarea anuală a aceluiași an.
+        Fiecare pereche folosește doar anii în care ambii indicatori au
+        valori (pairwise-complete); p-valorile provin din testul t bilateral.
+        """
+        import numpy as np
+        import pandas as pd
+
+        definitions = indicator_registry.get_many(indicator_codes)
+
+        if len(definitions) < 2:
+            return {"error": "At least two known indicators are required"}
+
+        data = indicator_data_view.c
+        query = self.db.query(
+            data.year, data.indicator_code, data.value
+        ).filter(
+            data.indicator_code.in_(list(definitions)),
+            data.aggregation_level == aggregation_level.value,
+            data.quarter.is_(None),
+            data.year >= start_year,
+            data.year <= end_year
+        )
+
+        if county_code:
+            query = query.filter(data.county_code == county_code)
+
+        df = pd.DataFrame(query.all(), columns=["year", "indicator_code", "value"])
+
+        if df.empty:
+            return {"error": "No data available"}
+
+        matrix = df.pivot_table(
+            index="year", columns="indicator_code", values="value", aggfunc="mean"
+        ).reindex(columns=list(definitions))
+
+        values = matrix.to_numpy(dtype=float)
+        k = values.shape[1]
+
+        if method == "spearman":
+            # Pentru perechea (i, j), seria i este rangată doar pe anii în care
+            # există și j: un singur apel rank pe toate cele k măști
+            masked = np.where(
+                ~np.isnan(values).T[:, :, None], values[None, :, :], np.nan
+            )  # [j, an, i]
+            ranks = pd.DataFrame(
+                masked.transpose(1, 0, 2).reshape(values.shape[0], k * k)
+            ).rank().to_numpy().reshape(values.shape[0], k, k)  # [an, j, i]
+            a = ranks.transpose(0, 2, 1)  # [an, i, j] = rang x_i pe anii lui j
+        else:
+            a = np.broadcast_to(values[:, :, None], (values.shape[0], k, k))
+        b = a.transpose(0, 2, 1)
+
+        r, n = _pairwise_pearson(a, b)
+        p_values = _correlation_p_values(r, n)
+
+        def to_list(arr, digits=4):
+            return [
+                [None if np.isnan(v) else round(float(v), digits) for v in row]
+                for row in arr
+            ]
+
+        return {
+            "method": method,
+            "indicators": list(definitions),
+            "missing_indicators": [c for c in indicator_codes if c not in definitions],
+            "years": [int(y) for y in matrix.index],
+            "matrix": to_list(r),
+            "p_values": to_list(p_values),
+            "n_observations": n.astype(int).tolist()
+        }
+
     def _interpret_correlation(self, r: float) -> str:
         """Interpretare corelație Pearson."""
         abs_r = abs(r)
@@ -218,6 +378,7 @@ class AnalyticsService:
         else:
             return f"Corelație {direction} foarte puternică"
 
+    @cached("analytics.forecast", ttl=3600)
     def forecast_simple(
         self,
         indicator_code: str,
@@ -231,19 +392,21 @@ class AnalyticsService:
         - linear: Regresie liniară
         - average: Media ultimilor 3 ani
         """
-        indicator = self.db.query(IndicatorDefinition).filter(
-            IndicatorDefinition.code == indicator_code
-        ).first()
+        import numpy as np
+        from scipy import stats
+
+        indicator = indicator_registry.get(indicator_code)
 
         if not indicator:
             return {"error": "Indicator not found"}
 
+        data = indicator_data_view.c
         values = self.db.query(
-            IndicatorValue.year, IndicatorValue.value
+            data.year, data.value
         ).filter(
-            IndicatorValue.indicator_id == indicator.id,
-            IndicatorValue.aggregation_level == AggregationLevel.REGION
-        ).order_by(IndicatorValue.year).all()
+            data.indicator_code == indicator.code,
+            data.aggregation_level == AggregationLevel.REGION.value
+        ).order_by(data.year).all()
 
         if len(values) < 5:
             return {"error": "Not enough historical data"}
@@ -273,6 +436,7 @@ class AnalyticsService:
             "confidence": round(confidence, 2)
         }
 
+    @cached("analytics.compare_counties", ttl=3600)
     def compare_counties(
         self,
         indicator_code: str,
@@ -281,22 +445,21 @@ class AnalyticsService:
         """
         Comparație între județe pentru un indicator.
         """
-        indicator = self.db.query(IndicatorDefinition).filter(
-            IndicatorDefinition.code == indicator_code
-        ).first()
+        import numpy as np
+
+        indicator = indicator_registry.get(indicator_code)
 
         if not indicator:
             return {"error": "Indicator not found"}
 
+        comparison = county_comparison_view.c
         values = self.db.query(
-            County.name,
-            County.code,
-            IndicatorValue.value
-        ).join(
-            IndicatorValue, County.id == IndicatorValue.county_id
+            comparison.county_name.label("name"),
+            comparison.county_code.label("code"),
+            comparison.value
         ).filter(
-            IndicatorValue.indicator_id == indicator.id,
-            IndicatorValue.year == year
+            comparison.indicator_code == indicator.code,
+            comparison.year == year
         ).all()
 
         if not values:
@@ -321,3 +484,41 @@ class AnalyticsService:
             "regional_average": round(avg, 2),
             "counties": data
         }
+
+
+def _pairwise_pearson(a: "np.ndarray", b: "np.ndarray") -> tuple["np.ndarray", "np.ndarray"]:
+    """
+    Corelația Pearson pentru fiecare pereche (i, j), calculată pe axa 0
+    doar pe observațiile prezente în ambele serii.
+    Returnează (r, n) ca matrice k × k.
+    """
+    import numpy as np
+
+    mask = ~(np.isnan(a) | np.isnan(b))
+    n = mask.sum(axis=0).astype(float)
+    a0 = np.where(mask, a, 0.0)
+    b0 = np.where(mask, b, 0.0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_a = a0.sum(axis=0) / n
+        mean_b = b0.sum(axis=0) / n
+        da = np.where(mask, a0 - mean_a, 0.0)
+        db = np.where(mask, b0 - mean_b, 0.0)
+        cov = (da * db).sum(axis=0)
+        r = cov / np.sqrt((da ** 2).sum(axis=0) * (db ** 2).sum(axis=0))
+
+    r = np.clip(r, -1.0, 1.0)
+    r[n < 3] = np.nan
+    return r, n
+
+
+def _correlation_p_values(r: "np.ndarray", n: "np.ndarray") -> "np.ndarray":
+    """P-valori bilaterale pentru coeficienții r (test t cu n - 2 grade de libertate)."""
+    import numpy as np
+    from scipy import stats
+
+    dof = n - 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = r * np.sqrt(dof / (1.0 - r ** 2))
+    p = 2 * stats.t.sf(np.abs(t), np.where(dof > 0, dof, np.nan))
+    return np.where(np.abs(r) == 1.0, 0.0, p)
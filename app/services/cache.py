@@ -0,0 +1,329 @@
+"""
+Cache pe două niveluri pentru răspunsuri și calcule costisitoare
+"""
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Any, Callable, Optional
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from app.config import settings
+from app.database import SessionLocal
+from app.metrics import metrics, MetricFamily
+from app.models.cache import DataCache
+
+
+# Parametri care nu fac parte din cheia de cache
+_IGNORED_PARAMS = {"self", "db"}
+
+_MISSING = object()
+
+
+class ResponseCache:
+    """
+    Cache pe două niveluri:
+    - nivel unu: LRU in-process, limitat ca număr de intrări;
+    - nivel doi: tabelul `data_cache`, partajat între replicile API.
+
+    Valorile sunt stocate în formă JSON (după `jsonable_encoder`), astfel
+    încât un rezultat citit din oricare nivel arată la fel. Erorile
+    nivelului doi sunt raportate și ignorate: cache-ul nu blochează cererea.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        max_entries: int = settings.cache_max_entries,
+        memory_ttl: int = settings.cache_memory_ttl,
+        enabled: bool = settings.cache_enabled
+    ):
+        self._session_factory = session_factory
+        self._max_entries = max_entries
+        self._memory_ttl = memory_ttl
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._stats = {
+            "memory_hits": 0,
+            "db_hits": 0,
+            "misses": 0,
+            "db_errors": 0
+        }
+
+    # ==================== CHEI ====================
+
+    @staticmethod
+    def make_key(namespace: str, params: dict) -> str:
+        """
+        Cheie deterministă pentru un namespace și un set de parametri.
+        Parametrii sunt hash-uiți ca cheia să încapă în VARCHAR(200).
+        """
+        payload = json.dumps(jsonable_encoder(params), sort_keys=True)
+        digest = hashlib.sha1(payload.encode("utf-8")).hexdigest()
+        return f"{namespace}:{digest}"
+
+    # ==================== NIVEL UNU (LRU) ====================
+
+    def _memory_get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISSING
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return _MISSING
+            self._entries.move_to_end(key)
+            return value
+
+    def _memory_set(self, key: str, value: Any, ttl: int):
+        expires_at = time.monotonic() + min(ttl, self._memory_ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    # ==================== NIVEL DOI (data_cache) ====================
+
+    def _db_get(self, key: str) -> Any:
+        db = self._session_factory()
+        try:
+            row = db.query(DataCache.cache_data).filter(
+                DataCache.cache_key == key,
+                DataCache.expires_at > func.now()
+            ).first()
+            return row.cache_data if row else _MISSING
+        except Exception as e:
+            self._count("db_errors")
+            print(f"Error reading data_cache: {e}")
+            return _MISSING
+        finally:
+            db.close()
+
+    def _db_set(self, key: str, value: Any, ttl: int):
+        db = self._session_factory()
+        try:
+            stmt = insert(DataCache).values(
+                cache_key=key,
+                cache_data=value,
+                created_at=func.now(),
+                expires_at=func.now() + timedelta(seconds=ttl)
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[DataCache.cache_key],
+                set_={
+                    "cache_data": stmt.excluded.cache_data,
+                    "created_at": stmt.excluded.created_at,
+                    "expires_at": stmt.excluded.expires_at
+                }
+            )
+            db.execute(stmt)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            self._count("db_errors")
+            print(f"Error writing data_cache: {e}")
+        finally:
+            db.close()
+
+    # ==================== API PUBLIC ====================
+
+    def get_local(self, key: str) -> Any:
+        """
+        Caută cheia doar în LRU (fără I/O), ex: din event loop.
+        Returnează `None` dacă nu există o intrare validă.
+        """
+        value = self._memory_get(key)
+        if value is not _MISSING:
+            self._count("memory_hits")
+            return value
+        return None
+
+    def get(self, key: str) -> Any:
+        """
+        Caută cheia în LRU, apoi în `data_cache`.
+        Returnează `None` dacă nu există o intrare validă.
+        """
+        value = self.get_local(key)
+        if value is not None:
+            return value
+
+        value = self._db_get(key)
+        if value is not _MISSING:
+            self._count("db_hits")
+            self._memory_set(key, value, self._memory_ttl)
+            return value
+
+        self._count("misses")
+        return None
+
+    def set(self, key: str, value: Any, ttl: int):
+        """Salvează valoarea (serializabilă JSON) în ambele niveluri."""
+        self._memory_set(key, value, ttl)
+        self._db_set(key, value, ttl)
+
+    def invalidate(self, namespace: Optional[str] = None):
+        """
+        Șterge intrările unui namespace (sau toate) din ambele niveluri.
+        Apelat după importuri, ca datele noi să fie vizibile imediat.
+        """
+        prefix = f"{namespace}:" if namespace else ""
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+
+        db = self._session_factory()
+        try:
+            query = db.query(DataCache)
+            if namespace:
+                query = query.filter(DataCache.cache_key.startswith(prefix))
+            query.delete(synchronize_session=False)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            self._count("db_errors")
+            print(f"Error invalidating data_cache: {e}")
+        finally:
+            db.close()
+
+    def purge_expired(self) -> int:
+        """
+        Șterge intrările expirate din ambele niveluri.
+        Returnează numărul de rânduri șterse din `data_cache`.
+        """
+        now = time.monotonic()
+        with self._lock:
+            for key in [k for k, (exp, _) in self._entries.items() if exp < now]:
+                del self._entries[key]
+
+        db = self._session_factory()
+        try:
+            deleted = db.query(DataCache).filter(
+                DataCache.expires_at <= func.now()
+            ).delete(synchronize_session=False)
+            db.commit()
+            return deleted
+        except Exception as e:
+            db.rollback()
+            self._count("db_errors")
+            print(f"Error purging data_cache: {e}")
+            return 0
+        finally:
+            db.close()
+
+    def _count(self, name: str):
+        with self._lock:
+            self._stats[name] += 1
+
+    def stats(self) -> dict:
+        """Contoare hit/miss și dimensiunea LRU-ului local."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._entries)
+        hits = stats["memory_hits"] + stats["db_hits"]
+        total = hits + stats["misses"]
+        stats["hit_ratio"] = round(hits / total, 4) if total else None
+        return stats
+
+
+# Instanța partajată la nivel de proces
+response_cache = ResponseCache()
+
+
+def cache_metrics() -> list[MetricFamily]:
+    """Contoarele cache-ului de răspunsuri, în format /metrics."""
+    stats = response_cache.stats()
+    lookups = MetricFamily("cache_lookups_total", "counter", "Căutări în cache, după rezultat")
+    for result in ("memory_hits", "db_hits", "misses"):
+        lookups.add({"result": result}, stats[result])
+
+    families = [
+        lookups,
+        MetricFamily("cache_db_errors_total", "counter", "Erori la accesul data_cache").add({}, stats["db_errors"]),
+        MetricFamily("cache_memory_entries", "gauge", "Intrări în LRU-ul local").add({}, stats["memory_entries"])
+    ]
+    if stats["hit_ratio"] is not None:
+        families.append(
+            MetricFamily("cache_hit_ratio", "gauge", "Hit-uri (LRU + data_cache) / căutări").add({}, stats["hit_ratio"])
+        )
+    return families
+
+
+metrics.add_collector(cache_metrics)
+
+
+def cached(namespace: str, ttl: int = 3600):
+    """
+    Decorator pentru endpoint-uri și metode de serviciu costisitoare.
+
+    Cheia este formată din namespace și argumentele apelului, fără `self`
+    și `db`. Rezultatul este stocat după `jsonable_encoder`, deci funcția
+    decorată întoarce mereu structuri JSON (dict/list), și din cache și la
+    primul apel. Semnătura originală este păstrată pentru FastAPI.
+
+    Funcțiile `async def` primesc un wrapper async: LRU-ul este citit
+    direct, iar accesul la `data_cache` (sync) rulează într-un thread, ca
+    să nu blocheze event loop-ul.
+    """
+    def decorator(fn):
+        signature = inspect.signature(fn)
+
+        def make_key(args, kwargs) -> str:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            params = {
+                name: value for name, value in bound.arguments.items()
+                if name not in _IGNORED_PARAMS
+            }
+            return response_cache.make_key(namespace, params)
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                if not response_cache.enabled:
+                    return await fn(*args, **kwargs)
+
+                key = make_key(args, kwargs)
+
+                value = response_cache.get_local(key)
+                if value is None:
+                    value = await asyncio.to_thread(response_cache.get, key)
+                if value is not None:
+                    return value
+
+                value = jsonable_encoder(await fn(*args, **kwargs))
+                await asyncio.to_thread(response_cache.set, key, value, ttl)
+                return value
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not response_cache.enabled:
+                return fn(*args, **kwargs)
+
+            key = make_key(args, kwargs)
+
+            value = response_cache.get(key)
+            if value is not None:
+                return value
+
+            value = jsonable_encoder(fn(*args, **kwargs))
+            response_cache.set(key, value, ttl)
+            return value
+
+        return wrapper
+
+    return decorator
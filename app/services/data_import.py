@@ -2,15 +2,72 @@
 Serviciu pentru importul datelor din surse externe
 """
 
-import pandas as pd
-import requests
-from typing import Optional
+import io
+import time
+from typing import TYPE_CHECKING, Optional
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from datetime import datetime
 
-from app.models.indicator import IndicatorDefinition, IndicatorValue, AggregationLevel
-from app.models.region import Region, County
-from app.config import settings
+from app.models.indicator import IndicatorValue, AggregationLevel
+from app.models.import_log import ImportLog
+from app.services.cache import response_cache
+from app.services.indicator_registry import indicator_registry
+from app.services.normalize import normalize_values, melt_year_columns
+from app.services.reporting_views import refresh_reporting_views
+from app.database import SessionLocal
+from app.metrics import MetricFamily
+
+# pandas și requests se importă în metodele care le folosesc (importurile
+# rulează din scripturi, nu din workerii API)
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# Coloanele încărcate prin bulk_upsert, în ordinea din tabelul de staging
+BULK_COLUMNS = [
+    "indicator_id", "county_id", "year", "quarter",
+    "aggregation_level", "value", "is_provisional"
+]
+
+AGGREGATION_LEVEL_VALUES = [level.value for level in AggregationLevel]
+
+STAGE_CREATE_SQL = """
+    CREATE TEMP TABLE IF NOT EXISTS _indicator_values_stage (
+        seq BIGSERIAL,
+        indicator_id INTEGER,
+        county_id INTEGER,
+        year SMALLINT,
+        quarter SMALLINT,
+        aggregation_level TEXT,
+        value DECIMAL(20,4),
+        is_provisional SMALLINT
+    ) ON COMMIT DROP
+"""
+
+STAGE_COPY_SQL = """
+    COPY _indicator_values_stage
+        (indicator_id, county_id, year, quarter, aggregation_level, value, is_provisional)
+    FROM STDIN WITH (FORMAT csv)
+"""
+
+# DISTINCT ON păstrează ultimul rând pentru fiecare cheie (ON CONFLICT nu
+# poate actualiza același rând de două ori); xmax = 0 marchează inserările
+MERGE_SQL = """
+    INSERT INTO indicator_values
+        (indicator_id, county_id, year, quarter, aggregation_level, value, is_provisional)
+    SELECT DISTINCT ON (indicator_id, county_id, year, quarter, aggregation_level)
+        indicator_id, county_id, year, quarter,
+        aggregation_level::aggregation_level, value, is_provisional
+    FROM _indicator_values_stage
+    ORDER BY indicator_id, county_id, year, quarter, aggregation_level, seq DESC
+    ON CONFLICT (indicator_id, county_id, year, quarter, aggregation_level)
+    DO UPDATE SET
+        value = EXCLUDED.value,
+        is_provisional = EXCLUDED.is_provisional,
+        updated_at = CURRENT_TIMESTAMP
+    RETURNING (xmax = 0) AS inserted
+"""
 
 
 class DataImportService:
@@ -41,6 +98,8 @@ class DataImportService:
         Returns:
             Numărul de înregistrări importate
         """
+        import requests
+
         # INS Tempo API base URL
         base_url = "http://statistici.insse.ro:8077/tempo-ins/matrix"
 
@@ -80,6 +139,7 @@ class DataImportService:
         Returns:
             Numărul de înregistrări importate
         """
+        started_at = time.perf_counter()
         try:
             import eurostat
 
@@ -101,33 +161,19 @@ class DataImportService:
                 df = df[["geo"] + [c for c in time_cols if start_year <= int(c) <= end_year]]
 
             # Get indicator definition
-            indicator = self.db.query(IndicatorDefinition).filter(
-                IndicatorDefinition.code == indicator_code
-            ).first()
+            indicator = indicator_registry.get(indicator_code)
 
             if not indicator:
                 print(f"Indicator {indicator_code} not found")
                 return 0
 
             # Import values
-            count = 0
-            for _, row in df.iterrows():
-                for col in df.columns:
-                    if col.isdigit():
-                        year = int(col)
-                        value = row[col]
-
-                        if pd.notna(value):
-                            self._upsert_indicator_value(
-                                indicator_id=indicator.id,
-                                year=year,
-                                value=float(value),
-                                aggregation_level=AggregationLevel.COUNTRY
-                            )
-                            count += 1
-
-            self.db.commit()
-            return count
+            clean, rejects = normalize_values(
+                melt_year_columns(df),
+                indicator_id=indicator.id,
+                default_level=AggregationLevel.COUNTRY
+            )
+            return self._load_normalized(clean, rejects, "Eurostat", dataset_code, started_at)
 
         except Exception as e:
             print(f"Error importing from Eurostat: {e}")
@@ -157,45 +203,16 @@ class DataImportService:
         Returns:
             Numărul de înregistrări importate
         """
+        import pandas as pd
+
+        started_at = time.perf_counter()
         try:
             df = pd.read_csv(file_path)
 
-            indicator = self.db.query(IndicatorDefinition).filter(
-                IndicatorDefinition.code == indicator_code
-            ).first()
-
-            if not indicator:
-                print(f"Indicator {indicator_code} not found")
-                return 0
-
-            count = 0
-            for _, row in df.iterrows():
-                year = int(row[year_column])
-                value = float(row[value_column])
-
-                county_id = None
-                aggregation_level = AggregationLevel.REGION
-
-                if county_column and county_column in row:
-                    county_code = row[county_column]
-                    county = self.db.query(County).filter(
-                        County.code == county_code
-                    ).first()
-                    if county:
-                        county_id = county.id
-                        aggregation_level = AggregationLevel.COUNTY
-
-                self._upsert_indicator_value(
-                    indicator_id=indicator.id,
-                    year=year,
-                    value=value,
-                    county_id=county_id,
-                    aggregation_level=aggregation_level
-                )
-                count += 1
-
-            self.db.commit()
-            return count
+            return self._import_dataframe(
+                df, indicator_code, year_column, value_column, county_column,
+                source="CSV", source_identifier=file_path, started_at=started_at
+            )
 
         except Exception as e:
             print(f"Error importing from CSV: {e}")
@@ -214,11 +231,15 @@ class DataImportService:
         """
         Importă date dintr-un fișier Excel.
         """
+        import pandas as pd
+
+        started_at = time.perf_counter()
         try:
             df = pd.read_excel(file_path, sheet_name=sheet_name)
             # Similar logic to CSV import
             return self._import_dataframe(
-                df, indicator_code, year_column, value_column, county_column
+                df, indicator_code, year_column, value_column, county_column,
+                started_at=started_at
             )
         except Exception as e:
             print(f"Error importing from Excel: {e}")
@@ -226,102 +247,154 @@ class DataImportService:
 
     # ==================== HELPER METHODS ====================
 
-    def _upsert_indicator_value(
+    def _commit_import(
         self,
-        indicator_id: int,
-        year: int,
-        value: float,
-        county_id: Optional[int] = None,
-        aggregation_level: AggregationLevel = AggregationLevel.REGION,
-        quarter: Optional[int] = None,
-        is_provisional: bool = False
+        source: str,
+        source_identifier: Optional[str] = None,
+        result: Optional[dict] = None,
+        started_at: Optional[float] = None
     ):
         """
-        Insert or update an indicator value.
+        Înregistrează importul în `import_logs`, reîmprospătează view-urile
+        de raportare, face commit și invalidează cache-ul de răspunsuri,
+        astfel încât datele noi să fie vizibile imediat.
+
+        `started_at` (time.perf_counter() la începutul importului) dă durata
+        salvată în jurnal și expusă în /metrics.
+        """
+        result = result or {}
+        self.db.add(ImportLog(
+            source=source,
+            source_identifier=source_identifier,
+            records_imported=result.get("inserted"),
+            records_updated=result.get("updated"),
+            records_failed=result.get("rejected"),
+            duration_seconds=time.perf_counter() - started_at if started_at is not None else None,
+            status="completed"
+        ))
+        refresh_reporting_views(self.db)
+        self.db.commit()
+        response_cache.invalidate()
+
+    def bulk_upsert(self, df: "pd.DataFrame") -> dict:
+        """
+        Încarcă un DataFrame de valori printr-un singur COPY într-un tabel
+        temporar, urmat de un singur INSERT ... ON CONFLICT DO UPDATE.
+
+        Coloane așteptate: indicator_id, year, value, aggregation_level și
+        opțional county_id, quarter, is_provisional. Rândurile fără
+        indicator, an sau valoare ori cu nivel de agregare invalid sunt
+        respinse; pentru chei duplicate în același lot câștigă ultimul rând.
+        Nu face commit - apelantul decide granița tranzacției.
+
+        Returns:
+            {"inserted": int, "updated": int, "rejected": int, "duplicates": int}
         """
-        existing = self.db.query(IndicatorValue).filter(
-            IndicatorValue.indicator_id == indicator_id,
-            IndicatorValue.year == year,
-            IndicatorValue.county_id == county_id,
-            IndicatorValue.aggregation_level == aggregation_level
+        import pandas as pd
+
+        result = {"inserted": 0, "updated": 0, "rejected": 0, "duplicates": 0}
+        if df is None or df.empty:
+            return result
+
+        frame = df.reindex(columns=BULK_COLUMNS)
+        frame["aggregation_level"] = frame["aggregation_level"].map(
+            lambda level: level.value if isinstance(level, AggregationLevel) else level
         )
+        frame["value"] = pd.to_numeric(frame["value"], errors="coerce")
+        for col in ("indicator_id", "county_id", "year", "quarter", "is_provisional"):
+            frame[col] = pd.to_numeric(frame[col], errors="coerce").astype("Int64")
+        frame["is_provisional"] = frame["is_provisional"].fillna(0)
+
+        valid = (
+            frame["indicator_id"].notna()
+            & frame["year"].notna()
+            & frame["value"].notna()
+            & frame["aggregation_level"].isin(AGGREGATION_LEVEL_VALUES)
+        )
+        result["rejected"] = int((~valid).sum())
+        frame = frame[valid]
 
-        if quarter:
-            existing = existing.filter(IndicatorValue.quarter == quarter)
-
-        existing = existing.first()
-
-        if existing:
-            existing.value = value
-            existing.is_provisional = int(is_provisional)
-        else:
-            new_value = IndicatorValue(
-                indicator_id=indicator_id,
-                year=year,
-                value=value,
-                county_id=county_id,
-                aggregation_level=aggregation_level,
-                quarter=quarter,
-                is_provisional=int(is_provisional)
-            )
-            self.db.add(new_value)
+        if frame.empty:
+            return result
+
+        buffer = io.StringIO()
+        frame.to_csv(buffer, index=False, header=False)
+        buffer.seek(0)
+
+        connection = self.db.connection()
+        connection.exec_driver_sql(STAGE_CREATE_SQL)
+        connection.exec_driver_sql("TRUNCATE _indicator_values_stage")
+
+        cursor = connection.connection.cursor()
+        try:
+            cursor.copy_expert(STAGE_COPY_SQL, buffer)
+        finally:
+            cursor.close()
+
+        flags = [row[0] for row in connection.exec_driver_sql(MERGE_SQL)]
+        result["inserted"] = sum(1 for inserted in flags if inserted)
+        result["updated"] = len(flags) - result["inserted"]
+        result["duplicates"] = len(frame) - len(flags)
+        return result
 
     def _import_dataframe(
         self,
-        df: pd.DataFrame,
+        df: "pd.DataFrame",
         indicator_code: str,
         year_column: str,
         value_column: str,
-        county_column: Optional[str] = None
+        county_column: Optional[str] = None,
+        source: str = "DataFrame",
+        source_identifier: Optional[str] = None,
+        started_at: Optional[float] = None
     ) -> int:
         """
         Helper method to import a DataFrame.
         """
-        indicator = self.db.query(IndicatorDefinition).filter(
-            IndicatorDefinition.code == indicator_code
-        ).first()
+        started_at = started_at if started_at is not None else time.perf_counter()
+        indicator = indicator_registry.get(indicator_code)
 
         if not indicator:
+            print(f"Indicator {indicator_code} not found")
             return 0
 
-        count = 0
-        for _, row in df.iterrows():
-            try:
-                year = int(row[year_column])
-                value = float(row[value_column])
-
-                county_id = None
-                aggregation_level = AggregationLevel.REGION
-
-                if county_column and pd.notna(row.get(county_column)):
-                    county = self.db.query(County).filter(
-                        County.code == str(row[county_column])
-                    ).first()
-                    if county:
-                        county_id = county.id
-                        aggregation_level = AggregationLevel.COUNTY
-
-                self._upsert_indicator_value(
-                    indicator_id=indicator.id,
-                    year=year,
-                    value=value,
-                    county_id=county_id,
-                    aggregation_level=aggregation_level
-                )
-                count += 1
-            except (ValueError, KeyError) as e:
-                continue
+        clean, rejects = normalize_values(
+            df,
+            indicator_id=indicator.id,
+            year_column=year_column,
+            value_column=value_column,
+            county_column=county_column
+        )
+        return self._load_normalized(
+            clean, rejects, source, source_identifier or indicator_code, started_at
+        )
 
-        self.db.commit()
-        return count
+    def _load_normalized(
+        self,
+        clean: "pd.DataFrame",
+        rejects: "pd.DataFrame",
+        source: str,
+        source_identifier: Optional[str] = None,
+        started_at: Optional[float] = None
+    ) -> int:
+        """
+        Încarcă un cadru normalizat, înregistrează importul și întoarce
+        numărul de rânduri inserate sau actualizate.
+        """
+        if not rejects.empty:
+            print(f"{source} {source_identifier}: {len(rejects)} rows rejected "
+                  f"({rejects['reason'].value_counts().to_dict()})")
+
+        result = self.bulk_upsert(clean)
+        result["rejected"] += len(rejects)
+        self._commit_import(source, source_identifier, result, started_at)
+        return result["inserted"] + result["updated"]
 
     def validate_import(self, indicator_code: str) -> dict:
         """
         Validează datele importate pentru un indicator.
         """
-        indicator = self.db.query(IndicatorDefinition).filter(
-            IndicatorDefinition.code == indicator_code
-        ).first()
+        indicator = indicator_registry.get(indicator_code)
 
         if not indicator:
             return {"error": "Indicator not found"}
@@ -347,3 +420,51 @@ class DataImportService:
             return []
         full_range = set(range(min(years), max(years) + 1))
         return sorted(full_range - set(years))
+
+
+def import_log_metrics() -> list[MetricFamily]:
+    """
+    Metrici din `import_logs`, per sursă: numărul și durata totală a
+    importurilor, plus durata, volumul și momentul ultimului import.
+    Citite din bază, deci includ și importurile rulate din scripturi.
+    """
+    runs = MetricFamily("import_runs_total", "counter", "Importuri înregistrate în import_logs")
+    duration = MetricFamily("import_duration_seconds", "summary", "Durata importurilor cu durată înregistrată")
+    last_duration = MetricFamily("import_last_duration_seconds", "gauge", "Durata ultimului import")
+    last_records = MetricFamily("import_last_records", "gauge", "Înregistrări inserate de ultimul import")
+    last_timestamp = MetricFamily("import_last_timestamp_seconds", "gauge", "Momentul ultimului import (epoch)")
+
+    db = SessionLocal()
+    try:
+        totals = db.query(
+            ImportLog.source,
+            func.count(ImportLog.id),
+            func.count(ImportLog.duration_seconds),
+            func.coalesce(func.sum(ImportLog.duration_seconds), 0.0)
+        ).group_by(ImportLog.source).all()
+
+        latest = db.query(
+            ImportLog.source,
+            ImportLog.duration_seconds,
+            ImportLog.records_imported,
+            ImportLog.import_date
+        ).distinct(ImportLog.source).order_by(ImportLog.source, ImportLog.id.desc()).all()
+    finally:
+        db.close()
+
+    for source, count, timed_count, total_seconds in totals:
+        labels = {"source": source}
+        runs.add(labels, count)
+        duration.add(labels, float(total_seconds), "_sum")
+        duration.add(labels, timed_count, "_count")
+
+    for source, seconds, records, imported_at in latest:
+        labels = {"source": source}
+        if seconds is not None:
+            last_duration.add(labels, seconds)
+        if records is not None:
+            last_records.add(labels, records)
+        if imported_at is not None:
+            last_timestamp.add(labels, imported_at.timestamp())
+
+    return [runs, duration, last_duration, last_records, last_timestamp]
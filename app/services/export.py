@@ -0,0 +1,331 @@
+"""
+Serviciu pentru exportul datelor în fișiere (streaming)
+"""
+
+import csv
+import io
+import os
+import tempfile
+from typing import Callable, Iterator, Optional
+from sqlalchemy.orm import Query, Session
+
+from app.database import SessionLocal
+from app.models.indicator import IndicatorDefinition, IndicatorValue, AggregationLevel
+from app.models.region import County
+
+
+# Numărul de rânduri aduse de la server la fiecare fetch al cursorului
+EXPORT_BATCH_SIZE = 2000
+
+# Numărul maxim de rânduri dintr-o foaie xlsx
+XLSX_MAX_ROWS = 1_048_576
+
+# Antetul fișierelor exportate
+EXPORT_HEADER = ["Cod", "Indicator", "An", "Valoare", "Județ"]
+
+
+# Coloanele exporturilor tabelare (CSV, xlsx)
+EXPORT_COLUMNS = [
+    IndicatorDefinition.code,
+    IndicatorDefinition.name,
+    IndicatorValue.year,
+    IndicatorValue.value,
+    County.name.label("county_name")
+]
+
+# Coloanele exporturilor columnare (Parquet, Arrow)
+COLUMNAR_COLUMNS = [
+    IndicatorDefinition.code.label("indicator_code"),
+    IndicatorDefinition.name.label("indicator_name"),
+    County.code.label("county_code"),
+    County.name.label("county_name"),
+    IndicatorValue.aggregation_level,
+    IndicatorValue.year,
+    IndicatorValue.quarter,
+    IndicatorValue.value,
+    IndicatorValue.is_provisional
+]
+
+
+def build_export_query(
+    db: Session,
+    start_year: int,
+    end_year: int,
+    indicator_codes: Optional[list[str]] = None,
+    aggregation_level: Optional[AggregationLevel] = None,
+    county_code: Optional[str] = None,
+    columns: Optional[list] = None
+) -> Query:
+    """
+    Query-ul comun pentru exporturi: un rând per valoare, ordonat după
+    indicator, an și județ.
+    """
+    query = db.query(
+        *(columns or EXPORT_COLUMNS)
+    ).select_from(
+        IndicatorDefinition
+    ).join(
+        IndicatorValue, IndicatorDefinition.id == IndicatorValue.indicator_id
+    ).outerjoin(
+        County, IndicatorValue.county_id == County.id
+    ).filter(
+        IndicatorValue.year >= start_year,
+        IndicatorValue.year <= end_year
+    )
+
+    if indicator_codes:
+        query = query.filter(IndicatorDefinition.code.in_(indicator_codes))
+
+    if aggregation_level:
+        query = query.filter(IndicatorValue.aggregation_level == aggregation_level)
+
+    if county_code:
+        query = query.filter(County.code == county_code)
+
+    return query.order_by(
+        IndicatorDefinition.code, IndicatorValue.year, County.name
+    )
+
+
+def stream_export_rows(
+    start_year: int,
+    end_year: int,
+    indicator_codes: Optional[list[str]] = None,
+    aggregation_level: Optional[AggregationLevel] = None,
+    county_code: Optional[str] = None,
+    columns: Optional[list] = None,
+    session_factory: Callable[[], Session] = SessionLocal
+) -> Iterator[tuple]:
+    """
+    Generator de rânduri citite printr-un cursor server-side (`yield_per`).
+
+    Deschide propria sesiune: răspunsurile streaming sunt consumate după
+    ce dependența `get_db` a închis sesiunea cererii.
+    """
+    db = session_factory()
+    try:
+        query = build_export_query(
+            db, start_year, end_year, indicator_codes, aggregation_level,
+            county_code, columns
+        )
+        for row in query.yield_per(EXPORT_BATCH_SIZE):
+            yield tuple(row)
+    finally:
+        db.close()
+
+
+def iter_csv(
+    rows: Iterator[tuple],
+    header: list[str] = EXPORT_HEADER,
+    chunk_rows: int = EXPORT_BATCH_SIZE
+) -> Iterator[str]:
+    """
+    Transformă un flux de rânduri în bucăți CSV.
+    Antetul este emis imediat, apoi câte o bucată la fiecare `chunk_rows`.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow(header)
+    yield buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate(0)
+
+    pending = 0
+    for row in rows:
+        writer.writerow(row)
+        pending += 1
+        if pending >= chunk_rows:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+            pending = 0
+
+    if pending:
+        yield buffer.getvalue()
+
+
+def _sheet_name(name: str) -> str:
+    """Nume valid de foaie Excel (max. 31 caractere, fără caractere interzise)."""
+    for ch in "[]:*?/\\":
+        name = name.replace(ch, "_")
+    return name[:31] or "Date"
+
+
+def write_xlsx(
+    rows: Iterator[tuple],
+    sheet_per_indicator: bool = False,
+    header: list[str] = EXPORT_HEADER
+) -> str:
+    """
+    Scrie rândurile într-un fișier xlsx temporar și returnează calea lui.
+
+    Workbook-ul folosește modul `constant_memory` al xlsxwriter: fiecare
+    rând este scris pe disc imediat ce se trece la următorul, deci memoria
+    nu depinde de numărul de rânduri. Cu `sheet_per_indicator`, rândurile
+    (ordonate după cod) sunt împărțite într-o foaie per indicator.
+    Apelantul este responsabil de ștergerea fișierului.
+    """
+    import xlsxwriter
+
+    fd, path = tempfile.mkstemp(suffix=".xlsx", prefix="export_")
+    os.close(fd)
+
+    workbook = xlsxwriter.Workbook(path, {"constant_memory": True})
+    try:
+        bold = workbook.add_format({"bold": True})
+        worksheet = None
+        current_code = None
+        row_idx = 0
+        part = 0
+
+        for row in rows:
+            new_indicator = sheet_per_indicator and row[0] != current_code
+            if worksheet is None or new_indicator or row_idx >= XLSX_MAX_ROWS:
+                part = 1 if worksheet is None or new_indicator else part + 1
+                current_code = row[0]
+                sheet = _sheet_name(current_code) if sheet_per_indicator else "Date"
+                if part > 1:
+                    # Foaie de continuare când se depășește limita Excel
+                    sheet = f"{sheet[:26]} ({part})"
+                worksheet = workbook.add_worksheet(sheet)
+                worksheet.write_row(0, 0, header, bold)
+                row_idx = 1
+
+            worksheet.write_row(row_idx, 0, row)
+            row_idx += 1
+
+        if worksheet is None:
+            workbook.add_worksheet("Date").write_row(0, 0, header, bold)
+    except Exception:
+        workbook.close()
+        os.remove(path)
+        raise
+
+    workbook.close()
+    return path
+
+
+# ==================== EXPORT COLUMNAR (ARROW / PARQUET) ====================
+
+def _arrow_schema():
+    import pyarrow as pa
+
+    text = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema([
+        ("indicator_code", text),
+        ("indicator_name", text),
+        ("county_code", text),
+        ("county_name", text),
+        ("aggregation_level", text),
+        ("year", pa.int16()),
+        ("quarter", pa.int8()),
+        ("value", pa.float64()),
+        ("is_provisional", pa.bool_())
+    ])
+
+
+def iter_record_batches(
+    rows: Iterator[tuple],
+    batch_rows: int = EXPORT_BATCH_SIZE
+):
+    """
+    Grupează rândurile (în ordinea COLUMNAR_COLUMNS) în RecordBatch-uri
+    Arrow. Coloanele text repetitive sunt dictionary-encoded.
+    """
+    import pyarrow as pa
+
+    schema = _arrow_schema()
+
+    def to_batch(chunk):
+        columns = list(zip(*chunk))
+        levels = [lvl.value if lvl is not None else None for lvl in columns[4]]
+        flags = [bool(f) if f is not None else None for f in columns[8]]
+        arrays = [
+            pa.array(columns[0], type=pa.string()).dictionary_encode(),
+            pa.array(columns[1], type=pa.string()).dictionary_encode(),
+            pa.array(columns[2], type=pa.string()).dictionary_encode(),
+            pa.array(columns[3], type=pa.string()).dictionary_encode(),
+            pa.array(levels, type=pa.string()).dictionary_encode(),
+            pa.array(columns[5], type=pa.int16()),
+            pa.array(columns[6], type=pa.int8()),
+            pa.array(columns[7], type=pa.float64()),
+            pa.array(flags, type=pa.bool_())
+        ]
+        return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= batch_rows:
+            yield to_batch(chunk)
+            chunk = []
+
+    if chunk:
+        yield to_batch(chunk)
+
+
+class _ChunkSink(io.RawIOBase):
+    """Destinație de scriere care acumulează bytes până sunt preluați."""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def iter_arrow_stream(rows: Iterator[tuple]) -> Iterator[bytes]:
+    """
+    Serializează rândurile în format Arrow IPC stream, câte un batch o dată.
+    Fiecare batch este trimis clientului imediat după ce este citit.
+    """
+    import pyarrow as pa
+
+    sink = _ChunkSink()
+    writer = pa.ipc.new_stream(sink, _arrow_schema())
+    yield sink.drain()
+
+    for batch in iter_record_batches(rows):
+        writer.write_batch(batch)
+        yield sink.drain()
+
+    writer.close()
+    yield sink.drain()
+
+
+def write_parquet(rows: Iterator[tuple]) -> str:
+    """
+    Scrie rândurile într-un fișier Parquet temporar (un row group per
+    batch) și returnează calea lui. Apelantul șterge fișierul.
+    """
+    import pyarrow.parquet as pq
+
+    fd, path = tempfile.mkstemp(suffix=".parquet", prefix="export_")
+    os.close(fd)
+
+    try:
+        with pq.ParquetWriter(path, _arrow_schema(), compression="zstd") as writer:
+            for batch in iter_record_batches(rows):
+                writer.write_batch(batch)
+    except Exception:
+        os.remove(path)
+        raise
+
+    return path
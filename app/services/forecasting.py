@@ -0,0 +1,369 @@
+"""
+Serviciu pentru prognoza în lot a indicatorilor (linear, ETS, ARIMA)
+"""
+
+import multiprocessing
+import os
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Optional
+from sqlalchemy import insert, delete
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.forecast import Forecast
+from app.models.import_log import ImportLog
+from app.models.indicator import AggregationLevel
+from app.models.region import County
+from app.models.reporting import indicator_data_view
+from app.services.cache import cached, response_cache
+from app.services.indicator_registry import indicator_registry
+
+# numpy, pandas și statsmodels se importă la ajustare: rutele de citire a
+# prognozelor nu au nevoie de ele
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# Metodele disponibile, în ordinea în care sunt ajustate
+FORECAST_METHODS = ("linear", "ets", "arima")
+
+# Ordinele (p, d, q) încercate pentru ARIMA; se păstrează cel cu AIC minim
+ARIMA_ORDERS = [(0, 1, 0), (1, 1, 0), (0, 1, 1), (1, 1, 1)]
+
+# Seriile sunt trimise workerilor în pachete, ca să nu plătim un
+# round-trip de pickle per serie
+FORECAST_CHUNKSIZE = 8
+
+# Sub acest număr de serii, pornirea workerilor (~2s, spawn) costă mai mult
+# decât ajustarea secvențială (~0.1s per serie pentru toate metodele)
+FORECAST_POOL_MIN_SERIES = 50
+
+
+# ==================== AJUSTARE (rulează în workeri) ====================
+
+def _fit_linear(years: "np.ndarray", values: "np.ndarray", horizon: int, alpha: float) -> dict:
+    import numpy as np
+    import statsmodels.api as sm
+
+    result = sm.OLS(values, sm.add_constant(years)).fit()
+    future = np.arange(years[-1] + 1, years[-1] + horizon + 1, dtype=float)
+    frame = result.get_prediction(sm.add_constant(future, has_constant="add")).summary_frame(alpha=alpha)
+    return {
+        "value": frame["mean"].to_numpy(),
+        "lower_bound": frame["obs_ci_lower"].to_numpy(),
+        "upper_bound": frame["obs_ci_upper"].to_numpy(),
+        "aic": result.aic
+    }
+
+
+def _fit_ets(years: "np.ndarray", values: "np.ndarray", horizon: int, alpha: float) -> dict:
+    # Date anuale: Holt (trend aditiv amortizat), fără componentă sezonieră
+    import pandas as pd
+    from statsmodels.tsa.exponential_smoothing.ets import ETSModel
+
+    # summary_frame cere un index, deci seria e trimisă ca pd.Series
+    series = pd.Series(values)
+    result = ETSModel(series, error="add", trend="add", damped_trend=True).fit(disp=False)
+    n = len(values)
+    frame = result.get_prediction(start=n, end=n + horizon - 1).summary_frame(alpha=alpha)
+    return {
+        "value": frame["mean"].to_numpy(),
+        "lower_bound": frame["pi_lower"].to_numpy(),
+        "upper_bound": frame["pi_upper"].to_numpy(),
+        "aic": result.aic
+    }
+
+
+def _fit_arima(years: "np.ndarray", values: "np.ndarray", horizon: int, alpha: float) -> dict:
+    import numpy as np
+    from statsmodels.tsa.arima.model import ARIMA
+
+    best = None
+    for order in ARIMA_ORDERS:
+        try:
+            # trend "t" pe seria diferențiată = drift
+            result = ARIMA(values, order=order, trend="t").fit()
+        except Exception:
+            continue
+        if np.isfinite(result.aic) and (best is None or result.aic < best.aic):
+            best = result
+
+    if best is None:
+        raise ValueError("no ARIMA order converged")
+
+    frame = best.get_forecast(horizon).summary_frame(alpha=alpha)
+    return {
+        "value": frame["mean"].to_numpy(),
+        "lower_bound": frame["mean_ci_lower"].to_numpy(),
+        "upper_bound": frame["mean_ci_upper"].to_numpy(),
+        "aic": best.aic
+    }
+
+
+_FITTERS = {
+    "linear": _fit_linear,
+    "ets": _fit_ets,
+    "arima": _fit_arima
+}
+
+
+def fit_series(task: dict) -> tuple[list[dict], list[str]]:
+    """
+    Ajustează metodele cerute pe o singură serie anuală și întoarce
+    rândurile pentru tabelul `forecasts`, plus erorile per metodă.
+
+    Funcție de nivel modul (nu metodă), ca să poată fi trimisă prin pickle
+    workerilor din ProcessPoolExecutor.
+    """
+    import numpy as np
+
+    years = np.asarray(task["years"], dtype=float)
+    values = np.asarray(task["values"], dtype=float)
+    horizon = task["horizon"]
+    alpha = 1 - task["confidence"]
+
+    # ETS/ARIMA cer o serie fără goluri: anii lipsă sunt interpolați liniar
+    full_years = np.arange(years[0], years[-1] + 1, dtype=float)
+    full_values = np.interp(full_years, years, values)
+
+    rows, errors = [], []
+    for method in task["methods"]:
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                if method == "linear":
+                    fit = _fit_linear(years, values, horizon, alpha)
+                else:
+                    fit = _FITTERS[method](full_years, full_values, horizon, alpha)
+        except Exception as e:
+            errors.append(f"{task['indicator_code']}/{task['county_code'] or '-'}/{method}: {e}")
+            continue
+
+        if not np.all(np.isfinite(fit["value"])):
+            errors.append(f"{task['indicator_code']}/{task['county_code'] or '-'}/{method}: non-finite forecast")
+            continue
+
+        aic = float(fit["aic"]) if np.isfinite(fit["aic"]) else None
+        for step in range(horizon):
+            lower, upper = fit["lower_bound"][step], fit["upper_bound"][step]
+            rows.append({
+                "indicator_id": task["indicator_id"],
+                "county_id": task["county_id"],
+                "aggregation_level": task["aggregation_level"],
+                "method": method,
+                "year": int(years[-1]) + step + 1,
+                "value": float(fit["value"][step]),
+                "lower_bound": float(lower) if np.isfinite(lower) else None,
+                "upper_bound": float(upper) if np.isfinite(upper) else None,
+                "confidence_level": task["confidence"],
+                "n_observations": len(values),
+                "last_observed_year": int(years[-1]),
+                "aic": aic
+            })
+
+    return rows, errors
+
+
+# ==================== SERVICIU ====================
+
+class ForecastingService:
+    """
+    Prognoze pentru toate seriile anuale (indicator × județ × nivel de
+    agregare), ajustate în paralel într-un pool de procese și salvate cu
+    intervalele de predicție în tabelul `forecasts`.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def load_series(self, indicator_codes: Optional[list[str]] = None) -> list[dict]:
+        """
+        Citește toate seriile anuale într-un singur query și le împarte
+        în task-uri pentru `fit_series`. Seriile prea scurte sunt ignorate.
+        """
+        import pandas as pd
+
+        data = indicator_data_view.c
+        query = self.db.query(
+            data.indicator_id, data.indicator_code,
+            data.county_id, data.county_code,
+            data.aggregation_level, data.year, data.value
+        ).filter(data.quarter.is_(None))
+
+        if indicator_codes:
+            query = query.filter(data.indicator_code.in_(indicator_codes))
+
+        frame = pd.DataFrame(
+            query.all(),
+            columns=["indicator_id", "indicator_code", "county_id", "county_code",
+                     "aggregation_level", "year", "value"]
+        )
+        if frame.empty:
+            return []
+
+        keys = ["indicator_id", "indicator_code", "county_id", "county_code", "aggregation_level"]
+        frame = frame.sort_values("year")
+
+        tasks = []
+        for key, series in frame.groupby(keys, dropna=False, sort=False):
+            if len(series) < settings.forecast_min_observations:
+                continue
+            task = {
+                name: (None if pd.isna(value) else value)
+                for name, value in zip(keys, key)
+            }
+            # Tipurile numpy nu pot fi trimise direct driverului
+            task["indicator_id"] = int(task["indicator_id"])
+            task["county_id"] = int(task["county_id"]) if task["county_id"] is not None else None
+            task["years"] = series["year"].astype(int).tolist()
+            task["values"] = series["value"].astype(float).tolist()
+            tasks.append(task)
+        return tasks
+
+    def run(
+        self,
+        indicator_codes: Optional[list[str]] = None,
+        methods: tuple[str, ...] = FORECAST_METHODS,
+        horizon: int = settings.forecast_horizon,
+        confidence: float = settings.forecast_confidence,
+        max_workers: int = settings.forecast_workers
+    ) -> dict:
+        """
+        Ajustează toate seriile și înlocuiește prognozele existente pentru
+        metodele (și indicatorii) rulați, într-o singură tranzacție.
+
+        Rularea este înregistrată în `import_logs`, astfel încât cache-urile
+        legate de versiunea datelor (ex: frontend-ul) văd noile prognoze.
+        """
+        unknown = [m for m in methods if m not in _FITTERS]
+        if unknown:
+            return {"error": f"Unknown forecast methods: {', '.join(unknown)}"}
+
+        started = time.perf_counter()
+        tasks = self.load_series(indicator_codes)
+        for task in tasks:
+            task.update(methods=list(methods), horizon=horizon, confidence=confidence)
+
+        # Mai multe procese decât nuclee doar adaugă costul pornirii lor
+        max_workers = min(max_workers, os.cpu_count() or 1)
+
+        rows, errors = [], []
+        if max_workers > 1 and len(tasks) >= FORECAST_POOL_MIN_SERIES:
+            # spawn: workerii nu moștenesc conexiunile și thread-urile procesului API
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor:
+                for series_rows, series_errors in executor.map(fit_series, tasks, chunksize=FORECAST_CHUNKSIZE):
+                    rows.extend(series_rows)
+                    errors.extend(series_errors)
+        else:
+            for task in tasks:
+                series_rows, series_errors = fit_series(task)
+                rows.extend(series_rows)
+                errors.extend(series_errors)
+
+        for error in errors:
+            print(f"Forecast failed: {error}")
+
+        try:
+            stale = delete(Forecast).where(Forecast.method.in_(methods))
+            if indicator_codes:
+                ids = [d.id for d in indicator_registry.get_many(indicator_codes).values()]
+                stale = stale.where(Forecast.indicator_id.in_(ids))
+            self.db.execute(stale)
+            if rows:
+                self.db.execute(insert(Forecast), rows)
+
+            summary = {
+                "series": len(tasks),
+                "forecasts": len(rows),
+                "failed": len(errors),
+                "methods": list(methods),
+                "horizon": horizon,
+                "duration_seconds": round(time.perf_counter() - started, 2)
+            }
+            self.db.add(ImportLog(
+                source="Forecast",
+                source_identifier=",".join(methods),
+                records_imported=len(rows),
+                records_failed=len(errors),
+                duration_seconds=summary["duration_seconds"],
+                extra=summary
+            ))
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            print(f"Error saving forecasts: {e}")
+            return {"error": str(e)}
+
+        response_cache.invalidate()
+        return summary
+
+    @cached("forecasting.get_forecasts", ttl=3600)
+    def get_forecasts(
+        self,
+        indicator_code: str,
+        aggregation_level: AggregationLevel = AggregationLevel.REGION,
+        county_code: Optional[str] = None,
+        method: Optional[str] = None
+    ) -> dict:
+        """
+        Prognozele salvate pentru un indicator, grupate pe serie și metodă,
+        ca vectori paraleli (ani, valori, limite).
+        """
+        indicator = indicator_registry.get(indicator_code)
+
+        if not indicator:
+            return {"error": "Indicator not found"}
+
+        query = self.db.query(
+            County.code.label("county_code"),
+            Forecast.aggregation_level,
+            Forecast.method,
+            Forecast.year,
+            Forecast.value,
+            Forecast.lower_bound,
+            Forecast.upper_bound,
+            Forecast.confidence_level,
+            Forecast.n_observations,
+            Forecast.last_observed_year,
+            Forecast.aic
+        ).outerjoin(
+            County, Forecast.county_id == County.id
+        ).filter(
+            Forecast.indicator_id == indicator.id,
+            Forecast.aggregation_level == aggregation_level.value
+        )
+
+        if county_code:
+            query = query.filter(County.code == county_code)
+        if method:
+            query = query.filter(Forecast.method == method)
+
+        series: dict[tuple, dict] = {}
+        for r in query.order_by(County.code, Forecast.method, Forecast.year).all():
+            entry = series.setdefault((r.county_code, r.method), {
+                "county_code": r.county_code,
+                "aggregation_level": r.aggregation_level,
+                "method": r.method,
+                "confidence_level": r.confidence_level,
+                "n_observations": r.n_observations,
+                "last_observed_year": r.last_observed_year,
+                "aic": round(r.aic, 2) if r.aic is not None else None,
+                "years": [],
+                "values": [],
+                "lower_bound": [],
+                "upper_bound": []
+            })
+            entry["years"].append(r.year)
+            entry["values"].append(round(r.value, 4))
+            entry["lower_bound"].append(round(r.lower_bound, 4) if r.lower_bound is not None else None)
+            entry["upper_bound"].append(round(r.upper_bound, 4) if r.upper_bound is not None else None)
+
+        return {
+            "indicator": indicator.code,
+            "name": indicator.name,
+            "unit": indicator.unit.value,
+            "series": list(series.values())
+        }
@@ -0,0 +1,116 @@
+"""
+Registru in-process pentru definițiile indicatorilor
+"""
+
+import asyncio
+import threading
+import time
+from typing import Callable, Iterable, Optional
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.indicator import IndicatorDefinition, IndicatorCategory
+
+
+class IndicatorRegistry:
+    """
+    Catalogul de indicatori, ținut în memorie și indexat după cod și id.
+
+    Catalogul este mic și se schimbă rar, așa că este încărcat o singură
+    dată și reîncărcat doar la expirarea TTL-ului sau când un importator
+    apelează `invalidate()`. Reîncărcarea e single-flight: cererile care
+    găsesc catalogul expirat în același timp așteaptă o singură încărcare.
+    Rutele `async def` apelează întâi `ensure_loaded_async()`, care face
+    reîncărcarea (query psycopg2 blocant) într-un thread. Obiectele returnate sunt instanțe
+    `IndicatorDefinition` detașate de sesiune: coloanele pot fi citite
+    liber, dar relația `values` nu este disponibilă.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        ttl_seconds: int = settings.indicator_registry_ttl
+    ):
+        self._session_factory = session_factory
+        self._ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._by_code: dict[str, IndicatorDefinition] = {}
+        self._by_id: dict[int, IndicatorDefinition] = {}
+        self._loaded_at: Optional[float] = None
+
+    def load(self) -> int:
+        """
+        (Re)încarcă întregul catalog din baza de date.
+        Returnează numărul de indicatori încărcați.
+        """
+        db = self._session_factory()
+        try:
+            definitions = db.query(IndicatorDefinition).all()
+            db.expunge_all()
+        finally:
+            db.close()
+
+        with self._lock:
+            self._by_code = {d.code: d for d in definitions}
+            self._by_id = {d.id: d for d in definitions}
+            self._loaded_at = time.monotonic()
+
+        return len(definitions)
+
+    def invalidate(self):
+        """
+        Marchează catalogul ca expirat; următoarea citire îl reîncarcă.
+        Apelat de importatori după ce creează sau modifică definiții.
+        """
+        with self._lock:
+            self._loaded_at = None
+
+    def _is_stale(self) -> bool:
+        loaded_at = self._loaded_at
+        return loaded_at is None or time.monotonic() - loaded_at > self._ttl_seconds
+
+    def _ensure_loaded(self):
+        if not self._is_stale():
+            return
+        with self._load_lock:
+            # Alt apelant poate să fi reîncărcat catalogul cât am așteptat
+            if self._is_stale():
+                self.load()
+
+    async def ensure_loaded_async(self):
+        """
+        Varianta pentru rutele `async def`: dacă e nevoie de reîncărcare,
+        aceasta rulează într-un thread, nu în event loop. Citirile care
+        urmează (`get`, `get_many`, ...) găsesc catalogul proaspăt.
+        """
+        if self._is_stale():
+            await asyncio.to_thread(self._ensure_loaded)
+
+    def get(self, code: str) -> Optional[IndicatorDefinition]:
+        """Definiția indicatorului cu codul dat sau None."""
+        self._ensure_loaded()
+        return self._by_code.get(code)
+
+    def get_by_id(self, indicator_id: int) -> Optional[IndicatorDefinition]:
+        """Definiția indicatorului cu id-ul dat sau None."""
+        self._ensure_loaded()
+        return self._by_id.get(indicator_id)
+
+    def get_many(self, codes: Iterable[str]) -> dict[str, IndicatorDefinition]:
+        """Definițiile existente pentru codurile date, în ordinea cerută."""
+        self._ensure_loaded()
+        return {code: self._by_code[code] for code in codes if code in self._by_code}
+
+    def all(self, category: Optional[IndicatorCategory] = None) -> list[IndicatorDefinition]:
+        """Toate definițiile, opțional filtrate pe categorie."""
+        self._ensure_loaded()
+        definitions = list(self._by_code.values())
+        if category:
+            definitions = [d for d in definitions if d.category == category]
+        return definitions
+
+
+# Instanța partajată la nivel de proces
+indicator_registry = IndicatorRegistry()
@@ -0,0 +1,136 @@
+"""
+Serviciu pentru calculul KPI-urilor din dashboard
+"""
+
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session
+
+from app.models.indicator import IndicatorValue, AggregationLevel
+from app.models.reporting import kpi_summary_view, KPI_SUMMARY_COLUMNS
+from app.services.indicator_registry import indicator_registry
+
+
+# Indicatorii principali afișați în dashboard
+DEFAULT_KPI_CODES = [
+    "TOTAL_COMPANIES",
+    "TOTAL_EMPLOYEES",
+    "TOTAL_TURNOVER",
+    "TOTAL_EXPORTS",
+    "PRODUCTIVITY"
+]
+
+
+class KPIService:
+    """
+    Serviciu pentru KPI-uri agregate pe an.
+    Definițiile vin din registrul de indicatori. KPI-urile regionale
+    principale sunt citite din `mv_kpi_summary`; pentru alți indicatori,
+    valorile din anul curent și anul precedent sunt extrase într-un singur
+    query grupat, indiferent de numărul de indicatori ceruți.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_kpis(
+        self,
+        codes: list[str],
+        year: int,
+        aggregation_level: AggregationLevel = AggregationLevel.REGION
+    ) -> dict:
+        """
+        Returnează valoarea curentă, valoarea din anul precedent și
+        variația procentuală pentru fiecare indicator din `codes`.
+
+        Indicatorii care nu există în catalog sunt omiși; ordinea din
+        `codes` este păstrată în rezultat. Se folosesc doar valorile anuale.
+        Nivelul `judet` nu are o singură valoare pe an (câte una per județ),
+        deci nu este acceptat.
+        """
+        import numpy as np
+
+        if aggregation_level == AggregationLevel.COUNTY:
+            raise ValueError("KPIs are not defined at county level")
+
+        definitions = indicator_registry.get_many(codes)
+
+        if not definitions:
+            return {}
+
+        ids = [d.id for d in definitions.values()]
+
+        if aggregation_level == AggregationLevel.REGION and all(
+            code in KPI_SUMMARY_COLUMNS for code in definitions
+        ):
+            pairs = self._summary_values(list(definitions), year)
+        else:
+            pairs = self._grouped_values(ids, year, aggregation_level)
+
+        current = np.array([p[0] for p in pairs], dtype=float)
+        previous = np.array([p[1] for p in pairs], dtype=float)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            change_pct = np.where(
+                previous != 0, (current - previous) / previous * 100, np.nan
+            )
+
+        kpis = {}
+        for i, (code, indicator) in enumerate(definitions.items()):
+            kpis[code] = {
+                "name": indicator.name,
+                "value": None if np.isnan(current[i]) else float(current[i]),
+                "prev_value": None if np.isnan(previous[i]) else float(previous[i]),
+                "unit": indicator.unit.value,
+                # Variație zero sau nedefinită -> None, ca în sumarul anual
+                "change_pct": round(float(change_pct[i]), 2)
+                if np.isfinite(change_pct[i]) and change_pct[i] else None
+            }
+
+        return kpis
+
+    def _summary_values(self, codes: list[str], year: int) -> list[tuple]:
+        """
+        (valoare, valoare an precedent) pentru KPI-urile regionale principale,
+        citite din `mv_kpi_summary` (cel mult două rânduri, căutare după an).
+        """
+        summary = kpi_summary_view.c
+        columns = [summary[KPI_SUMMARY_COLUMNS[code]] for code in codes]
+        rows = {
+            r[0]: tuple(r[1:])
+            for r in self.db.query(summary.year, *columns).filter(
+                summary.year.in_([year, year - 1])
+            ).all()
+        }
+        empty = (None,) * len(codes)
+        return list(zip(rows.get(year, empty), rows.get(year - 1, empty)))
+
+    def _grouped_values(
+        self,
+        ids: list[int],
+        year: int,
+        aggregation_level: AggregationLevel
+    ) -> list[tuple]:
+        """
+        (valoare, valoare an precedent) pentru indicatori arbitrari, într-un
+        singur query grupat pe `indicator_values`. Rândurile trimestriale sunt
+        excluse: altfel MAX ar putea alege un trimestru în locul valorii anuale.
+        """
+        rows = self.db.query(
+            IndicatorValue.indicator_id,
+            func.max(case(
+                (IndicatorValue.year == year, IndicatorValue.value)
+            )).label("value"),
+            func.max(case(
+                (IndicatorValue.year == year - 1, IndicatorValue.value)
+            )).label("prev_value")
+        ).filter(
+            IndicatorValue.indicator_id.in_(ids),
+            IndicatorValue.year.in_([year, year - 1]),
+            IndicatorValue.aggregation_level == aggregation_level,
+            IndicatorValue.quarter.is_(None)
+        ).group_by(
+            IndicatorValue.indicator_id
+        ).all()
+
+        values_by_id = {r.indicator_id: (r.value, r.prev_value) for r in rows}
+        return [values_by_id.get(i, (None, None)) for i in ids]
@@ -0,0 +1,164 @@
+"""
+Normalizarea vectorizată a DataFrame-urilor înainte de încărcarea în bază
+"""
+
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Optional
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.indicator import AggregationLevel
+from app.models.region import County
+
+# pandas se importă la primul apel: modulul e încărcat și de procese care
+# nu normalizează nimic
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# Coloanele cadrului normalizat, în ordinea așteptată de bulk_upsert
+NORMALIZED_COLUMNS = [
+    "indicator_id", "county_id", "year", "quarter",
+    "aggregation_level", "value", "is_provisional"
+]
+
+
+class CountyTable:
+    """
+    Tabelul județelor (cod -> id) ținut în memorie ca DataFrame, folosit
+    pentru maparea codurilor printr-un singur merge. Se reîncarcă la
+    expirarea TTL-ului sau după `invalidate()`.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        ttl_seconds: int = settings.indicator_registry_ttl
+    ):
+        self._session_factory = session_factory
+        self._ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._frame: Optional["pd.DataFrame"] = None
+        self._loaded_at: Optional[float] = None
+
+    def load(self) -> "pd.DataFrame":
+        """(Re)încarcă tabelul din baza de date."""
+        import pandas as pd
+
+        db = self._session_factory()
+        try:
+            rows = db.query(County.code, County.id).all()
+        finally:
+            db.close()
+
+        frame = pd.DataFrame(rows, columns=["county_key", "county_id"])
+        frame["county_key"] = frame["county_key"].str.strip().str.upper()
+        frame["county_id"] = frame["county_id"].astype("Int64")
+
+        with self._lock:
+            self._frame = frame
+            self._loaded_at = time.monotonic()
+        return frame
+
+    def invalidate(self):
+        """Marchează tabelul ca expirat; următoarea citire îl reîncarcă."""
+        with self._lock:
+            self._loaded_at = None
+
+    def frame(self) -> "pd.DataFrame":
+        """Tabelul curent, cu coloanele `county_key` și `county_id`."""
+        loaded_at = self._loaded_at
+        if loaded_at is None or time.monotonic() - loaded_at > self._ttl_seconds:
+            return self.load()
+        return self._frame
+
+
+# Instanța partajată la nivel de proces
+county_table = CountyTable()
+
+
+def melt_year_columns(df: "pd.DataFrame") -> "pd.DataFrame":
+    """
+    Transformă un DataFrame "lat" (o coloană per an, ca în exporturile
+    Eurostat) în format lung, cu coloanele `year` și `value`.
+    """
+    year_columns = [col for col in df.columns if str(col).isdigit()]
+    id_columns = [col for col in df.columns if col not in year_columns]
+    return df.melt(
+        id_vars=id_columns,
+        value_vars=year_columns,
+        var_name="year",
+        value_name="value"
+    )
+
+
+def normalize_values(
+    df: "pd.DataFrame",
+    indicator_id: int,
+    year_column: str = "year",
+    value_column: str = "value",
+    county_column: Optional[str] = None,
+    default_level: AggregationLevel = AggregationLevel.REGION,
+    counties: Optional[CountyTable] = None
+) -> tuple["pd.DataFrame", "pd.DataFrame"]:
+    """
+    Normalizează un DataFrame de valori, pe coloane, fără iterare pe rânduri.
+
+    - anul și valoarea sunt convertite numeric (valorile invalide devin NaN);
+    - codurile de județ sunt mapate la id-uri printr-un merge cu tabelul
+      județelor; rândurile cu județ devin nivel `judet`, celelalte primesc
+      `default_level`;
+    - rândurile fără an întreg, fără valoare sau cu un cod de județ
+      necunoscut sunt separate, cu motivul în coloana `reason`.
+
+    Returns:
+        (cadrul curat cu NORMALIZED_COLUMNS, cadrul rândurilor respinse)
+    """
+    import pandas as pd
+
+    if df is None or df.empty:
+        return pd.DataFrame(columns=NORMALIZED_COLUMNS), pd.DataFrame(columns=["reason"])
+
+    frame = df.reset_index(drop=True)
+    reason = pd.Series(pd.NA, index=frame.index, dtype="object")
+
+    if year_column in frame.columns:
+        year = pd.to_numeric(frame[year_column], errors="coerce")
+    else:
+        year = pd.Series(float("nan"), index=frame.index)
+    if value_column in frame.columns:
+        value = pd.to_numeric(frame[value_column], errors="coerce")
+    else:
+        value = pd.Series(float("nan"), index=frame.index)
+
+    reason = reason.mask(value.isna(), "invalid value")
+    reason = reason.mask(year.isna() | (year % 1 != 0), "invalid year")
+
+    county_id = pd.Series(pd.NA, index=frame.index, dtype="Int64")
+    if county_column and county_column in frame.columns:
+        keys = frame[county_column].astype("string").str.strip().str.upper()
+        keys = keys.mask(keys == "")
+        lookup = (counties or county_table).frame()
+        county_id = keys.to_frame("county_key").merge(
+            lookup, on="county_key", how="left"
+        )["county_id"].set_axis(frame.index)
+        reason = reason.mask(keys.notna() & county_id.isna(), "unknown county")
+
+    ok = reason.isna()
+    clean = pd.DataFrame({
+        "indicator_id": pd.Series(indicator_id, index=frame.index, dtype="Int64")[ok],
+        "county_id": county_id[ok].astype("Int64"),
+        "year": year[ok].astype("Int64"),
+        "quarter": pd.Series(pd.NA, index=frame.index, dtype="Int64")[ok],
+        "aggregation_level": county_id[ok].notna().map({
+            True: AggregationLevel.COUNTY.value,
+            False: default_level.value
+        }),
+        "value": value[ok].astype("float64"),
+        "is_provisional": pd.Series(0, index=frame.index, dtype="Int64")[ok]
+    }, columns=NORMALIZED_COLUMNS)
+
+    rejects = frame[~ok].assign(reason=reason[~ok])
+    return clean.reset_index(drop=True), rejects.reset_index(drop=True)
@@ -0,0 +1,261 @@
+"""
+Serviciu pentru generarea asincronă a rapoartelor (PDF, xlsx)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.region import County
+from app.models.report import ReportLog
+from app.services.export import build_export_query, write_xlsx
+from app.services.kpi import KPIService, DEFAULT_KPI_CODES
+
+
+# Număr maxim de grafice într-un raport PDF
+MAX_CHARTS = 10
+
+
+def params_hash(parameters: dict) -> str:
+    """Hash stabil al parametrilor unei cereri de raport."""
+    payload = json.dumps(parameters, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ReportJobQueue:
+    """
+    Coadă de joburi pentru rapoarte, executate într-un pool de thread-uri.
+
+    Fiecare cerere este înregistrată în `report_logs`; starea și progresul
+    sunt actualizate pe parcursul generării. O cerere identică (aceiași
+    parametri) reutilizează un raport finalizat în fereastra
+    `report_dedup_ttl` sau un job încă în lucru, în loc să genereze din
+    nou fișierul.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        max_workers: int = settings.report_workers,
+        output_dir: str = settings.reports_dir
+    ):
+        self._session_factory = session_factory
+        self._max_workers = max_workers
+        self._output_dir = output_dir
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="report-worker"
+                )
+            return self._executor
+
+    def shutdown(self):
+        """Oprește pool-ul de workeri (apelat la shutdown-ul aplicației)."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    # ==================== API PUBLIC ====================
+
+    def submit(self, db: Session, report_type: str, title: str, fmt: str, parameters: dict) -> ReportLog:
+        """
+        Înregistrează un job nou sau întoarce jobul identic existent.
+        """
+        digest = params_hash({"report_type": report_type, "title": title, "format": fmt, **parameters})
+
+        # Joburile în curs mai vechi decât timeout-ul sunt considerate
+        # abandonate (ex: worker repornit) și nu mai sunt reutilizate
+        existing = db.query(ReportLog).filter(
+            ReportLog.params_hash == digest,
+            or_(
+                and_(
+                    ReportLog.status == "completed",
+                    ReportLog.generated_at >= func.now() - timedelta(seconds=settings.report_dedup_ttl)
+                ),
+                and_(
+                    ReportLog.status.in_(("queued", "running")),
+                    ReportLog.generated_at >= func.now() - timedelta(seconds=settings.report_job_timeout)
+                )
+            )
+        ).order_by(ReportLog.generated_at.desc()).first()
+
+        if existing and (existing.status != "completed" or self._artifact_exists(existing)):
+            return existing
+
+        job = ReportLog(
+            report_id=uuid.uuid4(),
+            report_type=report_type,
+            title=title,
+            format=fmt,
+            parameters=parameters,
+            params_hash=digest,
+            status="queued",
+            progress=0
+        )
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+
+        self._get_executor().submit(self._run, job.report_id)
+        return job
+
+    def get(self, db: Session, report_id: uuid.UUID) -> Optional[ReportLog]:
+        """Jobul cu id-ul dat sau None."""
+        return db.query(ReportLog).filter(ReportLog.report_id == report_id).first()
+
+    # ==================== WORKER ====================
+
+    @staticmethod
+    def _artifact_exists(job: ReportLog) -> bool:
+        return bool(job.file_path) and os.path.exists(job.file_path)
+
+    def _update(self, db: Session, job: ReportLog, **fields):
+        for name, value in fields.items():
+            setattr(job, name, value)
+        db.commit()
+
+    def _run(self, report_id: uuid.UUID):
+        db = self._session_factory()
+        try:
+            job = self.get(db, report_id)
+            if job is None:
+                return
+
+            self._update(db, job, status="running", progress=5)
+
+            os.makedirs(self._output_dir, exist_ok=True)
+            path = os.path.join(self._output_dir, f"{report_id}.{job.format}")
+
+            if job.format == "xlsx":
+                self._render_xlsx(db, job, path)
+            else:
+                self._render_pdf(db, job, path)
+
+            self._update(
+                db, job,
+                status="completed",
+                progress=100,
+                file_path=path,
+                completed_at=datetime.now()
+            )
+        except Exception as e:
+            db.rollback()
+            print(f"Error generating report {report_id}: {e}")
+            job = self.get(db, report_id)
+            if job is not None:
+                self._update(db, job, status="failed", error_message=str(e))
+        finally:
+            db.close()
+
+    # ==================== RANDARE ====================
+
+    def _data_query(self, db: Session, parameters: dict):
+        query = build_export_query(
+            db,
+            start_year=parameters["year"],
+            end_year=parameters["year"],
+            indicator_codes=parameters.get("indicator_codes")
+        )
+        if parameters.get("county_codes"):
+            query = query.filter(County.code.in_(parameters["county_codes"]))
+        return query
+
+    def _render_xlsx(self, db: Session, job: ReportLog, path: str):
+        # Progresul e salvat înainte de deschiderea cursorului: un commit
+        # în timpul iterării ar închide cursorul server-side
+        self._update(db, job, progress=20)
+        rows = (tuple(r) for r in self._data_query(db, job.parameters).yield_per(2000))
+
+        tmp_path = write_xlsx(rows, sheet_per_indicator=True)
+        os.replace(tmp_path, path)
+
+    def _render_pdf(self, db: Session, job: ReportLog, path: str):
+        from reportlab.graphics.charts.barcharts import VerticalBarChart
+        from reportlab.graphics.shapes import Drawing
+        from reportlab.lib import colors
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.styles import getSampleStyleSheet
+        from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+        parameters = job.parameters
+        year = parameters["year"]
+        styles = getSampleStyleSheet()
+        table_style = TableStyle([
+            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#1f3a5f")),
+            ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+            ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
+            ("FONTSIZE", (0, 0), (-1, -1), 8)
+        ])
+
+        story = [
+            Paragraph(job.title or "Raport", styles["Title"]),
+            Paragraph(f"{settings.region_name} - {year}", styles["Heading2"]),
+            Spacer(1, 12)
+        ]
+
+        # KPI-uri principale
+        kpis = KPIService(db).get_kpis(DEFAULT_KPI_CODES, year)
+        self._update(db, job, progress=20)
+
+        if kpis:
+            kpi_rows = [["Indicator", "Valoare", "Unitate", "Variație %"]]
+            for kpi in kpis.values():
+                kpi_rows.append([
+                    kpi["name"],
+                    f"{kpi['value']:,.2f}" if kpi["value"] is not None else "-",
+                    kpi["unit"],
+                    f"{kpi['change_pct']:+.2f}" if kpi["change_pct"] is not None else "-"
+                ])
+            kpi_table = Table(kpi_rows, repeatRows=1)
+            kpi_table.setStyle(table_style)
+            story += [Paragraph("Indicatori principali", styles["Heading3"]), kpi_table, Spacer(1, 12)]
+
+        # Date detaliate
+        rows = self._data_query(db, parameters).all()
+        self._update(db, job, progress=50)
+
+        data_rows = [["Cod", "Indicator", "An", "Valoare", "Județ"]]
+        by_indicator: dict[str, list] = {}
+        for code, name, row_year, value, county_name in rows:
+            data_rows.append([code, name, row_year, f"{value:,.2f}", county_name or "-"])
+            if county_name:
+                by_indicator.setdefault(code, []).append((county_name, value))
+
+        data_table = Table(data_rows, repeatRows=1)
+        data_table.setStyle(table_style)
+        story += [Paragraph("Date", styles["Heading3"]), data_table, Spacer(1, 12)]
+
+        # Grafice pe județe
+        if parameters.get("include_charts"):
+            for code, points in list(by_indicator.items())[:MAX_CHARTS]:
+                drawing = Drawing(400, 180)
+                chart = VerticalBarChart()
+                chart.x, chart.y, chart.width, chart.height = 40, 30, 340, 130
+                chart.data = [[v for _, v in points]]
+                chart.categoryAxis.categoryNames = [c for c, _ in points]
+                chart.bars[0].fillColor = colors.HexColor("#1f3a5f")
+                drawing.add(chart)
+                story += [Paragraph(code, styles["Heading4"]), drawing]
+        self._update(db, job, progress=80)
+
+        SimpleDocTemplate(path, pagesize=A4, title=job.title or "Raport").build(story)
+
+
+# Instanța partajată la nivel de proces
+report_queue = ReportJobQueue()
@@ -0,0 +1,34 @@
+"""
+Refresh pentru materialized views de raportare
+"""
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+
+# Ordinea refresh-ului; toate au un index unic, necesar pentru CONCURRENTLY
+REPORTING_VIEWS = [
+    "mv_indicator_data",
+    "mv_kpi_summary",
+    "mv_county_comparison"
+]
+
+
+def refresh_reporting_views(db: Session) -> bool:
+    """
+    Reîmprospătează view-urile de raportare cu REFRESH ... CONCURRENTLY,
+    astfel încât citirile nu sunt blocate pe durata refresh-ului.
+
+    Rulează în tranzacția curentă (într-un savepoint), deci datele noi și
+    view-urile devin vizibile la același commit. Nu face commit. Dacă
+    view-urile lipsesc (schema SQL neaplicată), eroarea este raportată și
+    tranzacția apelantului rămâne validă.
+    """
+    try:
+        with db.begin_nested():
+            for view in REPORTING_VIEWS:
+                db.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view}"))
+        return True
+    except Exception as e:
+        print(f"Error refreshing reporting views: {e}")
+        return False
@@ -2,6 +2,12 @@
 -- AUTOMOTIVE VEST ANALYTICS - DATABASE SCHEMA
 -- PostgreSQL 15+
 -- ============================================
+--
+-- Schema completă la ultima revizie Alembic, pentru referință și pentru
+-- crearea unei baze noi cu psql (marcată la final în alembic_version).
+-- Modificările se fac prin migrări (app/database/migrations/versions),
+-- apoi se reflectă și aici:
+--   alembic -c app/database/migrations/alembic.ini upgrade head
 
 -- Extensii necesare
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
@@ -120,8 +126,11 @@ COMMENT ON TABLE indicator_definitions IS 'Catalog de indicatori statistici';
 COMMENT ON COLUMN indicator_definitions.is_calculated IS '1 dacă indicatorul e calculat din alți indicatori';
 
 -- Valori indicatori
+-- Partiționat HASH pe indicator_id: citirile (o serie a unui indicator) și
+-- importurile (un indicator, toți anii) ating o singură partiție. Cheia
+-- primară include cheia de partiționare, cum cere PostgreSQL; id rămâne unic.
 CREATE TABLE IF NOT EXISTS indicator_values (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     indicator_id INTEGER NOT NULL REFERENCES indicator_definitions(id) ON DELETE CASCADE,
     county_id INTEGER REFERENCES counties(id) ON DELETE SET NULL,
     year SMALLINT NOT NULL,
@@ -134,15 +143,25 @@ CREATE TABLE IF NOT EXISTS indicator_values (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP,
 
-    -- Constraint pentru unicitate
-    CONSTRAINT uq_indicator_value UNIQUE (indicator_id, county_id, year, quarter, aggregation_level)
-);
-
-CREATE INDEX idx_values_indicator ON indicator_values(indicator_id);
-CREATE INDEX idx_values_county ON indicator_values(county_id);
-CREATE INDEX idx_values_year ON indicator_values(year);
-CREATE INDEX idx_values_aggregation ON indicator_values(aggregation_level);
-CREATE INDEX idx_values_lookup ON indicator_values(indicator_id, year, aggregation_level);
+    CONSTRAINT indicator_values_pkey PRIMARY KEY (id, indicator_id)
+) PARTITION BY HASH (indicator_id);
+
+CREATE TABLE IF NOT EXISTS indicator_values_p0 PARTITION OF indicator_values FOR VALUES WITH (MODULUS 8, REMAINDER 0);
+CREATE TABLE IF NOT EXISTS indicator_values_p1 PARTITION OF indicator_values FOR VALUES WITH (MODULUS 8, REMAINDER 1);
+CREATE TABLE IF NOT EXISTS indicator_values_p2 PARTITION OF indicator_values FOR VALUES WITH (MODULUS 8, REMAINDER 2);
+CREATE TABLE IF NOT EXISTS indicator_values_p3 PARTITION OF indicator_values FOR VALUES WITH (MODULUS 8, REMAINDER 3);
+CREATE TABLE IF NOT EXISTS indicator_values_p4 PARTITION OF indicator_values FOR VALUES WITH (MODULUS 8, REMAINDER 4);
+CREATE TABLE IF NOT EXISTS indicator_values_p5 PARTITION OF indicator_values FOR VALUES WITH (MODULUS 8, REMAINDER 5);
+CREATE TABLE IF NOT EXISTS indicator_values_p6 PARTITION OF indicator_values FOR VALUES WITH (MODULUS 8, REMAINDER 6);
+CREATE TABLE IF NOT EXISTS indicator_values_p7 PARTITION OF indicator_values FOR VALUES WITH (MODULUS 8, REMAINDER 7);
+
+-- Singurul index: pe forma citirilor calde, acoperitor (index-only scan) și
+-- țintă pentru INSERT ... ON CONFLICT. NULLS NOT DISTINCT: county_id/quarter
+-- NULL pentru date regionale/anuale trebuie să intre în conflict la upsert.
+CREATE UNIQUE INDEX IF NOT EXISTS uq_indicator_value ON indicator_values
+    (indicator_id, aggregation_level, county_id, year, quarter)
+    INCLUDE (value, is_provisional)
+    NULLS NOT DISTINCT;
 
 COMMENT ON TABLE indicator_values IS 'Valori ale indicatorilor pe dimensiuni temporale și geografice';
 
@@ -185,6 +204,23 @@ CREATE INDEX idx_agg_sector ON aggregated_company_data(sector_id);
 
 COMMENT ON TABLE aggregated_company_data IS 'Date agregate despre firme, nu individuale';
 
+-- Firme (identificate anonim), pentru analize de concentrare și structură
+CREATE TABLE IF NOT EXISTS companies (
+    id SERIAL PRIMARY KEY,
+    company_id VARCHAR(50) NOT NULL UNIQUE,  -- ID intern, nu CUI
+    county_id INTEGER NOT NULL REFERENCES counties(id),
+    sector_id INTEGER NOT NULL REFERENCES company_sectors(id),
+    size_class VARCHAR(20),  -- "micro", "mica", "medie", "mare"
+    employees_count INTEGER,
+    turnover DOUBLE PRECISION,
+    year_data INTEGER,
+    is_foreign_owned BOOLEAN,
+    is_exporter BOOLEAN,
+    has_rd_activity BOOLEAN,
+    created_at TIMESTAMP DEFAULT now(),
+    updated_at TIMESTAMP
+);
+
 -- ============================================
 -- TABELE PENTRU RAPOARTE ȘI CACHE
 -- ============================================
@@ -192,17 +228,23 @@ COMMENT ON TABLE aggregated_company_data IS 'Date agregate despre firme, nu indi
 -- Log rapoarte generate
 CREATE TABLE IF NOT EXISTS report_logs (
     id SERIAL PRIMARY KEY,
-    report_id UUID DEFAULT uuid_generate_v4(),
+    report_id UUID NOT NULL UNIQUE DEFAULT uuid_generate_v4(),
     report_type VARCHAR(50) NOT NULL,
     title VARCHAR(200),
+    format VARCHAR(10) NOT NULL DEFAULT 'pdf',  -- "pdf", "xlsx"
     parameters JSONB,
+    params_hash VARCHAR(64),  -- hash al parametrilor, pentru deduplicare
     generated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    completed_at TIMESTAMP,
     file_path VARCHAR(500),
-    status VARCHAR(20) DEFAULT 'generated'
+    status VARCHAR(20) DEFAULT 'queued',  -- queued, running, completed, failed
+    progress SMALLINT DEFAULT 0,  -- 0-100
+    error_message TEXT
 );
 
 CREATE INDEX idx_reports_type ON report_logs(report_type);
 CREATE INDEX idx_reports_date ON report_logs(generated_at);
+CREATE INDEX idx_reports_params ON report_logs(params_hash, status);
 
 -- Cache pentru date procesate
 CREATE TABLE IF NOT EXISTS data_cache (
@@ -231,6 +273,7 @@ CREATE TABLE IF NOT EXISTS import_logs (
     records_imported INTEGER,
     records_updated INTEGER,
     records_failed INTEGER,
+    duration_seconds DOUBLE PRECISION,  -- durata totală a importului
     status VARCHAR(20) DEFAULT 'completed',
     error_message TEXT,
     metadata JSONB
@@ -239,24 +282,62 @@ CREATE TABLE IF NOT EXISTS import_logs (
 CREATE INDEX idx_imports_source ON import_logs(source);
 CREATE INDEX idx_imports_date ON import_logs(import_date);
 
+-- Prognoze (un rând per serie × metodă × an), rescrise la fiecare rulare
+-- a prognozelor (vezi app/services/forecasting.py)
+CREATE TABLE IF NOT EXISTS forecasts (
+    id SERIAL PRIMARY KEY,
+    indicator_id INTEGER NOT NULL REFERENCES indicator_definitions(id) ON DELETE CASCADE,
+    county_id INTEGER REFERENCES counties(id) ON DELETE CASCADE,
+    aggregation_level VARCHAR(20) NOT NULL,  -- "judet", "regiune", "tara", "ue"
+    method VARCHAR(20) NOT NULL,  -- "linear", "ets", "arima"
+    year SMALLINT NOT NULL,
+    value DOUBLE PRECISION NOT NULL,
+    lower_bound DOUBLE PRECISION,
+    upper_bound DOUBLE PRECISION,
+    confidence_level DOUBLE PRECISION NOT NULL DEFAULT 0.95,
+    n_observations INTEGER,
+    last_observed_year SMALLINT,
+    aic DOUBLE PRECISION,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT uq_forecast UNIQUE NULLS NOT DISTINCT (indicator_id, county_id, aggregation_level, method, year)
+);
+
+CREATE INDEX idx_forecasts_series ON forecasts(indicator_id, aggregation_level, county_id);
+
+COMMENT ON TABLE forecasts IS 'Prognoze ale indicatorilor cu intervale de predicție';
+
 -- ============================================
 -- VIEWS PENTRU RAPORTARE
 -- ============================================
 
--- View pentru date complete indicator
-CREATE OR REPLACE VIEW v_indicator_data AS
+-- View-urile de raportare sunt materializate: citirile din dashboard devin
+-- căutări pe index, iar join-urile și agregările rulează doar la refresh.
+-- După fiecare import: REFRESH MATERIALIZED VIEW CONCURRENTLY <view>
+-- (vezi app/services/reporting_views.py). Refresh-ul concurent cere câte un
+-- index unic pe fiecare view.
+
+-- Vechile view-uri simple, înlocuite de cele materializate
+DROP VIEW IF EXISTS v_indicator_data;
+DROP VIEW IF EXISTS v_kpi_summary;
+DROP VIEW IF EXISTS v_county_comparison;
+
+-- Date complete indicator (un rând per valoare)
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_indicator_data AS
 SELECT
     iv.id,
+    iv.indicator_id,
     id.code AS indicator_code,
     id.name AS indicator_name,
-    id.category,
-    id.unit,
+    id.category::text AS category,
+    id.unit::text AS unit,
+    iv.county_id,
     c.name AS county_name,
     c.code AS county_code,
     r.name AS region_name,
     iv.year,
     iv.quarter,
-    iv.aggregation_level,
+    iv.aggregation_level::text AS aggregation_level,
     iv.value,
     iv.is_provisional,
     iv.is_estimated
@@ -265,8 +346,12 @@ JOIN indicator_definitions id ON iv.indicator_id = id.id
 LEFT JOIN counties c ON iv.county_id = c.id
 LEFT JOIN regions r ON c.region_id = r.id;
 
--- View pentru sumar KPI pe an
-CREATE OR REPLACE VIEW v_kpi_summary AS
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_indicator_data_id ON mv_indicator_data(id);
+CREATE INDEX IF NOT EXISTS idx_mv_indicator_data_code ON mv_indicator_data(indicator_code, aggregation_level, year);
+CREATE INDEX IF NOT EXISTS idx_mv_indicator_data_county ON mv_indicator_data(county_code, indicator_code, year);
+
+-- Sumar KPI pe an
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_kpi_summary AS
 SELECT
     iv.year,
     MAX(CASE WHEN id.code = 'TOTAL_COMPANIES' THEN iv.value END) AS total_companies,
@@ -277,24 +362,30 @@ SELECT
 FROM indicator_values iv
 JOIN indicator_definitions id ON iv.indicator_id = id.id
 WHERE iv.aggregation_level = 'regiune'
-GROUP BY iv.year
-ORDER BY iv.year;
+GROUP BY iv.year;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_kpi_summary_year ON mv_kpi_summary(year);
 
--- View pentru comparație județe
-CREATE OR REPLACE VIEW v_county_comparison AS
+-- Comparație județe (media e calculată pe aceeași perioadă: an și trimestru)
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_county_comparison AS
 SELECT
+    iv.id AS value_id,
     c.name AS county_name,
     c.code AS county_code,
     id.code AS indicator_code,
     id.name AS indicator_name,
     iv.year,
+    iv.quarter,
     iv.value,
-    iv.value / NULLIF(AVG(iv.value) OVER (PARTITION BY iv.indicator_id, iv.year), 0) * 100 AS vs_average_pct
+    iv.value / NULLIF(AVG(iv.value) OVER (PARTITION BY iv.indicator_id, iv.year, iv.quarter), 0) * 100 AS vs_average_pct
 FROM indicator_values iv
 JOIN indicator_definitions id ON iv.indicator_id = id.id
 JOIN counties c ON iv.county_id = c.id
 WHERE iv.aggregation_level = 'judet';
 
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_county_comparison_id ON mv_county_comparison(value_id);
+CREATE INDEX IF NOT EXISTS idx_mv_county_comparison_lookup ON mv_county_comparison(indicator_code, year);
+
 -- ============================================
 -- FUNCȚII UTILITARE
 -- ============================================
@@ -355,6 +446,19 @@ CREATE TRIGGER trg_values_timestamp
     BEFORE UPDATE ON indicator_values
     FOR EACH ROW EXECUTE FUNCTION update_timestamp();
 
+-- ============================================
+-- VERSIUNE SCHEMĂ (Alembic)
+-- ============================================
+
+-- Revizia corespunzătoare acestui fișier (SCHEMA_REVISION din
+-- app/database/connection.py); API-ul o verifică la pornire
+CREATE TABLE IF NOT EXISTS alembic_version (
+    version_num VARCHAR(32) NOT NULL,
+    CONSTRAINT alembic_version_pkc PRIMARY KEY (version_num)
+);
+
+INSERT INTO alembic_version (version_num) VALUES ('0008_companies');
+
 -- ============================================
 -- GRANTS (pentru producție)
 -- ============================================
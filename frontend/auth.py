@@ -29,10 +29,14 @@ USERS = {
 USE_DATABASE = False
 
 def _get_db_connection():
-    """Încearcă să obțină o conexiune la baza de date"""
+    """Încearcă să obțină o conexiune din pool-ul partajat al frontend-ului"""
     global USE_DATABASE
     try:
-        from db_utils import get_db_connection
+        from db_utils import _check_db, get_db_connection
+        # Sondajul de sănătate e cached: fără DB nu se mai așteaptă timeout-ul
+        if not _check_db():
+            USE_DATABASE = False
+            return None
         conn = get_db_connection()
         USE_DATABASE = True
         return conn
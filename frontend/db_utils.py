@@ -3,8 +3,12 @@ Utilități pentru conectarea la baza de date din frontend
 Cu fallback pe date demo când baza de date nu este disponibilă
 """
 
+import functools
+import inspect
 import os
+import time
 import pandas as pd
+import streamlit as st
 
 # Configurare conexiune baza de date
 POSTGRES_HOST = os.environ.get("POSTGRES_HOST", "automotive_vest_db")
@@ -18,31 +22,69 @@ DATABASE_URL = os.environ.get(
     f"postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
 )
 
-# Flag global pentru a detecta dacă baza de date e disponibilă
+# Configurare pool de conexiuni (un singur engine per proces Streamlit)
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", "10"))
+DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", "1800"))
+DB_CONNECT_TIMEOUT = 3
+
+# Cât timp (secunde) e reținut un rezultat negativ al verificării DB
+# înainte de a încerca din nou
+DB_RETRY_INTERVAL = 30
+
+# Cache-ul rezultatelor query-urilor: intrările sunt invalidate de schimbarea
+# versiunii datelor; TTL-ul e doar o plasă de siguranță
+QUERY_CACHE_TTL = 3600
+QUERY_CACHE_MAX_ENTRIES = 256
+
+# Cât timp (secunde) e refolosită versiunea datelor: toate funcțiile cached
+# dintr-un rerun o citesc o singură dată, iar un import nou devine vizibil
+# după cel mult atât
+DATA_VERSION_TTL = 5
+
+# Rezultatul verificării DB: (disponibil, momentul verificării)
 _DB_AVAILABLE = None
 
 
+@st.cache_resource(show_spinner=False)
+def get_engine():
+    """
+    Returnează engine-ul SQLAlchemy partajat de toate sesiunile.
+    Creat o singură dată per proces; conexiunile sunt refolosite din pool,
+    iar `pool_pre_ping` înlocuiește conexiunile închise de server.
+    """
+    from sqlalchemy import create_engine
+    return create_engine(
+        DATABASE_URL,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=True,
+        connect_args={"connect_timeout": DB_CONNECT_TIMEOUT}
+    )
+
+
 def _check_db():
-    """Verifică dacă baza de date e disponibilă (cached)"""
+    """
+    Verifică dacă baza de date e disponibilă (cached).
+    Un rezultat pozitiv e reținut până la prima eroare (`_reset_db_check`),
+    unul negativ doar DB_RETRY_INTERVAL secunde.
+    """
     global _DB_AVAILABLE
     if _DB_AVAILABLE is not None:
-        return _DB_AVAILABLE
+        available, checked_at = _DB_AVAILABLE
+        if available or time.monotonic() - checked_at < DB_RETRY_INTERVAL:
+            return available
     try:
-        import psycopg2
-        conn = psycopg2.connect(
-            host=POSTGRES_HOST, port=POSTGRES_PORT,
-            user=POSTGRES_USER, password=POSTGRES_PASSWORD,
-            database=POSTGRES_DB, connect_timeout=3
-        )
-        # Verifică efectiv că baza de date funcționează cu un query simplu
-        cur = conn.cursor()
-        cur.execute("SELECT 1")
-        cur.close()
-        conn.close()
-        _DB_AVAILABLE = True
+        from sqlalchemy import text
+        # Conexiunea vine din pool: după primul succes nu mai e un connect nou
+        with get_engine().connect() as conn:
+            conn.execute(text("SELECT 1"))
+        available = True
     except Exception:
-        _DB_AVAILABLE = False
-    return _DB_AVAILABLE
+        available = False
+    _DB_AVAILABLE = (available, time.monotonic())
+    return available
 
 
 def _reset_db_check():
@@ -51,22 +93,115 @@ def _reset_db_check():
     _DB_AVAILABLE = None
 
 
-def get_engine():
-    """Returnează engine-ul SQLAlchemy"""
-    from sqlalchemy import create_engine
-    return create_engine(DATABASE_URL)
+def get_db_connection():
+    """
+    Returnează o conexiune DBAPI (psycopg2) din pool-ul engine-ului.
+    `close()` o înapoiază în pool în loc să închidă conexiunea TCP.
+    """
+    return get_engine().raw_connection()
 
 
-def get_db_connection():
-    """Returnează o conexiune psycopg2 directă la baza de date"""
-    import psycopg2
-    return psycopg2.connect(
-        host=POSTGRES_HOST,
-        port=POSTGRES_PORT,
-        user=POSTGRES_USER,
-        password=POSTGRES_PASSWORD,
-        database=POSTGRES_DB
-    )
+# Indicatorii afișați pe paginile tematice
+SALARY_CODES = ['AVG_GROSS_SALARY', 'AVG_NET_SALARY']
+LABOR_CODES = ['EMPLOYEES_COUNT', 'UNEMPLOYED_COUNT', 'UNEMPLOYMENT_RATE']
+INDUSTRY_CODES = ['IND_PROD_INDEX', 'IND_TURNOVER_INDEX']
+
+# Indexul panourilor returnate de get_indicator_panel
+PANEL_INDEX = ['county_name', 'county_code', 'year', 'quarter']
+
+# Coloanele seriei de prognoză; rândurile istorice au metoda FORECAST_HISTORY
+FORECAST_COLUMNS = ['method', 'year', 'value', 'lower_bound', 'upper_bound']
+FORECAST_HISTORY = 'istoric'
+
+
+# ==================== CACHE QUERY-URI ====================
+
+def _query_data_version():
+    """
+    Versiunea curentă a datelor: id-ul ultimului import din `import_logs`
+    (căutare pe cheia primară). Orice import nou schimbă versiunea și deci
+    cheile de cache. Returnează None când baza de date nu e disponibilă.
+    """
+    if not _check_db():
+        return None
+    try:
+        from sqlalchemy import text
+        with get_engine().connect() as conn:
+            return conn.execute(text("SELECT COALESCE(MAX(id), 0) FROM import_logs")).scalar()
+    except Exception:
+        _reset_db_check()
+        return None
+
+
+class _UncachedResult(Exception):
+    """Transportă un rezultat care nu trebuie pus în cache (fallback demo)."""
+
+    def __init__(self, result):
+        super().__init__()
+        self.result = result
+
+
+@st.cache_data(ttl=DATA_VERSION_TTL, show_spinner=False)
+def _cached_data_version():
+    version = _query_data_version()
+    if version is None:
+        # Baza de date indisponibilă: nu reținem rezultatul
+        raise _UncachedResult(None)
+    return version
+
+
+def get_data_version():
+    """
+    Versiunea datelor, reținută DATA_VERSION_TTL secunde, ca funcțiile
+    cached dintr-un rerun să nu facă fiecare câte un query pentru ea.
+    None când baza de date nu e disponibilă.
+    """
+    try:
+        return _cached_data_version()
+    except _UncachedResult:
+        return None
+
+
+def cached_query(fn):
+    """
+    Decorator pentru funcțiile de citire: rezultatul este ținut în memorie
+    (st.cache_data), cu cheia formată din funcție, argumente și versiunea
+    datelor. Rerun-urile sunt servite din cache, iar un import nou devine
+    vizibil după cel mult DATA_VERSION_TTL secunde. Fallback-urile pe date
+    demo nu sunt puse în cache.
+    """
+    signature = inspect.signature(fn)
+
+    def versioned(data_version, **kwargs):
+        result = fn(**kwargs)
+        if _DB_AVAILABLE is None:
+            # Query-ul a eșuat și funcția a întors datele demo
+            raise _UncachedResult(result)
+        return result
+
+    # Cheia funcției în Streamlit depinde de __qualname__
+    versioned.__qualname__ = f"{fn.__qualname__}.versioned"
+    cached = st.cache_data(
+        ttl=QUERY_CACHE_TTL,
+        max_entries=QUERY_CACHE_MAX_ENTRIES,
+        show_spinner=False
+    )(versioned)
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        data_version = get_data_version()
+        if data_version is None:
+            return fn(*args, **kwargs)
+
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        try:
+            return cached(data_version, **bound.arguments)
+        except _UncachedResult as e:
+            return e.result
+
+    wrapper.clear = cached.clear
+    return wrapper
 
 
 # ==================== DATE DEMO ====================
@@ -233,8 +368,110 @@ def _demo_export_all():
     return pd.DataFrame(rows)
 
 
+def _demo_panel(codes, years=None, counties=None):
+    df = pd.concat([_demo_salary_data(), _demo_labor_data(), _demo_industry_data()])
+    df = df[df['indicator_code'].isin(codes)]
+    if years:
+        df = df[df['year'].isin(years)]
+    if counties:
+        df = df[df['county_code'].isin(counties)]
+    return _to_panel(df, codes)
+
+
+def _to_panel(df, codes):
+    """Format lung -> panou: un rând per (județ, an, trimestru), o coloană per cod."""
+    panel = df.pivot_table(index=PANEL_INDEX, columns='indicator_code', values='value')
+    panel = panel[[code for code in codes if code in panel.columns]].astype('float64')
+    panel.columns.name = None
+    return panel
+
+
 # ==================== FUNCȚII PUBLICE CU FALLBACK ====================
 
+@cached_query
+def get_indicator_panel(codes, years=None, counties=None):
+    """
+    Obține un panou "lat" pentru mai mulți indicatori, dintr-o singură scanare:
+    fiecare indicator devine o coloană prin agregare cu FILTER, direct în SQL.
+
+    Args:
+        codes: codurile indicatorilor (ordinea coloanelor)
+        years: anii incluși (None = toți)
+        counties: codurile județelor incluse (None = toate)
+
+    Returns:
+        DataFrame indexat după (county_name, county_code, year, quarter),
+        cu câte o coloană float per cod de indicator care are date. Ca
+        pivotul pe care îl înlocuiește, conține doar valorile trimestriale.
+    """
+    codes = list(codes)
+    years = list(years) if years else None
+    counties = list(counties) if counties else None
+
+    if not codes:
+        return pd.DataFrame(columns=PANEL_INDEX).set_index(PANEL_INDEX)
+
+    if not _check_db():
+        return _demo_panel(codes, years, counties)
+
+    try:
+        from sqlalchemy import text, bindparam
+        engine = get_engine()
+
+        # Câte o coloană per indicator; alias-urile sunt poziționale (v0, v1...)
+        # ca să nu depindă de caracterele din coduri
+        value_columns = ",\n".join(
+            f"AVG(value) FILTER (WHERE indicator_code = :code_{i})::float8 AS v{i}"
+            for i in range(len(codes))
+        )
+
+        query = f"""
+            SELECT
+                county_name,
+                county_code,
+                year,
+                quarter,
+                {value_columns}
+            FROM mv_indicator_data
+            WHERE county_code IS NOT NULL
+              AND quarter IS NOT NULL
+              AND indicator_code IN :codes
+        """
+
+        params = {"codes": codes}
+        params.update({f"code_{i}": code for i, code in enumerate(codes)})
+        expanding = [bindparam("codes", expanding=True)]
+
+        if years:
+            query += " AND year IN :years"
+            params["years"] = years
+            expanding.append(bindparam("years", expanding=True))
+
+        if counties:
+            query += " AND county_code IN :counties"
+            params["counties"] = counties
+            expanding.append(bindparam("counties", expanding=True))
+
+        query += """
+            GROUP BY county_name, county_code, year, quarter
+            ORDER BY county_name, year, quarter
+        """
+
+        with engine.connect() as conn:
+            df = pd.read_sql(text(query).bindparams(*expanding), conn, params=params)
+
+        df = df.rename(columns={f"v{i}": code for i, code in enumerate(codes)})
+        df = df.astype({"year": "int64", "quarter": "Int64"})
+        df[codes] = df[codes].astype("float64")
+        # Fără coloane pentru codurile fără nicio valoare
+        df = df.drop(columns=[code for code in codes if df[code].isna().all()])
+        return df.set_index(PANEL_INDEX)
+    except Exception:
+        _reset_db_check()
+        return _demo_panel(codes, years, counties)
+
+
+@cached_query
 def get_indicator_data(indicator_code, year=None, quarter=None, county_code=None):
     """Obține date pentru un indicator specific"""
     if not _check_db():
@@ -246,34 +483,33 @@ def get_indicator_data(indicator_code, year=None, quarter=None, county_code=None
 
         query = """
             SELECT
-                c.name as county_name,
-                c.code as county_code,
-                iv.year,
-                iv.quarter,
-                iv.value,
-                id.name as indicator_name,
-                id.unit
-            FROM indicator_values iv
-            JOIN indicator_definitions id ON iv.indicator_id = id.id
-            JOIN counties c ON iv.county_id = c.id
-            WHERE id.code = :indicator_code
+                county_name,
+                county_code,
+                year,
+                quarter,
+                value,
+                indicator_name,
+                unit
+            FROM mv_indicator_data
+            WHERE indicator_code = :indicator_code
+              AND county_code IS NOT NULL
         """
 
         params = {"indicator_code": indicator_code}
 
         if year:
-            query += " AND iv.year = :year"
+            query += " AND year = :year"
             params["year"] = year
 
         if quarter:
-            query += " AND iv.quarter = :quarter"
+            query += " AND quarter = :quarter"
             params["quarter"] = quarter
 
         if county_code:
-            query += " AND c.code = :county_code"
+            query += " AND county_code = :county_code"
             params["county_code"] = county_code
 
-        query += " ORDER BY iv.year DESC, iv.quarter DESC, c.name"
+        query += " ORDER BY year DESC, quarter DESC, county_name"
 
         with engine.connect() as conn:
             df = pd.read_sql(text(query), conn, params=params)
@@ -284,6 +520,7 @@ def get_indicator_data(indicator_code, year=None, quarter=None, county_code=None
         return pd.DataFrame()
 
 
+@cached_query
 def get_all_indicators():
     """Obține lista tuturor indicatorilor"""
     if not _check_db():
@@ -317,6 +554,7 @@ def get_all_indicators():
         return _demo_all_indicators()
 
 
+@cached_query
 def get_counties():
     """Obține lista județelor"""
     if not _check_db():
@@ -341,6 +579,7 @@ def get_counties():
         return _demo_counties()
 
 
+@cached_query
 def get_available_years():
     """Obține anii disponibili în date"""
     if not _check_db():
@@ -366,10 +605,11 @@ def get_available_years():
         return _demo_available_years()
 
 
-def get_salary_comparison(year=None):
-    """Obține comparație salarii brut/net pe județe"""
+@cached_query
+def get_quarterly_evolution(indicator_code, county_code=None):
+    """Obține evoluția trimestrială pentru un indicator"""
     if not _check_db():
-        return _demo_salary_data(year)
+        return _demo_quarterly_evolution(indicator_code, county_code)
 
     try:
         from sqlalchemy import text
@@ -377,64 +617,24 @@ def get_salary_comparison(year=None):
 
         query = """
             SELECT
-                c.name as county_name,
-                c.code as county_code,
-                iv.year,
-                iv.quarter,
-                id.code as indicator_code,
-                iv.value
-            FROM indicator_values iv
-            JOIN indicator_definitions id ON iv.indicator_id = id.id
-            JOIN counties c ON iv.county_id = c.id
-            WHERE id.code IN ('AVG_GROSS_SALARY', 'AVG_NET_SALARY')
+                county_name,
+                county_code,
+                year,
+                quarter,
+                value,
+                CONCAT(year, ' T', quarter) as period
+            FROM mv_indicator_data
+            WHERE indicator_code = :indicator_code
+              AND county_code IS NOT NULL
         """
 
-        params = {}
-        if year:
-            query += " AND iv.year = :year"
-            params["year"] = year
-
-        query += " ORDER BY iv.year DESC, iv.quarter DESC, c.name"
-
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn, params=params)
-
-        return df
-    except Exception:
-        _reset_db_check()
-        return _demo_salary_data(year)
-
-
-def get_labor_market_data(year=None):
-    """Obține date despre piața muncii"""
-    if not _check_db():
-        return _demo_labor_data(year)
-
-    try:
-        from sqlalchemy import text
-        engine = get_engine()
-
-        query = """
-            SELECT
-                c.name as county_name,
-                c.code as county_code,
-                iv.year,
-                iv.quarter,
-                id.code as indicator_code,
-                id.name as indicator_name,
-                iv.value
-            FROM indicator_values iv
-            JOIN indicator_definitions id ON iv.indicator_id = id.id
-            JOIN counties c ON iv.county_id = c.id
-            WHERE id.code IN ('EMPLOYEES_COUNT', 'UNEMPLOYED_COUNT', 'UNEMPLOYMENT_RATE')
-        """
+        params = {"indicator_code": indicator_code}
 
-        params = {}
-        if year:
-            query += " AND iv.year = :year"
-            params["year"] = year
+        if county_code:
+            query += " AND county_code = :county_code"
+            params["county_code"] = county_code
 
-        query += " ORDER BY iv.year DESC, iv.quarter DESC, c.name"
+        query += " ORDER BY year, quarter, county_name"
 
         with engine.connect() as conn:
             df = pd.read_sql(text(query), conn, params=params)
@@ -442,13 +642,14 @@ def get_labor_market_data(year=None):
         return df
     except Exception:
         _reset_db_check()
-        return _demo_labor_data(year)
+        return _demo_quarterly_evolution(indicator_code, county_code)
 
 
-def get_industry_indices(year=None):
-    """Obține indicii industriali"""
+@cached_query
+def get_county_details(county_code):
+    """Obține toate datele pentru un județ"""
     if not _check_db():
-        return _demo_industry_data(year)
+        return _demo_county_details(county_code)
 
     try:
         from sqlalchemy import text
@@ -456,39 +657,31 @@ def get_industry_indices(year=None):
 
         query = """
             SELECT
-                c.name as county_name,
-                c.code as county_code,
-                iv.year,
-                iv.quarter,
-                id.code as indicator_code,
-                id.name as indicator_name,
-                iv.value
-            FROM indicator_values iv
-            JOIN indicator_definitions id ON iv.indicator_id = id.id
-            JOIN counties c ON iv.county_id = c.id
-            WHERE id.code IN ('IND_PROD_INDEX', 'IND_TURNOVER_INDEX')
+                indicator_code,
+                indicator_name,
+                unit,
+                year,
+                quarter,
+                value
+            FROM mv_indicator_data
+            WHERE county_code = :county_code
+            ORDER BY indicator_name, year DESC, quarter DESC
         """
 
-        params = {}
-        if year:
-            query += " AND iv.year = :year"
-            params["year"] = year
-
-        query += " ORDER BY iv.year DESC, iv.quarter DESC, c.name"
-
         with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn, params=params)
+            df = pd.read_sql(text(query), conn, params={"county_code": county_code})
 
         return df
     except Exception:
         _reset_db_check()
-        return _demo_industry_data(year)
+        return _demo_county_details(county_code)
 
 
-def get_quarterly_evolution(indicator_code, county_code=None):
-    """Obține evoluția trimestrială pentru un indicator"""
+@cached_query
+def export_all_data():
+    """Exportă toate datele pentru download"""
     if not _check_db():
-        return _demo_quarterly_evolution(indicator_code, county_code)
+        return _demo_export_all()
 
     try:
         from sqlalchemy import text
@@ -496,72 +689,42 @@ def get_quarterly_evolution(indicator_code, county_code=None):
 
         query = """
             SELECT
-                c.name as county_name,
-                c.code as county_code,
-                iv.year,
-                iv.quarter,
-                iv.value,
-                CONCAT(iv.year, ' T', iv.quarter) as period
-            FROM indicator_values iv
-            JOIN indicator_definitions id ON iv.indicator_id = id.id
-            JOIN counties c ON iv.county_id = c.id
-            WHERE id.code = :indicator_code
+                county_name as judet,
+                county_code as cod_judet,
+                indicator_name as indicator,
+                indicator_code as cod_indicator,
+                unit as unitate,
+                year as an,
+                quarter as trimestru,
+                value as valoare
+            FROM mv_indicator_data
+            WHERE county_code IS NOT NULL
+            ORDER BY county_name, indicator_name, year DESC, quarter DESC
         """
 
-        params = {"indicator_code": indicator_code}
-
-        if county_code:
-            query += " AND c.code = :county_code"
-            params["county_code"] = county_code
-
-        query += " ORDER BY iv.year, iv.quarter, c.name"
-
         with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn, params=params)
+            df = pd.read_sql(text(query), conn)
 
         return df
     except Exception:
         _reset_db_check()
-        return _demo_quarterly_evolution(indicator_code, county_code)
-
-
-def get_county_details(county_code):
-    """Obține toate datele pentru un județ"""
-    if not _check_db():
-        return _demo_county_details(county_code)
-
-    try:
-        from sqlalchemy import text
-        engine = get_engine()
-
-        query = """
-            SELECT
-                id.code as indicator_code,
-                id.name as indicator_name,
-                id.unit::text as unit,
-                iv.year,
-                iv.quarter,
-                iv.value
-            FROM indicator_values iv
-            JOIN indicator_definitions id ON iv.indicator_id = id.id
-            JOIN counties c ON iv.county_id = c.id
-            WHERE c.code = :county_code
-            ORDER BY id.name, iv.year DESC, iv.quarter DESC
-        """
-
-        with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn, params={"county_code": county_code})
+        return _demo_export_all()
 
-        return df
-    except Exception:
-        _reset_db_check()
-        return _demo_county_details(county_code)
 
+@cached_query
+def get_forecasts(indicator_code, county_code=None):
+    """
+    Obține istoricul anual și prognozele salvate (toate metodele, cu
+    intervalele de predicție) pentru un indicator, la nivel regional sau
+    pentru un județ, într-un singur query.
 
-def export_all_data():
-    """Exportă toate datele pentru download"""
+    Returns:
+        DataFrame cu FORECAST_COLUMNS; rândurile istorice au metoda
+        FORECAST_HISTORY și limitele nule. Gol când nu există date
+        (paginile folosesc atunci scenariile implicite).
+    """
     if not _check_db():
-        return _demo_export_all()
+        return pd.DataFrame(columns=FORECAST_COLUMNS)
 
     try:
         from sqlalchemy import text
@@ -569,24 +732,43 @@ def export_all_data():
 
         query = """
             SELECT
-                c.name as judet,
-                c.code as cod_judet,
-                id.name as indicator,
-                id.code as cod_indicator,
-                id.unit::text as unitate,
-                iv.year as an,
-                iv.quarter as trimestru,
-                iv.value as valoare
-            FROM indicator_values iv
-            JOIN indicator_definitions id ON iv.indicator_id = id.id
-            JOIN counties c ON iv.county_id = c.id
-            ORDER BY c.name, id.name, iv.year DESC, iv.quarter DESC
+                :history AS method,
+                year,
+                value::float8 AS value,
+                NULL::float8 AS lower_bound,
+                NULL::float8 AS upper_bound
+            FROM mv_indicator_data
+            WHERE indicator_code = :indicator_code
+              AND aggregation_level = :level
+              AND quarter IS NULL
+              AND county_code IS NOT DISTINCT FROM :county_code
+            UNION ALL
+            SELECT
+                f.method,
+                f.year,
+                f.value,
+                f.lower_bound,
+                f.upper_bound
+            FROM forecasts f
+            JOIN indicator_definitions d ON d.id = f.indicator_id
+            LEFT JOIN counties c ON c.id = f.county_id
+            WHERE d.code = :indicator_code
+              AND f.aggregation_level = :level
+              AND c.code IS NOT DISTINCT FROM :county_code
+            ORDER BY method, year
         """
 
+        params = {
+            "history": FORECAST_HISTORY,
+            "indicator_code": indicator_code,
+            "county_code": county_code,
+            "level": 'judet' if county_code else 'regiune'
+        }
+
         with engine.connect() as conn:
-            df = pd.read_sql(text(query), conn)
+            df = pd.read_sql(text(query), conn, params=params)
 
         return df
     except Exception:
         _reset_db_check()
-        return _demo_export_all()
+        return pd.DataFrame(columns=FORECAST_COLUMNS)
@@ -31,9 +31,10 @@ st.markdown(page_header(
 try:
     from db_utils import (
         export_all_data,
-        get_salary_comparison,
-        get_labor_market_data,
-        get_industry_indices,
+        get_indicator_panel,
+        SALARY_CODES,
+        LABOR_CODES,
+        INDUSTRY_CODES,
         get_all_indicators,
         get_counties,
         get_available_years
@@ -140,13 +141,10 @@ try:
             st.session_state["export_salary_generated"] = True
 
         if st.session_state.get("export_salary_generated", False):
-            df_salary = get_salary_comparison(year_filter)
-            if not df_salary.empty:
-                df_pivot = df_salary.pivot_table(
-                    index=['county_name', 'year', 'quarter'],
-                    columns='indicator_code',
-                    values='value'
-                ).reset_index()
+            df_pivot = get_indicator_panel(
+                SALARY_CODES, years=[year_filter] if year_filter else None
+            ).reset_index().drop(columns='county_code')
+            if not df_pivot.empty:
 
                 csv = df_pivot.to_csv(index=False)
                 st.download_button(
@@ -170,13 +168,10 @@ try:
             st.session_state["export_labor_generated"] = True
 
         if st.session_state.get("export_labor_generated", False):
-            df_labor = get_labor_market_data(year_filter2)
-            if not df_labor.empty:
-                df_pivot = df_labor.pivot_table(
-                    index=['county_name', 'year', 'quarter'],
-                    columns='indicator_code',
-                    values='value'
-                ).reset_index()
+            df_pivot = get_indicator_panel(
+                LABOR_CODES, years=[year_filter2] if year_filter2 else None
+            ).reset_index().drop(columns='county_code')
+            if not df_pivot.empty:
 
                 csv = df_pivot.to_csv(index=False)
                 st.download_button(
@@ -200,13 +195,10 @@ try:
             st.session_state["export_industry_generated"] = True
 
         if st.session_state.get("export_industry_generated", False):
-            df_industry = get_industry_indices(year_filter3)
-            if not df_industry.empty:
-                df_pivot = df_industry.pivot_table(
-                    index=['county_name', 'year', 'quarter'],
-                    columns='indicator_code',
-                    values='value'
-                ).reset_index()
+            df_pivot = get_indicator_panel(
+                INDUSTRY_CODES, years=[year_filter3] if year_filter3 else None
+            ).reset_index().drop(columns='county_code')
+            if not df_pivot.empty:
 
                 csv = df_pivot.to_csv(index=False)
                 st.download_button(
@@ -13,6 +13,7 @@ if os.path.dirname(os.path.dirname(os.path.abspath(__file__))) not in sys.path:
     sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from auth import require_auth, show_user_info
+from db_utils import get_forecasts, FORECAST_HISTORY
 
 st.set_page_config(page_title="Tendințe", page_icon="📉", layout="wide")
 
@@ -95,7 +96,7 @@ with tab1:
         st.dataframe(df, hide_index=True, use_container_width=True)
 
 with tab2:
-    st.subheader("Scenarii de Evoluție (2024-2030)")
+    st.subheader("Scenarii de Evoluție")
 
     scenario = st.radio(
         "Selectează scenariul",
@@ -108,41 +109,82 @@ with tab2:
         ["Angajați", "Cifră de afaceri", "Export", "Productivitate"]
     )
 
-    # Date istorice
-    hist_years = list(range(2019, 2024))
-    forecast_years = list(range(2024, 2031))
-    all_years = hist_years + forecast_years
-
-    # Valori istorice
-    base_values = {
-        "Angajați": [52000, 49650, 53150, 57200, 60550],
-        "Cifră de afaceri": [8.5, 7.8, 9.2, 10.5, 11.2],
-        "Export": [6.8, 6.1, 7.4, 8.4, 8.9],
-        "Productivitate": [163, 157, 173, 183, 185]
+    # Prognozele calculate în backend (scripts/run_forecasts.py); scenariile
+    # sunt prognoza centrală și limitele intervalului de predicție
+    forecast_codes = {
+        "Angajați": "TOTAL_EMPLOYEES",
+        "Cifră de afaceri": "TOTAL_TURNOVER",
+        "Export": "TOTAL_EXPORTS",
+        "Productivitate": "PRODUCTIVITY"
     }
+    forecast_methods = {"ARIMA": "arima", "ETS (Holt)": "ets", "Liniar": "linear"}
 
-    historical = base_values[indicator_forecast]
-    last_value = historical[-1]
-
-    # Scenarii de creștere
-    growth_rates = {
-        "Optimist": {"Angajați": 0.06, "Cifră de afaceri": 0.08, "Export": 0.09, "Productivitate": 0.04},
-        "Bază": {"Angajați": 0.03, "Cifră de afaceri": 0.05, "Export": 0.05, "Productivitate": 0.025},
-        "Pesimist": {"Angajați": 0.00, "Cifră de afaceri": 0.02, "Export": 0.02, "Productivitate": 0.01}
+    forecast_df = get_forecasts(forecast_codes[indicator_forecast])
+    history_df = forecast_df[forecast_df["method"] == FORECAST_HISTORY]
+    available_methods = {
+        label: method for label, method in forecast_methods.items()
+        if method in set(forecast_df["method"])
     }
 
-    # Calcul proiecții
-    def project_values(start_value, growth_rate, years):
-        values = []
-        current = start_value
-        for _ in years:
-            current = current * (1 + growth_rate)
-            values.append(round(current, 2))
-        return values
+    if available_methods and not history_df.empty:
+        method_label = st.selectbox("Model de prognoză", list(available_methods))
+        projection = forecast_df[forecast_df["method"] == available_methods[method_label]]
+
+        hist_years = history_df["year"].astype(int).tolist()
+        historical = history_df["value"].tolist()
+        forecast_years = projection["year"].astype(int).tolist()
+        optimist_proj = projection["upper_bound"].round(2).tolist()
+        base_proj = projection["value"].round(2).tolist()
+        pesimist_proj = projection["lower_bound"].round(2).tolist()
+        st.caption(f"Prognoză {method_label}; scenariile optimist/pesimist sunt limitele intervalului de predicție.")
+    else:
+        st.caption("Nu există prognoze calculate; sunt afișate scenarii cu rate de creștere presupuse.")
+
+        # Date istorice
+        hist_years = list(range(2019, 2024))
+        forecast_years = list(range(2024, 2031))
+
+        # Valori istorice
+        base_values = {
+            "Angajați": [52000, 49650, 53150, 57200, 60550],
+            "Cifră de afaceri": [8.5, 7.8, 9.2, 10.5, 11.2],
+            "Export": [6.8, 6.1, 7.4, 8.4, 8.9],
+            "Productivitate": [163, 157, 173, 183, 185]
+        }
+
+        historical = base_values[indicator_forecast]
+
+        # Scenarii de creștere
+        growth_rates = {
+            "Optimist": {"Angajați": 0.06, "Cifră de afaceri": 0.08, "Export": 0.09, "Productivitate": 0.04},
+            "Bază": {"Angajați": 0.03, "Cifră de afaceri": 0.05, "Export": 0.05, "Productivitate": 0.025},
+            "Pesimist": {"Angajați": 0.00, "Cifră de afaceri": 0.02, "Export": 0.02, "Productivitate": 0.01}
+        }
+
+        # Calcul proiecții
+        def project_values(start_value, growth_rate, years):
+            values = []
+            current = start_value
+            for _ in years:
+                current = current * (1 + growth_rate)
+                values.append(round(current, 2))
+            return values
+
+        optimist_proj = project_values(historical[-1], growth_rates["Optimist"][indicator_forecast], forecast_years)
+        base_proj = project_values(historical[-1], growth_rates["Bază"][indicator_forecast], forecast_years)
+        pesimist_proj = project_values(historical[-1], growth_rates["Pesimist"][indicator_forecast], forecast_years)
+
+    last_value = historical[-1]
+
+    def annual_growth(projected):
+        """Rata anuală implicită între ultima valoare istorică și finalul proiecției."""
+        if not last_value or not projected or projected[-1] is None or projected[-1] / last_value <= 0:
+            return None
+        return (projected[-1] / last_value) ** (1 / len(projected)) - 1
 
-    optimist_proj = project_values(last_value, growth_rates["Optimist"][indicator_forecast], forecast_years)
-    base_proj = project_values(last_value, growth_rates["Bază"][indicator_forecast], forecast_years)
-    pesimist_proj = project_values(last_value, growth_rates["Pesimist"][indicator_forecast], forecast_years)
+    def growth_label(projected):
+        rate = annual_growth(projected)
+        return f"{rate * 100:+.1f}%/an" if rate is not None else "-"
 
     # Grafic
     fig = go.Figure()
@@ -186,7 +228,7 @@ with tab2:
 
     # Zona de incertitudine
     fig.add_vrect(
-        x0=2023.5, x1=2030,
+        x0=hist_years[-1] + 0.5, x1=forecast_years[-1],
         fillcolor="gray", opacity=0.1,
         annotation_text="Proiecție", annotation_position="top left"
     )
@@ -205,26 +247,26 @@ with tab2:
 
     with col1:
         st.success(f"""
-        **Scenariu Optimist (2030)**
+        **Scenariu Optimist ({forecast_years[-1]})**
 
         {indicator_forecast}: {optimist_proj[-1]:,.0f}
-        Creștere: +{growth_rates['Optimist'][indicator_forecast]*100:.0f}%/an
+        Creștere: {growth_label(optimist_proj)}
         """)
 
     with col2:
         st.info(f"""
-        **Scenariu Bază (2030)**
+        **Scenariu Bază ({forecast_years[-1]})**
 
         {indicator_forecast}: {base_proj[-1]:,.0f}
-        Creștere: +{growth_rates['Bază'][indicator_forecast]*100:.0f}%/an
+        Creștere: {growth_label(base_proj)}
         """)
 
     with col3:
         st.warning(f"""
-        **Scenariu Pesimist (2030)**
+        **Scenariu Pesimist ({forecast_years[-1]})**
 
         {indicator_forecast}: {pesimist_proj[-1]:,.0f}
-        Creștere: +{growth_rates['Pesimist'][indicator_forecast]*100:.0f}%/an
+        Creștere: {growth_label(pesimist_proj)}
         """)
 
 with tab3:
@@ -34,7 +34,7 @@ st.markdown(page_header(
 ), unsafe_allow_html=True)
 
 try:
-    from db_utils import get_salary_comparison, get_available_years
+    from db_utils import get_indicator_panel, get_available_years, SALARY_CODES
 
     # Filtre în sidebar
     with st.sidebar:
@@ -52,18 +52,11 @@ try:
         )
 
     # Obține datele
-    df = get_salary_comparison(selected_year)
+    df_pivot = get_indicator_panel(SALARY_CODES, years=[selected_year]).reset_index()
 
-    if df.empty:
+    if df_pivot.empty:
         st.warning("Nu există date pentru anul selectat.")
     else:
-        # Pivot pentru a avea brut și net pe coloane
-        df_pivot = df.pivot_table(
-            index=['county_name', 'county_code', 'year', 'quarter'],
-            columns='indicator_code',
-            values='value'
-        ).reset_index()
-
         # Cele mai recente date per județ
         df_latest = df_pivot.sort_values(['year', 'quarter'], ascending=False).groupby('county_name').first().reset_index()
 
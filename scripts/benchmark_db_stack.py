@@ -0,0 +1,142 @@
+"""
+Benchmark: stack-ul sync (psycopg2 + threadpool) vs. stack-ul async (asyncpg)
+
+Simulează C clienți concurenți care trimit cereri ca ruta de serie
+temporală. Pe stack-ul sync, fiecare cerere rulează prin
+`anyio.to_thread.run_sync`, exact ca un handler `def` în FastAPI (limită
+implicită: 40 de thread-uri). Pe stack-ul async, cererea rulează direct
+în event loop, ca un handler `async def`.
+
+Exemplu:
+    python scripts/benchmark_db_stack.py --requests 2000 --concurrency 10,50,200 --sleep-ms 20
+
+`--sleep-ms` adaugă un `pg_sleep` per cerere, pentru a simula query-uri
+mai lente. Acolo se vede limita threadpool-ului.
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import anyio
+from sqlalchemy import select, text
+
+from app.config import settings
+from app.database import SessionLocal, AsyncSessionLocal, engine, async_engine
+from app.models.indicator import AggregationLevel
+from app.models.reporting import indicator_data_view
+
+
+def build_query(indicator_code: str):
+    """Query-ul rutei GET /indicators/{code}/timeseries."""
+    data = indicator_data_view.c
+    return select(
+        data.year, data.quarter, data.value,
+        data.aggregation_level, data.is_provisional, data.county_code
+    ).where(
+        data.indicator_code == indicator_code,
+        data.aggregation_level == AggregationLevel.REGION.value,
+        data.year >= settings.data_start_year,
+        data.year <= settings.data_end_year
+    ).order_by(data.year, data.quarter)
+
+
+def sync_request(query, sleep_seconds: float) -> int:
+    db = SessionLocal()
+    try:
+        if sleep_seconds:
+            db.execute(text("SELECT pg_sleep(:s)"), {"s": sleep_seconds})
+        return len(db.execute(query).all())
+    finally:
+        db.close()
+
+
+async def async_request(query, sleep_seconds: float) -> int:
+    async with AsyncSessionLocal() as db:
+        if sleep_seconds:
+            await db.execute(text("SELECT pg_sleep(:s)"), {"s": sleep_seconds})
+        return len((await db.execute(query)).all())
+
+
+async def run_stack(stack: str, query, requests: int, concurrency: int, sleep_seconds: float) -> dict:
+    latencies: list[float] = []
+    remaining = iter(range(requests))
+
+    async def client():
+        for _ in remaining:
+            started = time.perf_counter()
+            if stack == "sync":
+                await anyio.to_thread.run_sync(sync_request, query, sleep_seconds)
+            else:
+                await async_request(query, sleep_seconds)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "stack": stack,
+        "concurrency": concurrency,
+        "rps": requests / elapsed,
+        "p50": quantiles[49] * 1000,
+        "p95": quantiles[94] * 1000,
+        "p99": quantiles[98] * 1000
+    }
+
+
+async def main_async(args):
+    query = build_query(args.indicator)
+    sleep_seconds = args.sleep_ms / 1000
+
+    # Fără logarea SQL (DB_ECHO=true), care ar domina timpii
+    engine.echo = False
+    async_engine.echo = False
+
+    print(
+        f"Pool: pool_size={settings.db_pool_size}, max_overflow={settings.db_max_overflow}; "
+        f"threadpool: {anyio.to_thread.current_default_thread_limiter().total_tokens:.0f} thread-uri"
+    )
+
+    # Încălzire: deschide conexiunile din ambele pool-uri
+    await run_stack("sync", query, settings.db_pool_size * 2, settings.db_pool_size, 0)
+    await run_stack("async", query, settings.db_pool_size * 2, settings.db_pool_size, 0)
+
+    print(f"{'stack':<6} {'conc':>5} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for concurrency in args.concurrency:
+        for stack in ("sync", "async"):
+            r = await run_stack(stack, query, args.requests, concurrency, sleep_seconds)
+            print(
+                f"{r['stack']:<6} {r['concurrency']:>5} {r['rps']:>9.1f} "
+                f"{r['p50']:>9.2f} {r['p95']:>9.2f} {r['p99']:>9.2f}"
+            )
+
+    engine.dispose()
+    await async_engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark stack DB sync vs. async")
+    parser.add_argument("--requests", type=int, default=2000, help="Cereri per rulare")
+    parser.add_argument(
+        "--concurrency",
+        type=lambda v: [int(c) for c in v.split(",")],
+        default=[10, 50, 200],
+        help="Niveluri de concurență, separate prin virgulă"
+    )
+    parser.add_argument("--sleep-ms", type=float, default=0, help="pg_sleep adăugat per cerere (ms)")
+    parser.add_argument("--indicator", default="TOTAL_EMPLOYEES", help="Codul indicatorului interogat")
+    args = parser.parse_args()
+
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
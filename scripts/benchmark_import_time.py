@@ -0,0 +1,116 @@
+"""
+Benchmark: timpul de import la pornire (`python -X importtime`)
+
+Importă modulul (implicit `app.main`, ce încarcă fiecare worker uvicorn)
+în procese noi și raportează durata cumulată, mediana peste rulări și
+pachetele care contribuie cel mai mult. Eșuează (exit 1) dacă:
+
+- mediana depășește bugetul (`--budget-ms`);
+- importul încarcă vreunul dintre modulele grele care trebuie să rămână
+  leneșe (pandas, numpy, scipy, statsmodels, requests, ...).
+
+Exemplu:
+    python scripts/benchmark_import_time.py --runs 5 --budget-ms 1800
+"""
+
+import os
+import sys
+
+import argparse
+import json
+import statistics
+import subprocess
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Bugetul implicit pentru `import app.main` (ms, mediana rulărilor)
+DEFAULT_BUDGET_MS = 1800
+
+# Module încărcate doar la prima utilizare (analize, importuri, prognoze,
+# exporturi, migrări); prezența lor după import e o regresie
+LAZY_MODULES = (
+    "pandas", "numpy", "scipy", "statsmodels", "requests",
+    "xlsxwriter", "pyarrow", "alembic"
+)
+
+
+def run_importtime(module: str) -> list[tuple[int, int, str]]:
+    """(self µs, cumulat µs, nume indentat) pentru fiecare modul importat."""
+    env = {**os.environ, "PYTHONPATH": ROOT}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((int(self_us), int(cumulative_us), name.rstrip()))
+    return rows
+
+
+def loaded_lazy_modules(module: str) -> list[str]:
+    """Modulele din LAZY_MODULES prezente în sys.modules după import."""
+    env = {**os.environ, "PYTHONPATH": ROOT}
+    code = (
+        f"import sys, json, {module}; "
+        f"print(json.dumps([m for m in {list(LAZY_MODULES)!r} if m in sys.modules]))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark timp de import la pornire")
+    parser.add_argument("--module", default="app.main", help="Modulul importat")
+    parser.add_argument("--runs", type=int, default=5, help="Procese noi (rulări)")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="Buget pentru mediană (ms)")
+    parser.add_argument("--top", type=int, default=10, help="Pachete afișate în top")
+    args = parser.parse_args()
+
+    totals = []
+    by_package = defaultdict(list)
+    for _ in range(args.runs):
+        rows = run_importtime(args.module)
+        target = next(cumulative for _, cumulative, name in rows if name.strip() == args.module)
+        totals.append(target / 1000)
+
+        # Timpul propriu al fiecărui modul, însumat pe pachetul de nivel 1
+        packages = defaultdict(int)
+        for self_us, _, name in rows:
+            packages[name.strip().split(".")[0]] += self_us
+        for package, self_us in packages.items():
+            by_package[package].append(self_us / 1000)
+
+    median_ms = statistics.median(totals)
+    print(f"import {args.module}: mediana {median_ms:.0f} ms, min {min(totals):.0f} ms ({args.runs} rulări)")
+
+    print(f"\n{'pachet':<24} {'ms (mediana)':>12}")
+    top = sorted(by_package.items(), key=lambda item: statistics.median(item[1]), reverse=True)
+    for package, samples in top[:args.top]:
+        print(f"{package:<24} {statistics.median(samples):>12.1f}")
+
+    failed = False
+
+    lazy = loaded_lazy_modules(args.module)
+    if lazy:
+        print(f"\nFAIL: module grele încărcate la import: {', '.join(lazy)}")
+        failed = True
+
+    if median_ms > args.budget_ms:
+        print(f"\nFAIL: mediana {median_ms:.0f} ms depășește bugetul de {args.budget_ms:.0f} ms")
+        failed = True
+
+    if failed:
+        sys.exit(1)
+    print(f"\nOK: în buget ({args.budget_ms:.0f} ms), fără module grele")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+"""
+Benchmark: structura indicator_values - import și citire
+
+Compară două variante ale tabelului, create în scheme temporare:
+
+- `legacy`: tabel simplu, constrângerea unică + cei 5 indecși idx_values_*
+  (structura dinaintea partiționării);
+- `partitioned`: 8 partiții HASH (indicator_id) + un singur index unic
+  acoperitor (structura din database_schema.sql).
+
+Importul trece prin `DataImportService.bulk_upsert` (COPY + INSERT ... ON
+CONFLICT), cu search_path-ul pe schema testată: o dată cu inserări noi,
+apoi cu aceleași chei (actualizări). Citirile au forma rutelor calde: o
+serie (indicator, nivel, județ, interval de ani).
+
+Exemplu:
+    python scripts/benchmark_indicator_values.py --indicators 40 --years 2000-2024 --reads 2000
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import random
+import statistics
+import time
+
+import pandas as pd
+from sqlalchemy import text
+
+from app.database import SessionLocal, engine
+from app.models.indicator import AggregationLevel, INDICATOR_VALUE_PARTITIONS
+from app.services.data_import import DataImportService
+
+
+COLUMNS_SQL = """
+    id SERIAL,
+    indicator_id INTEGER NOT NULL,
+    county_id INTEGER,
+    year SMALLINT NOT NULL,
+    quarter SMALLINT,
+    aggregation_level aggregation_level NOT NULL DEFAULT 'regiune',
+    value DECIMAL(20,4) NOT NULL,
+    is_provisional SMALLINT DEFAULT 0,
+    is_estimated SMALLINT DEFAULT 0,
+    notes TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP
+"""
+
+LAYOUTS = {
+    "legacy": [
+        f"""CREATE TABLE {{schema}}.indicator_values ({COLUMNS_SQL},
+            PRIMARY KEY (id),
+            CONSTRAINT uq_indicator_value UNIQUE NULLS NOT DISTINCT
+                (indicator_id, county_id, year, quarter, aggregation_level)
+        )""",
+        "CREATE INDEX ON {schema}.indicator_values(indicator_id)",
+        "CREATE INDEX ON {schema}.indicator_values(county_id)",
+        "CREATE INDEX ON {schema}.indicator_values(year)",
+        "CREATE INDEX ON {schema}.indicator_values(aggregation_level)",
+        "CREATE INDEX ON {schema}.indicator_values(indicator_id, year, aggregation_level)"
+    ],
+    "partitioned": [
+        f"""CREATE TABLE {{schema}}.indicator_values ({COLUMNS_SQL},
+            PRIMARY KEY (id, indicator_id)
+        ) PARTITION BY HASH (indicator_id)""",
+        *[
+            f"CREATE TABLE {{schema}}.indicator_values_p{r} PARTITION OF {{schema}}.indicator_values "
+            f"FOR VALUES WITH (MODULUS {INDICATOR_VALUE_PARTITIONS}, REMAINDER {r})"
+            for r in range(INDICATOR_VALUE_PARTITIONS)
+        ],
+        """CREATE UNIQUE INDEX ON {schema}.indicator_values
+            (indicator_id, aggregation_level, county_id, year, quarter)
+            INCLUDE (value, is_provisional) NULLS NOT DISTINCT"""
+    ]
+}
+
+READ_SQL = text("""
+    SELECT year, quarter, value, is_provisional
+    FROM indicator_values
+    WHERE indicator_id = :indicator_id
+      AND aggregation_level = :aggregation_level
+      AND county_id IS NOT DISTINCT FROM :county_id
+      AND year BETWEEN :start_year AND :end_year
+    ORDER BY year, quarter
+""")
+
+
+def build_frame(indicators: int, counties: int, start_year: int, end_year: int, seed: int) -> pd.DataFrame:
+    """Valori sintetice: anuale și trimestriale, pe județe și regional."""
+    rng = random.Random(seed)
+    rows = []
+    for indicator_id in range(1, indicators + 1):
+        for year in range(start_year, end_year + 1):
+            for quarter in (None, 1, 2, 3, 4):
+                rows.append((indicator_id, None, year, quarter, AggregationLevel.REGION.value, rng.uniform(0, 1e6)))
+                for county_id in range(1, counties + 1):
+                    rows.append((indicator_id, county_id, year, quarter, AggregationLevel.COUNTY.value, rng.uniform(0, 1e5)))
+    return pd.DataFrame(rows, columns=["indicator_id", "county_id", "year", "quarter", "aggregation_level", "value"])
+
+
+def schema_name(layout: str) -> str:
+    return f"bench_iv_{layout}"
+
+
+def create_layout(layout: str):
+    schema = schema_name(layout)
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+        conn.execute(text(f"CREATE SCHEMA {schema}"))
+        for statement in LAYOUTS[layout]:
+            conn.execute(text(statement.format(schema=schema)))
+
+
+def import_frame(layout: str, frame: pd.DataFrame, batch_size: int) -> dict:
+    """Importă lotul în bucăți de `batch_size`, câte o tranzacție fiecare."""
+    db = SessionLocal()
+    totals = {"inserted": 0, "updated": 0}
+    try:
+        started = time.perf_counter()
+        for offset in range(0, len(frame), batch_size):
+            db.execute(text(f"SET LOCAL search_path TO {schema_name(layout)}, public"))
+            result = DataImportService(db).bulk_upsert(frame.iloc[offset:offset + batch_size])
+            db.commit()
+            totals["inserted"] += result["inserted"]
+            totals["updated"] += result["updated"]
+        elapsed = time.perf_counter() - started
+    finally:
+        db.close()
+    return {**totals, "seconds": elapsed, "rows_per_second": len(frame) / elapsed}
+
+
+def vacuum(layout: str):
+    # VACUUM nu poate rula într-o tranzacție; harta de vizibilitate
+    # actualizată permite index-only scan
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text(f"VACUUM ANALYZE {schema_name(layout)}.indicator_values"))
+
+
+def read_params(args, rng: random.Random) -> dict:
+    county_id = rng.choice([None] + list(range(1, args.counties + 1)))
+    start_year = rng.randint(args.start_year, args.end_year)
+    return {
+        "indicator_id": rng.randint(1, args.indicators),
+        "aggregation_level": AggregationLevel.REGION.value if county_id is None else AggregationLevel.COUNTY.value,
+        "county_id": county_id,
+        "start_year": start_year,
+        "end_year": min(start_year + args.read_span - 1, args.end_year)
+    }
+
+
+def run_reads(layout: str, args) -> dict:
+    rng = random.Random(args.seed)
+    latencies = []
+    db = SessionLocal()
+    try:
+        db.execute(text(f"SET search_path TO {schema_name(layout)}, public"))
+
+        plan = db.execute(
+            text("EXPLAIN (ANALYZE, BUFFERS, COSTS OFF) " + READ_SQL.text),
+            read_params(args, rng)
+        ).scalars().all()
+
+        started = time.perf_counter()
+        for _ in range(args.reads):
+            params = read_params(args, rng)
+            query_started = time.perf_counter()
+            db.execute(READ_SQL, params).all()
+            latencies.append(time.perf_counter() - query_started)
+        elapsed = time.perf_counter() - started
+    finally:
+        db.close()
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "queries_per_second": args.reads / elapsed,
+        "p50": quantiles[49] * 1000,
+        "p95": quantiles[94] * 1000,
+        "plan": plan
+    }
+
+
+def relation_sizes(layout: str) -> dict:
+    """Dimensiunea tabelului și a indecșilor, însumată peste partiții."""
+    with engine.connect() as conn:
+        row = conn.execute(text("""
+            SELECT
+                COALESCE(SUM(pg_table_size(relid)), 0),
+                COALESCE(SUM(pg_indexes_size(relid)), 0)
+            FROM pg_partition_tree(CAST(:relation AS regclass))
+        """), {"relation": f"{schema_name(layout)}.indicator_values"}).one()
+    return {"table_mb": row[0] / 2 ** 20, "indexes_mb": row[1] / 2 ** 20}
+
+
+def drop_layout(layout: str):
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {schema_name(layout)} CASCADE"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark structura indicator_values")
+    parser.add_argument("--indicators", type=int, default=40, help="Numărul de indicatori sintetici")
+    parser.add_argument("--counties", type=int, default=6, help="Numărul de județe")
+    parser.add_argument(
+        "--years",
+        default="2000-2024",
+        help="Intervalul de ani (ex: 2000-2024)"
+    )
+    parser.add_argument("--batch-size", type=int, default=5000, help="Rânduri per tranzacție de import")
+    parser.add_argument("--reads", type=int, default=2000, help="Citiri per variantă")
+    parser.add_argument("--read-span", type=int, default=10, help="Ani per citire")
+    parser.add_argument("--layouts", default="legacy,partitioned", help="Variantele testate")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--keep", action="store_true", help="Păstrează schemele temporare")
+    args = parser.parse_args()
+    args.start_year, args.end_year = (int(y) for y in args.years.split("-"))
+
+    frame = build_frame(args.indicators, args.counties, args.start_year, args.end_year, args.seed)
+    print(f"Rânduri: {len(frame)} ({args.indicators} indicatori, {args.counties} județe, {args.years})")
+
+    # Fără logarea SQL (DB_ECHO=true), care ar domina timpii
+    engine.echo = False
+
+    results = {}
+    for layout in args.layouts.split(","):
+        print(f"\n== {layout} ==")
+        create_layout(layout)
+        try:
+            insert = import_frame(layout, frame, args.batch_size)
+            update = import_frame(layout, frame, args.batch_size)
+            vacuum(layout)
+            reads = run_reads(layout, args)
+            sizes = relation_sizes(layout)
+        finally:
+            if not args.keep:
+                drop_layout(layout)
+
+        print("\n".join(reads["plan"]))
+        results[layout] = (insert, update, reads, sizes)
+
+    print(
+        f"\n{'layout':<12} {'insert r/s':>11} {'update r/s':>11} {'read q/s':>9} "
+        f"{'p50 ms':>7} {'p95 ms':>7} {'tabel MB':>9} {'index MB':>9}"
+    )
+    for layout, (insert, update, reads, sizes) in results.items():
+        print(
+            f"{layout:<12} {insert['rows_per_second']:>11.0f} {update['rows_per_second']:>11.0f} "
+            f"{reads['queries_per_second']:>9.1f} {reads['p50']:>7.2f} {reads['p95']:>7.2f} "
+            f"{sizes['table_mb']:>9.2f} {sizes['indexes_mb']:>9.2f}"
+        )
+
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Benchmark: serializarea răspunsului pentru /indicators/{code}/timeseries
+
+Măsoară drumul complet al răspunsului în FastAPI, fără baza de date:
+construirea corpului din rânduri, `serialize_response` (validarea față
+de response_model + conversia în JSON-able) acolo unde ruta întoarce
+modele, și randarea de clasa de răspuns. Compară:
+
+- `validat + json`: modele construite cu validare, JSONResponse
+  (varianta dinainte);
+- `validat + orjson`: doar clasa de răspuns schimbată;
+- `construct + orjson`: modele create cu model_construct (fără validare
+  la construire, dar în Python, deci nu mai rapid pe pydantic 2.5);
+- `direct + orjson`: `timeseries_content` + ORJSONResponse întors de rută
+  (varianta curentă, fără modele).
+
+Exemplu:
+    python scripts/benchmark_serialization.py --rows 2000 --repeat 50
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from collections import namedtuple
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.api.routes.indicators import IndicatorValueResponse, TimeSeriesResponse, timeseries_content
+from app.models.indicator import AggregationLevel, IndicatorDefinition, IndicatorUnit
+
+
+# Aceleași coloane ca rândurile din mv_indicator_data citite de rută
+Row = namedtuple("Row", ["year", "quarter", "value", "aggregation_level", "is_provisional", "county_code"])
+
+
+def build_rows(count: int, seed: int) -> list[Row]:
+    rng = random.Random(seed)
+    return [
+        Row(
+            year=2000 + i // 5,
+            quarter=None if i % 5 == 0 else i % 5,
+            value=rng.uniform(0, 1e6),
+            aggregation_level=AggregationLevel.COUNTY.value,
+            is_provisional=rng.choice((0, 1)),
+            county_code="TM"
+        )
+        for i in range(count)
+    ]
+
+
+INDICATOR = IndicatorDefinition(code="TOTAL_EMPLOYEES", name="Număr total angajați", unit=IndicatorUnit.NUMBER)
+
+
+def build_validated(rows: list[Row]) -> TimeSeriesResponse:
+    return TimeSeriesResponse(
+        indicator_code=INDICATOR.code,
+        indicator_name=INDICATOR.name,
+        unit=INDICATOR.unit.value,
+        data=[
+            IndicatorValueResponse(
+                year=r.year,
+                quarter=r.quarter,
+                value=r.value,
+                county_code=r.county_code,
+                aggregation_level=r.aggregation_level,
+                is_provisional=bool(r.is_provisional)
+            )
+            for r in rows
+        ]
+    )
+
+
+def build_constructed(rows: list[Row]) -> TimeSeriesResponse:
+    return TimeSeriesResponse.model_construct(
+        indicator_code=INDICATOR.code,
+        indicator_name=INDICATOR.name,
+        unit=INDICATOR.unit.value,
+        data=[
+            IndicatorValueResponse.model_construct(
+                year=r.year,
+                quarter=r.quarter,
+                value=r.value,
+                county_code=r.county_code,
+                aggregation_level=r.aggregation_level,
+                is_provisional=bool(r.is_provisional)
+            )
+            for r in rows
+        ]
+    )
+
+
+def build_direct(rows: list[Row]) -> ORJSONResponse:
+    return ORJSONResponse(timeseries_content(INDICATOR, rows))
+
+
+VARIANTS = {
+    "validat + json": (build_validated, JSONResponse),
+    "validat + orjson": (build_validated, ORJSONResponse),
+    "construct + orjson": (build_constructed, ORJSONResponse),
+    "direct + orjson": (build_direct, None)
+}
+
+
+async def render(field, build, response_class, rows: list[Row]) -> bytes:
+    """Pașii FastAPI pentru o rută async cu response_model."""
+    content = build(rows)
+    if response_class is None:
+        # Ruta a întors deja un Response: FastAPI îl trimite ca atare
+        return content.body
+    content = await serialize_response(field=field, response_content=content, is_coroutine=True)
+    return response_class(content).body
+
+
+def run_variant(field, build, response_class, rows: list[Row], repeat: int) -> dict:
+    loop = asyncio.new_event_loop()
+    try:
+        body = loop.run_until_complete(render(field, build, response_class, rows))
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            loop.run_until_complete(render(field, build, response_class, rows))
+            timings.append(time.perf_counter() - started)
+    finally:
+        loop.close()
+
+    median = statistics.median(timings)
+    return {"ms": median * 1000, "rows_per_second": len(rows) / median, "bytes": len(body)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark serializare răspunsuri")
+    parser.add_argument("--rows", type=int, default=2000, help="Rânduri în seria temporală")
+    parser.add_argument("--repeat", type=int, default=50, help="Repetări per variantă")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rows = build_rows(args.rows, args.seed)
+    field = create_response_field(name="Response_timeseries", type_=TimeSeriesResponse, mode="serialization")
+
+    results = {
+        name: run_variant(field, build, response_class, rows, args.repeat)
+        for name, (build, response_class) in VARIANTS.items()
+    }
+
+    baseline = results["validat + json"]["rows_per_second"]
+    print(f"Rânduri: {args.rows}, repetări: {args.repeat}\n")
+    print(f"{'variantă':<20} {'ms':>8} {'rânduri/s':>12} {'vs. inițial':>12} {'octeți':>9}")
+    for name, result in results.items():
+        print(
+            f"{name:<20} {result['ms']:>8.2f} {result['rows_per_second']:>12.0f} "
+            f"{result['rows_per_second'] / baseline:>11.2f}x {result['bytes']:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
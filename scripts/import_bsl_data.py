@@ -385,6 +385,15 @@ def main():
             INSERT INTO import_logs (source, source_identifier, records_imported, status)
             VALUES ('BSL', 'Regiunea Vest', :count, 'completed')
         """), {"count": imported})
+        # Reîmprospătează view-urile de raportare în aceeași tranzacție
+        try:
+            with conn.begin_nested():
+                for view in ("mv_indicator_data", "mv_kpi_summary", "mv_county_comparison"):
+                    conn.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view}"))
+        except Exception as e:
+            print(f"Eroare la refresh-ul view-urilor de raportare: {e}")
+        # Invalidează cache-ul partajat de răspunsuri API
+        conn.execute(text("DELETE FROM data_cache"))
         conn.commit()
 
     print("\nImport finalizat cu succes!")
@@ -4,6 +4,7 @@ API: https://ec.europa.eu/eurostat/web/main/data/database
 """
 
 import sys
+import time
 sys.path.insert(0, '/Users/sorinmaxim/Documents/Proiecte/Vestpolicylab.org/automotive-vest-analytics')
 
 import requests
@@ -12,8 +13,14 @@ from typing import Optional
 from datetime import datetime
 
 from app.database import SessionLocal, init_db
+from app.models.import_log import ImportLog
 from app.models.indicator import IndicatorDefinition, IndicatorValue, AggregationLevel
 from app.models.region import Region
+from app.services.cache import response_cache
+from app.services.data_import import DataImportService
+from app.services.indicator_registry import indicator_registry
+from app.services.normalize import normalize_values, melt_year_columns
+from app.services.reporting_views import refresh_reporting_views
 
 
 # Eurostat API Base URL
@@ -253,9 +260,7 @@ class EurostatDataImporter:
             return 0
 
         # Creează indicator dacă nu există
-        indicator = self.db.query(IndicatorDefinition).filter(
-            IndicatorDefinition.code == "GDP_REGIONAL"
-        ).first()
+        indicator = indicator_registry.get("GDP_REGIONAL")
 
         if not indicator:
             from app.models.indicator import IndicatorCategory, IndicatorUnit
@@ -268,6 +273,7 @@ class EurostatDataImporter:
             )
             self.db.add(indicator)
             self.db.commit()
+            indicator_registry.invalidate()
 
         return self._import_dataframe(df, "GDP_REGIONAL")
 
@@ -287,9 +293,7 @@ class EurostatDataImporter:
         }
 
         # Salvare în DB ca nivel UE
-        indicator = self.db.query(IndicatorDefinition).filter(
-            IndicatorDefinition.code == "PRODUCTIVITY"
-        ).first()
+        indicator = indicator_registry.get("PRODUCTIVITY")
 
         if not indicator:
             return 0
@@ -326,9 +330,7 @@ class EurostatDataImporter:
         """
         Import date R&D simulate pentru dezvoltare.
         """
-        indicator = self.db.query(IndicatorDefinition).filter(
-            IndicatorDefinition.code == "RD_EXPENDITURE"
-        ).first()
+        indicator = indicator_registry.get("RD_EXPENDITURE")
 
         if not indicator:
             return 0
@@ -371,51 +373,22 @@ class EurostatDataImporter:
         """
         Importă un DataFrame în baza de date.
         """
-        indicator = self.db.query(IndicatorDefinition).filter(
-            IndicatorDefinition.code == indicator_code
-        ).first()
+        indicator = indicator_registry.get(indicator_code)
 
         if not indicator:
             print(f"Indicator {indicator_code} not found")
             return 0
 
-        count = 0
-
-        # Găsește coloanele cu ani
-        year_columns = [col for col in df.columns if str(col).isdigit()]
-
-        for _, row in df.iterrows():
-            for year_col in year_columns:
-                try:
-                    year = int(year_col)
-                    value = row[year_col]
-
-                    if pd.isna(value):
-                        continue
-
-                    existing = self.db.query(IndicatorValue).filter(
-                        IndicatorValue.indicator_id == indicator.id,
-                        IndicatorValue.year == year,
-                        IndicatorValue.aggregation_level == AggregationLevel.REGION
-                    ).first()
-
-                    if existing:
-                        existing.value = float(value)
-                    else:
-                        new_value = IndicatorValue(
-                            indicator_id=indicator.id,
-                            year=year,
-                            value=float(value),
-                            aggregation_level=AggregationLevel.REGION
-                        )
-                        self.db.add(new_value)
-                    count += 1
-
-                except (ValueError, KeyError):
-                    continue
+        # Coloanele cu ani devin rânduri (an, valoare)
+        clean, rejects = normalize_values(
+            melt_year_columns(df),
+            indicator_id=indicator.id,
+            default_level=AggregationLevel.REGION
+        )
 
+        result = DataImportService(self.db).bulk_upsert(clean)
         self.db.commit()
-        return count
+        return result["inserted"] + result["updated"]
 
 
 def main():
@@ -426,6 +399,8 @@ def main():
     print("Eurostat Data Import - Automotive Vest Analytics")
     print("=" * 50)
 
+    started_at = time.perf_counter()
+
     # Inițializare DB
     init_db()
     db = SessionLocal()
@@ -444,6 +419,16 @@ def main():
         # Import PIB regional
         total += importer.import_regional_gdp(2010, 2023)
 
+        # Jurnalul importurilor dă și versiunea datelor folosită de cache-ul frontend-ului
+        db.add(ImportLog(
+            source="Eurostat",
+            records_imported=total,
+            duration_seconds=time.perf_counter() - started_at
+        ))
+        refresh_reporting_views(db)
+        db.commit()
+        response_cache.invalidate()
+
         print("=" * 50)
         print(f"Total records imported from Eurostat: {total}")
         print("=" * 50)
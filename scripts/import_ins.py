@@ -4,6 +4,7 @@ Tempo Online: http://statistici.insse.ro:8077/tempo-online/
 """
 
 import sys
+import time
 sys.path.insert(0, '/Users/sorinmaxim/Documents/Proiecte/Vestpolicylab.org/automotive-vest-analytics')
 
 import requests
@@ -12,8 +13,12 @@ from typing import Optional
 from datetime import datetime
 
 from app.database import SessionLocal, init_db
-from app.models.indicator import IndicatorDefinition, IndicatorValue, AggregationLevel
-from app.models.region import County
+from app.models.import_log import ImportLog
+from app.services.cache import response_cache
+from app.services.data_import import DataImportService
+from app.services.indicator_registry import indicator_registry
+from app.services.normalize import normalize_values
+from app.services.reporting_views import refresh_reporting_views
 
 
 # INS Tempo Online API Base URL
@@ -251,61 +256,26 @@ class INSDataImporter:
         """
         Importă un DataFrame în baza de date.
         """
-        indicator = self.db.query(IndicatorDefinition).filter(
-            IndicatorDefinition.code == indicator_code
-        ).first()
+        indicator = indicator_registry.get(indicator_code)
 
         if not indicator:
             print(f"Indicator {indicator_code} not found in database")
             return 0
 
-        count = 0
-
-        for _, row in df.iterrows():
-            try:
-                year = int(row[year_column])
-                value = float(row[value_column])
-
-                county_id = None
-                aggregation_level = AggregationLevel.REGION
-
-                if county_column and county_column in row:
-                    county_code = row[county_column]
-                    county = self.db.query(County).filter(
-                        County.code == county_code
-                    ).first()
-                    if county:
-                        county_id = county.id
-                        aggregation_level = AggregationLevel.COUNTY
-
-                # Upsert
-                existing = self.db.query(IndicatorValue).filter(
-                    IndicatorValue.indicator_id == indicator.id,
-                    IndicatorValue.year == year,
-                    IndicatorValue.county_id == county_id,
-                    IndicatorValue.aggregation_level == aggregation_level
-                ).first()
-
-                if existing:
-                    existing.value = value
-                else:
-                    new_value = IndicatorValue(
-                        indicator_id=indicator.id,
-                        year=year,
-                        value=value,
-                        county_id=county_id,
-                        aggregation_level=aggregation_level
-                    )
-                    self.db.add(new_value)
-
-                count += 1
+        clean, rejects = normalize_values(
+            df,
+            indicator_id=indicator.id,
+            year_column=year_column,
+            value_column=value_column,
+            county_column=county_column
+        )
 
-            except (ValueError, KeyError) as e:
-                print(f"Error processing row: {e}")
-                continue
+        if not rejects.empty:
+            print(f"Rejected {len(rejects)} rows: {rejects['reason'].value_counts().to_dict()}")
 
+        result = DataImportService(self.db).bulk_upsert(clean)
         self.db.commit()
-        return count
+        return result["inserted"] + result["updated"]
 
     def import_from_csv_file(
         self,
@@ -399,6 +369,8 @@ def main():
     print("INS Data Import - Automotive Vest Analytics")
     print("=" * 50)
 
+    started_at = time.perf_counter()
+
     # Inițializare DB
     init_db()
     db = SessionLocal()
@@ -429,6 +401,17 @@ def main():
             "TOTAL_TURNOVER"
         )
 
+        # Jurnalul importurilor dă și versiunea datelor folosită de cache-ul frontend-ului
+        db.add(ImportLog(
+            source="INS",
+            source_identifier="CSV",
+            records_imported=total,
+            duration_seconds=time.perf_counter() - started_at
+        ))
+        refresh_reporting_views(db)
+        db.commit()
+        response_cache.invalidate()
+
         print("=" * 50)
         print(f"Total records imported: {total}")
         print("=" * 50)
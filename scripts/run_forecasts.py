@@ -0,0 +1,59 @@
+"""
+Script pentru recalcularea prognozelor (toți indicatorii × județe)
+Rulat după importuri sau periodic (cron).
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+
+from app.database import SessionLocal, init_db
+from app.services.forecasting import ForecastingService, FORECAST_METHODS
+
+
+def main():
+    """
+    Main function pentru recalcularea prognozelor.
+    """
+    parser = argparse.ArgumentParser(description="Recalculează prognozele indicatorilor")
+    parser.add_argument("--indicators", help="Coduri de indicatori separate prin virgulă (implicit: toți)")
+    parser.add_argument("--methods", default=",".join(FORECAST_METHODS), help="Metode separate prin virgulă")
+    parser.add_argument("--workers", type=int, help="Număr de procese (implicit: FORECAST_WORKERS)")
+    args = parser.parse_args()
+
+    print("=" * 50)
+    print("Forecasting - Automotive Vest Analytics")
+    print("=" * 50)
+
+    init_db()
+    db = SessionLocal()
+
+    try:
+        options = {
+            "indicator_codes": args.indicators.split(",") if args.indicators else None,
+            "methods": tuple(args.methods.split(","))
+        }
+        if args.workers:
+            options["max_workers"] = args.workers
+
+        result = ForecastingService(db).run(**options)
+
+        if "error" in result:
+            print(f"Error during forecasting: {result['error']}")
+            sys.exit(1)
+
+        print("=" * 50)
+        print(
+            f"Series: {result['series']}, forecasts: {result['forecasts']}, "
+            f"failed: {result['failed']} ({result['duration_seconds']}s)"
+        )
+        print("=" * 50)
+    finally:
+        db.close()
+
+
+# Garda este obligatorie: workerii (spawn) reimportă modulul principal
+if __name__ == "__main__":
+    main()
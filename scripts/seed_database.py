@@ -12,6 +12,9 @@ from app.database import SessionLocal, init_db
 from app.models.region import Region, County
 from app.models.indicator import IndicatorDefinition, IndicatorCategory, IndicatorUnit
 from app.models.company import CompanySector
+from app.models.import_log import ImportLog
+from app.services.indicator_registry import indicator_registry
+from app.services.reporting_views import refresh_reporting_views
 
 
 def seed_regions(db: Session):
@@ -296,6 +299,7 @@ def seed_indicators(db: Session):
         db.add(indicator)
 
     db.commit()
+    indicator_registry.invalidate()
     print(f"Created {len(indicators_data)} indicator definitions")
 
 
@@ -311,9 +315,9 @@ def seed_sample_data(db: Session):
         return
 
     # Get indicator IDs
-    employees_ind = db.query(IndicatorDefinition).filter_by(code="TOTAL_EMPLOYEES").first()
-    turnover_ind = db.query(IndicatorDefinition).filter_by(code="TOTAL_TURNOVER").first()
-    companies_ind = db.query(IndicatorDefinition).filter_by(code="TOTAL_COMPANIES").first()
+    employees_ind = indicator_registry.get("TOTAL_EMPLOYEES")
+    turnover_ind = indicator_registry.get("TOTAL_TURNOVER")
+    companies_ind = indicator_registry.get("TOTAL_COMPANIES")
 
     # Get county IDs
     timis = db.query(County).filter_by(code="TM").first()
@@ -406,6 +410,12 @@ def seed_sample_data(db: Session):
             aggregation_level=level
         ))
 
+    db.add(ImportLog(
+        source="Seed",
+        source_identifier="sample_data",
+        records_imported=len(sample_employees) + len(sample_turnover) + len(sample_companies)
+    ))
+    refresh_reporting_views(db)
     db.commit()
     print("Sample data created successfully")
 
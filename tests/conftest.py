@@ -0,0 +1,178 @@
+"""
+Fixture-uri comune pentru teste.
+
+Testele care ating baza de date rulează pe TEST_DATABASE_URL, o bază
+PostgreSQL 15+ dedicată: schema `public` e recreată la începutul rulării,
+migrată cu Alembic la head și populată cu un set mic de date. Fără
+variabilă, aceste teste sunt sărite; restul nu au nevoie de bază.
+"""
+
+import os
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+# Setările sunt citite la importul app.config, deci mediul se fixează
+# înaintea oricărui import din app
+if TEST_DATABASE_URL:
+    os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+    os.environ.pop("ASYNC_DATABASE_URL", None)
+os.environ["CACHE_ENABLED"] = "false"
+
+import httpx
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+
+ALEMBIC_INI = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "app", "database", "migrations", "alembic.ini"
+)
+
+# Seriile anuale regionale din setul de test
+REGIONAL_VALUES = {
+    "TOTAL_EMPLOYEES": {2019: 100, 2020: 110, 2021: 120, 2022: 130, 2023: 140},
+    "TOTAL_TURNOVER": {2019: 10, 2020: 12, 2021: 14, 2022: 16, 2023: 18},
+    "RD_EXPENDITURE": {2019: 5, 2020: 4, 2022: 3, 2023: 2},  # fără 2021
+    "INDUSTRIAL_OUTPUT": {2019: 50, 2020: 40, 2021: 30, 2022: 20, 2023: 10},  # are și trimestre
+}
+
+# (an, trimestru) -> valoare, nivel regional
+QUARTERLY_VALUES = {
+    "INDUSTRIAL_OUTPUT": {
+        (2022, 1): 1, (2022, 2): 2, (2022, 3): 3, (2022, 4): 4,
+        (2023, 1): 5, (2023, 2): 6, (2023, 3): 7, (2023, 4): 8,
+        (2024, 1): 9,  # fără valoare anuală în 2024
+    },
+}
+
+# (cod județ, an) -> valoare, nivel județ
+COUNTY_VALUES = {
+    "TOTAL_EMPLOYEES": {("TM", 2022): 75, ("TM", 2023): 80, ("AR", 2022): 55, ("AR", 2023): 60},
+}
+
+
+def _seed(db):
+    from app.models.indicator import (
+        IndicatorDefinition, IndicatorValue, IndicatorCategory, IndicatorUnit, AggregationLevel
+    )
+    from app.models.region import Region, County
+
+    region = Region(name="Vest", code="RO42")
+    db.add(region)
+    db.flush()
+
+    counties = {
+        code: County(name=name, code=code, region_id=region.id)
+        for code, name in [("TM", "Timiș"), ("AR", "Arad")]
+    }
+    db.add_all(counties.values())
+
+    definitions = {
+        code: IndicatorDefinition(code=code, name=name, category=category, unit=unit)
+        for code, name, category, unit in [
+            ("TOTAL_EMPLOYEES", "Număr angajați", IndicatorCategory.LABOR_MARKET, IndicatorUnit.NUMBER),
+            ("TOTAL_TURNOVER", "Cifră de afaceri", IndicatorCategory.PERFORMANCE, IndicatorUnit.EURO),
+            ("RD_EXPENDITURE", "Cheltuieli R&D", IndicatorCategory.INNOVATION, IndicatorUnit.EURO),
+            ("INDUSTRIAL_OUTPUT", "Producție industrială", IndicatorCategory.PERFORMANCE, IndicatorUnit.INDEX),
+        ]
+    }
+    db.add_all(definitions.values())
+    db.flush()
+
+    values = []
+    for code, series in REGIONAL_VALUES.items():
+        values += [
+            IndicatorValue(indicator_id=definitions[code].id, year=year, value=value,
+                           aggregation_level=AggregationLevel.REGION)
+            for year, value in series.items()
+        ]
+    for code, series in QUARTERLY_VALUES.items():
+        values += [
+            IndicatorValue(indicator_id=definitions[code].id, year=year, quarter=quarter, value=value,
+                           aggregation_level=AggregationLevel.REGION)
+            for (year, quarter), value in series.items()
+        ]
+    for code, series in COUNTY_VALUES.items():
+        values += [
+            IndicatorValue(indicator_id=definitions[code].id, county_id=counties[county].id,
+                           year=year, value=value, aggregation_level=AggregationLevel.COUNTY)
+            for (county, year), value in series.items()
+        ]
+    db.add_all(values)
+    db.flush()
+
+    from app.services.reporting_views import REPORTING_VIEWS
+    for view in REPORTING_VIEWS:
+        db.execute(text(f"REFRESH MATERIALIZED VIEW {view}"))
+    db.commit()
+
+
+@pytest.fixture(scope="session")
+def database():
+    """Baza de test migrată și populată; sare testul fără TEST_DATABASE_URL."""
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL nu este setat")
+
+    from alembic import command
+    from alembic.config import Config
+    from app.database import engine, SessionLocal
+    from app.services.indicator_registry import indicator_registry
+    from app.services.normalize import county_table
+
+    with engine.begin() as connection:
+        connection.execute(text("DROP SCHEMA public CASCADE"))
+        connection.execute(text("CREATE SCHEMA public"))
+
+    config = Config(ALEMBIC_INI)
+    config.attributes["configure_logger"] = False
+    command.upgrade(config, "head")
+
+    db = SessionLocal()
+    try:
+        _seed(db)
+    finally:
+        db.close()
+
+    indicator_registry.invalidate()
+    county_table.invalidate()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(database):
+    """Sesiune sync; modificările nepersistate sunt anulate după test."""
+    from app.database import SessionLocal
+
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.close()
+
+
+@pytest_asyncio.fixture
+async def async_db(database):
+    """
+    Sesiune async pe event loop-ul testului. Pool-ul asyncpg e golit după
+    test: conexiunile sunt legate de loop-ul care le-a deschis.
+    """
+    from app.database import AsyncSessionLocal, async_engine
+
+    async with AsyncSessionLocal() as session:
+        # Conexiunea și inițializarea dialectului, înaintea query-urilor numărate
+        await session.execute(text("SELECT 1"))
+        yield session
+    await async_engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def client(database):
+    """Client HTTP pe aplicația ASGI, fără server și fără lifespan."""
+    from app.database import async_engine
+    from app.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+        yield http
+    await async_engine.dispose()
@@ -0,0 +1,91 @@
+"""
+Teste pentru matricea de corelație (AnalyticsService.correlation_matrix)
+"""
+
+import math
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from app.services.analytics import AnalyticsService, _pairwise_pearson, _correlation_p_values
+
+
+def test_pairwise_pearson_matches_scipy():
+    rng = np.random.default_rng(7)
+    values = rng.normal(size=(12, 4))
+    values[:, 1] += values[:, 0]
+    values[[2, 5, 9], 0] = np.nan
+    values[[5, 6], 2] = np.nan
+    values[[0, 1, 2, 3, 4, 5, 6, 7, 8, 9], 3] = np.nan  # doar două observații
+
+    a = np.broadcast_to(values[:, :, None], (values.shape[0], 4, 4))
+    r, n = _pairwise_pearson(a, a.transpose(0, 2, 1))
+    p = _correlation_p_values(r, n)
+
+    for i in range(3):
+        for j in range(3):
+            both = ~np.isnan(values[:, i]) & ~np.isnan(values[:, j])
+            assert n[i, j] == both.sum()
+            if i == j:
+                assert r[i, j] == pytest.approx(1.0)
+                continue
+            expected = stats.pearsonr(values[both, i], values[both, j])
+            assert r[i, j] == pytest.approx(expected[0])
+            assert p[i, j] == pytest.approx(expected[1])
+
+    # Sub trei observații comune coeficientul nu e definit
+    assert np.isnan(r[3, :3]).all()
+
+
+def test_correlation_matrix(db):
+    result = AnalyticsService(db).correlation_matrix(
+        ["TOTAL_EMPLOYEES", "TOTAL_TURNOVER", "RD_EXPENDITURE", "NOPE"],
+        start_year=2019,
+        end_year=2023
+    )
+
+    assert result["indicators"] == ["TOTAL_EMPLOYEES", "TOTAL_TURNOVER", "RD_EXPENDITURE"]
+    assert result["missing_indicators"] == ["NOPE"]
+    assert result["years"] == [2019, 2020, 2021, 2022, 2023]
+
+    # Serii perfect liniare
+    assert result["matrix"][0][1] == 1.0
+    assert result["p_values"][0][1] == 0.0
+    assert result["n_observations"][0][1] == 5
+
+    # RD_EXPENDITURE nu are 2021: perechea folosește doar anii comuni
+    assert result["n_observations"][0][2] == 4
+    assert result["matrix"][0][2] == round(-70 / math.sqrt(1000 * 5), 4)
+    assert result["matrix"] == [list(row) for row in zip(*result["matrix"])]
+
+
+def test_correlation_matrix_uses_annual_values(db):
+    # INDUSTRIAL_OUTPUT are și valori trimestriale în 2022-2023; mediate cu
+    # cele anuale, seria nu ar mai fi perfect (invers) liniară
+    result = AnalyticsService(db).correlation_matrix(
+        ["TOTAL_EMPLOYEES", "INDUSTRIAL_OUTPUT"],
+        start_year=2019,
+        end_year=2023
+    )
+
+    assert result["matrix"][0][1] == -1.0
+    assert result["n_observations"][0][1] == 5
+
+
+def test_spearman_correlation_matrix(db):
+    result = AnalyticsService(db).correlation_matrix(
+        ["TOTAL_EMPLOYEES", "RD_EXPENDITURE"],
+        start_year=2019,
+        end_year=2023,
+        method="spearman"
+    )
+
+    assert result["matrix"] == [[1.0, -1.0], [-1.0, 1.0]]
+    assert result["n_observations"] == [[5, 4], [4, 4]]
+
+
+def test_correlation_matrix_needs_two_known_indicators(db):
+    result = AnalyticsService(db).correlation_matrix(["TOTAL_EMPLOYEES", "NOPE"])
+
+    assert "error" in result
@@ -0,0 +1,66 @@
+"""
+Teste pentru încărcarea în bloc a valorilor (DataImportService.bulk_upsert)
+"""
+
+import pandas as pd
+import pytest
+
+from app.models.indicator import IndicatorValue, AggregationLevel
+from app.models.region import County
+from app.services.data_import import DataImportService
+from app.services.indicator_registry import indicator_registry
+from tests.conftest import REGIONAL_VALUES
+
+
+def _regional_values(db, indicator_id: int) -> dict:
+    return dict(db.query(IndicatorValue.year, IndicatorValue.value).filter(
+        IndicatorValue.indicator_id == indicator_id,
+        IndicatorValue.aggregation_level == AggregationLevel.REGION,
+        IndicatorValue.county_id.is_(None),
+        IndicatorValue.quarter.is_(None)
+    ).all())
+
+
+def test_bulk_upsert_inserts_updates_and_rejects(db):
+    indicator_id = indicator_registry.get("TOTAL_EMPLOYEES").id
+    tm = db.query(County.id).filter(County.code == "TM").scalar()
+
+    df = pd.DataFrame([
+        {"indicator_id": indicator_id, "year": 2015, "value": 90, "aggregation_level": "regiune"},
+        {"indicator_id": indicator_id, "year": 2016, "value": 95, "aggregation_level": AggregationLevel.REGION},
+        # Aceeași cheie de două ori în lot: câștigă ultimul rând
+        {"indicator_id": indicator_id, "year": 2015, "value": 91, "aggregation_level": "regiune"},
+        # Rânduri existente; cel regional are county_id și quarter NULL
+        {"indicator_id": indicator_id, "year": 2023, "value": 150, "aggregation_level": "regiune"},
+        {"indicator_id": indicator_id, "county_id": tm, "year": 2023, "value": 85, "aggregation_level": "judet"},
+        # Respinse: fără valoare, nivel de agregare necunoscut
+        {"indicator_id": indicator_id, "year": 2017, "value": None, "aggregation_level": "regiune"},
+        {"indicator_id": indicator_id, "year": 2017, "value": 1, "aggregation_level": "oras"},
+    ])
+    service = DataImportService(db)
+
+    result = service.bulk_upsert(df)
+
+    assert result == {"inserted": 2, "updated": 2, "rejected": 2, "duplicates": 1}
+    stored = _regional_values(db, indicator_id)
+    assert stored[2015] == 91
+    assert stored[2016] == 95
+    assert stored[2023] == 150
+    assert len(stored) == len(REGIONAL_VALUES["TOTAL_EMPLOYEES"]) + 2
+
+    # Același lot încă o dată: toate cheile există deja, nimic nu e duplicat în tabel
+    again = service.bulk_upsert(df)
+
+    assert again == {"inserted": 0, "updated": 4, "rejected": 2, "duplicates": 1}
+    assert len(_regional_values(db, indicator_id)) == len(stored)
+
+
+@pytest.mark.parametrize("df", [
+    pd.DataFrame(),
+    pd.DataFrame([{"indicator_id": 1, "year": None, "value": 1, "aggregation_level": "regiune"}]),
+])
+def test_bulk_upsert_without_valid_rows_skips_database(df):
+    # Fără sesiune: un lot fără rânduri valide nu ajunge la baza de date
+    result = DataImportService(db=None).bulk_upsert(df)
+
+    assert result == {"inserted": 0, "updated": 0, "rejected": len(df), "duplicates": 0}
@@ -0,0 +1,108 @@
+"""
+Teste pentru registrul de indicatori (app/services/indicator_registry.py)
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.models.indicator import IndicatorDefinition, IndicatorCategory, IndicatorUnit
+from app.services.indicator_registry import IndicatorRegistry, indicator_registry
+
+
+class _SlowSession:
+    """Sesiune care numără încărcările și le face lente, ca să se suprapună."""
+
+    def __init__(self, loads: list):
+        self.loads = loads
+
+    def query(self, model):
+        return self
+
+    def all(self):
+        self.loads.append(threading.current_thread())
+        time.sleep(0.2)
+        return [IndicatorDefinition(
+            id=1, code="TOTAL_EMPLOYEES", name="Număr angajați",
+            category=IndicatorCategory.LABOR_MARKET, unit=IndicatorUnit.NUMBER
+        )]
+
+    def expunge_all(self):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def loads():
+    return []
+
+
+@pytest.fixture
+def registry(loads):
+    return IndicatorRegistry(session_factory=lambda: _SlowSession(loads), ttl_seconds=60)
+
+
+def test_concurrent_reads_share_one_reload(registry, loads):
+    threads = [threading.Thread(target=registry.get, args=("TOTAL_EMPLOYEES",)) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(loads) == 1
+    assert registry.get("TOTAL_EMPLOYEES").id == 1
+
+
+@pytest.mark.asyncio
+async def test_async_reload_runs_off_the_event_loop(registry, loads):
+    await asyncio.gather(*(registry.ensure_loaded_async() for _ in range(5)))
+
+    # O singură încărcare, în alt thread decât cel al event loop-ului
+    assert len(loads) == 1
+    assert loads[0] is not threading.current_thread()
+
+    # Catalog proaspăt: nicio reîncărcare nouă
+    await registry.ensure_loaded_async()
+    assert len(loads) == 1
+
+
+def test_invalidate_forces_reload(registry, loads):
+    registry.all()
+    registry.invalidate()
+    registry.all()
+
+    assert len(loads) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method, path, body", [
+    ("GET", "/api/v1/indicators/", None),
+    ("POST", "/api/v1/indicators/query", {"indicator_codes": ["TOTAL_EMPLOYEES"]}),
+    ("GET", "/api/v1/indicators/TOTAL_EMPLOYEES", None),
+    ("GET", "/api/v1/indicators/TOTAL_EMPLOYEES/timeseries", None),
+    ("GET", "/api/v1/indicators/TOTAL_EMPLOYEES/compare", None),
+    ("GET", "/api/v1/indicators/kpi/summary", None),
+    ("GET", "/api/v1/reports/summary/2023", None),
+])
+async def test_async_routes_reload_registry_off_the_event_loop(client, monkeypatch, method, path, body):
+    """Rutele async care citesc registrul expirat nu îl reîncarcă pe thread-ul event loop-ului."""
+    loop_thread = threading.current_thread()
+    load = indicator_registry.load
+    threads = []
+
+    def recording_load():
+        threads.append(threading.current_thread())
+        return load()
+
+    monkeypatch.setattr(indicator_registry, "load", recording_load)
+    indicator_registry.invalidate()
+
+    response = await client.request(method, path, json=body)
+
+    assert response.status_code == 200
+    assert len(threads) == 1
+    assert threads[0] is not loop_thread
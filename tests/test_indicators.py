@@ -0,0 +1,133 @@
+"""
+Teste pentru endpoint-urile de indicatori (app/api/routes/indicators.py)
+"""
+
+import orjson
+import pytest
+
+from app.database.instrumentation import QueryStats, current_query_stats
+from app.models.indicator import AggregationLevel
+from app.services.indicator_registry import indicator_registry
+from tests.conftest import REGIONAL_VALUES, COUNTY_VALUES
+
+API = "/api/v1/indicators"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("level, county_code, expected", [
+    (AggregationLevel.REGION, None, [(year, None) for year in REGIONAL_VALUES["TOTAL_EMPLOYEES"]]),
+    (AggregationLevel.COUNTY, None, sorted((year, county) for county, year in COUNTY_VALUES["TOTAL_EMPLOYEES"])),
+    (AggregationLevel.COUNTY, "TM", [(2022, "TM"), (2023, "TM")]),
+])
+async def test_timeseries_is_one_query(async_db, level, county_code, expected):
+    """Seria, inclusiv codurile județelor, vine dintr-un singur statement."""
+    from app.api.routes.indicators import get_indicator_timeseries
+
+    await indicator_registry.ensure_loaded_async()
+
+    stats = QueryStats()
+    token = current_query_stats.set(stats)
+    try:
+        response = await get_indicator_timeseries(
+            "TOTAL_EMPLOYEES",
+            county_code=county_code,
+            aggregation_level=level,
+            start_year=2010,
+            end_year=2024,
+            db=async_db
+        )
+    finally:
+        current_query_stats.reset(token)
+
+    assert stats.count == 1
+
+    body = orjson.loads(response.body)
+    assert body["indicator_code"] == "TOTAL_EMPLOYEES"
+    assert sorted((p["year"], p["county_code"]) for p in body["data"]) == expected
+    assert {p["aggregation_level"] for p in body["data"]} == {level.value}
+
+
+@pytest.mark.asyncio
+async def test_timeseries_query_count_header(client):
+    await indicator_registry.ensure_loaded_async()
+
+    response = await client.get(f"{API}/TOTAL_EMPLOYEES/timeseries", params={"aggregation_level": "judet"})
+
+    assert response.status_code == 200
+    assert response.headers["X-DB-Query-Count"] == "1"
+    assert len(response.json()["data"]) == len(COUNTY_VALUES["TOTAL_EMPLOYEES"])
+
+
+@pytest.mark.asyncio
+async def test_timeseries_unknown_indicator(client):
+    await indicator_registry.ensure_loaded_async()
+
+    response = await client.get(f"{API}/NOPE/timeseries")
+
+    assert response.status_code == 404
+    assert response.headers["X-DB-Query-Count"] == "0"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("quarterly, expected", [
+    (True, [(2022, 3, 3), (2022, 4, 4), (2023, 1, 5), (2023, 2, 6)]),
+    (None, [(2022, 3, 3), (2022, 4, 4), (2022, None, 20), (2023, 1, 5), (2023, 2, 6), (2023, None, 10)]),
+    (False, [(2022, None, 20), (2023, None, 10)]),
+])
+async def test_query_quarter_range(client, quarterly, expected):
+    """2022 T3 - 2023 T2: capetele intervalului se aplică pe (an, trimestru)."""
+    await indicator_registry.ensure_loaded_async()
+
+    response = await client.post(f"{API}/query", json={
+        "indicator_codes": ["INDUSTRIAL_OUTPUT"],
+        "start_year": 2022,
+        "start_quarter": 3,
+        "end_year": 2023,
+        "end_quarter": 2,
+        "quarterly": quarterly
+    })
+
+    assert response.status_code == 200
+    assert response.headers["X-DB-Query-Count"] == "1"
+
+    body = response.json()
+    columns = body["columns"]
+    assert body["row_count"] == len(expected)
+    assert list(zip(columns["year"], columns["quarter"], columns["value"])) == expected
+    assert set(columns["indicator_code"]) == {"INDUSTRIAL_OUTPUT"}
+
+
+@pytest.mark.asyncio
+async def test_query_counties_and_missing_codes(client):
+    await indicator_registry.ensure_loaded_async()
+
+    response = await client.post(f"{API}/query", json={
+        "indicator_codes": ["TOTAL_EMPLOYEES", "NOPE"],
+        "county_codes": ["TM"],
+        "aggregation_levels": ["judet"],
+        "start_year": 2023,
+        "end_year": 2023
+    })
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["missing_indicators"] == ["NOPE"]
+    assert list(body["indicators"]) == ["TOTAL_EMPLOYEES"]
+    assert body["row_count"] == 1
+    assert body["columns"]["county_code"] == ["TM"]
+    assert body["columns"]["aggregation_level"] == ["judet"]
+    assert body["columns"]["value"] == [COUNTY_VALUES["TOTAL_EMPLOYEES"][("TM", 2023)]]
+
+
+@pytest.mark.asyncio
+async def test_query_only_unknown_codes(client):
+    await indicator_registry.ensure_loaded_async()
+
+    response = await client.post(f"{API}/query", json={"indicator_codes": ["NOPE"]})
+
+    assert response.status_code == 200
+    assert response.headers["X-DB-Query-Count"] == "0"
+    body = response.json()
+    assert body["row_count"] == 0
+    assert body["missing_indicators"] == ["NOPE"]
+    assert all(values == [] for values in body["columns"].values())
@@ -0,0 +1,72 @@
+"""
+Teste pentru KPIService (app/services/kpi.py)
+"""
+
+import pytest
+
+from app.database.instrumentation import QueryStats, current_query_stats
+from app.models.indicator import AggregationLevel
+from app.services.indicator_registry import indicator_registry
+from app.services.kpi import KPIService
+
+
+def _get_kpis(db, codes, year, **kwargs):
+    """get_kpis cu registrul deja încărcat; întoarce (kpis, număr query-uri)."""
+    indicator_registry.all()
+
+    stats = QueryStats()
+    token = current_query_stats.set(stats)
+    try:
+        kpis = KPIService(db).get_kpis(codes, year, **kwargs)
+    finally:
+        current_query_stats.reset(token)
+    return kpis, stats.count
+
+
+def test_summary_kpis_in_one_query(db):
+    kpis, queries = _get_kpis(db, ["TOTAL_TURNOVER", "NOPE", "TOTAL_EMPLOYEES"], 2023)
+
+    assert queries == 1
+    # Ordinea cerută e păstrată, codurile necunoscute sunt omise
+    assert list(kpis) == ["TOTAL_TURNOVER", "TOTAL_EMPLOYEES"]
+    assert kpis["TOTAL_EMPLOYEES"]["value"] == 140
+    assert kpis["TOTAL_EMPLOYEES"]["prev_value"] == 130
+    assert kpis["TOTAL_EMPLOYEES"]["change_pct"] == 7.69
+    assert kpis["TOTAL_TURNOVER"]["change_pct"] == 12.5
+    assert kpis["TOTAL_TURNOVER"]["unit"] == "euro"
+
+
+@pytest.mark.parametrize("year, expected", [
+    (2023, {"value": 2, "prev_value": 3, "change_pct": -33.33}),
+    # RD_EXPENDITURE nu are valoare în 2021
+    (2021, {"value": None, "prev_value": 4, "change_pct": None}),
+    (2022, {"value": 3, "prev_value": None, "change_pct": None}),
+])
+def test_grouped_kpis(db, year, expected):
+    kpis, queries = _get_kpis(db, ["RD_EXPENDITURE"], year)
+
+    assert queries == 1
+    assert {key: kpis["RD_EXPENDITURE"][key] for key in expected} == expected
+
+
+@pytest.mark.parametrize("year, expected", [
+    (2023, {"value": 10, "prev_value": 20, "change_pct": -50.0}),
+    # În 2024 există doar T1: nu e o valoare anuală
+    (2024, {"value": None, "prev_value": 10, "change_pct": None}),
+])
+def test_grouped_kpis_ignore_quarterly_values(db, year, expected):
+    kpis, _ = _get_kpis(db, ["INDUSTRIAL_OUTPUT"], year)
+
+    assert {key: kpis["INDUSTRIAL_OUTPUT"][key] for key in expected} == expected
+
+
+def test_county_level_is_rejected():
+    with pytest.raises(ValueError):
+        KPIService(db=None).get_kpis(["TOTAL_EMPLOYEES"], 2023, aggregation_level=AggregationLevel.COUNTY)
+
+
+def test_unknown_codes_skip_database(db):
+    kpis, queries = _get_kpis(db, ["NOPE"], 2023)
+
+    assert kpis == {}
+    assert queries == 0
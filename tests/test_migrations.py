@@ -0,0 +1,21 @@
+"""
+Teste pentru revizia schemei (migrări Alembic și database_schema.sql)
+"""
+
+import os
+
+from app.database.connection import schema_head, check_schema_revision
+
+SCHEMA_SQL = os.path.join(os.path.dirname(os.path.dirname(__file__)), "database_schema.sql")
+
+
+def test_schema_sql_is_stamped_at_head():
+    # O bază creată din database_schema.sql trebuie să treacă verificarea de la pornire
+    with open(SCHEMA_SQL, encoding="utf-8") as f:
+        schema = f.read()
+
+    assert f"INSERT INTO alembic_version (version_num) VALUES ('{schema_head()}');" in schema
+
+
+def test_migrated_database_passes_revision_check(database):
+    check_schema_revision()
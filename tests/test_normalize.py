@@ -0,0 +1,78 @@
+"""
+Teste pentru normalizarea vectorizată (app/services/normalize.py)
+"""
+
+import pandas as pd
+import pytest
+
+from app.services.normalize import CountyTable, NORMALIZED_COLUMNS, melt_year_columns, normalize_values
+
+
+class _CountySession:
+    """Sesiune minimă pentru CountyTable.load(): întoarce codurile date."""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def query(self, *columns):
+        return self
+
+    def all(self):
+        return self.rows
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def counties():
+    return CountyTable(session_factory=lambda: _CountySession([("TM", 1), ("AR", 2)]))
+
+
+def test_normalize_values(counties):
+    df = pd.DataFrame({
+        "an": ["2020", 2021, "2022.5", "x", 2023, 2024, 2025],
+        "valoare": ["1.5", 2, 3, 4, None, "6", 7],
+        "judet": [" tm", "", "AR", "TM", "AR", "ZZ", None],
+    })
+
+    clean, rejects = normalize_values(
+        df, indicator_id=7, year_column="an", value_column="valoare",
+        county_column="judet", counties=counties
+    )
+
+    assert list(clean.columns) == NORMALIZED_COLUMNS
+    assert clean["year"].tolist() == [2020, 2021, 2025]
+    assert clean["value"].tolist() == [1.5, 2.0, 7.0]
+    assert clean["county_id"].tolist() == [1, pd.NA, pd.NA]
+    assert clean["aggregation_level"].tolist() == ["judet", "regiune", "regiune"]
+    assert clean["indicator_id"].tolist() == [7, 7, 7]
+    assert clean["quarter"].isna().all()
+
+    assert rejects["reason"].tolist() == ["invalid year", "invalid year", "invalid value", "unknown county"]
+    assert rejects["an"].tolist() == ["2022.5", "x", 2023, 2024]
+
+
+def test_normalize_values_without_county_column(counties):
+    df = pd.DataFrame({"year": [2020, 2021], "value": [1, 2]})
+
+    clean, rejects = normalize_values(df, indicator_id=1, counties=counties)
+
+    assert clean["aggregation_level"].tolist() == ["regiune", "regiune"]
+    assert clean["county_id"].isna().all()
+    assert rejects.empty
+
+
+def test_normalize_empty_frame():
+    clean, rejects = normalize_values(pd.DataFrame(), indicator_id=1)
+
+    assert clean.empty and list(clean.columns) == NORMALIZED_COLUMNS
+    assert rejects.empty
+
+
+def test_melt_year_columns():
+    df = pd.DataFrame({"geo": ["RO42"], "2020": [1.0], "2021": [2.0]})
+
+    long = melt_year_columns(df)
+
+    assert long[["geo", "year", "value"]].values.tolist() == [["RO42", "2020", 1.0], ["RO42", "2021", 2.0]]